@@ -0,0 +1,80 @@
+"""
+Peak-memory check for the streaming month-end ingest on synthetic data.
+
+Ingests a synthetic universe (default 2,000 tickers x 25 years) with
+``StreamingMonthlyIngest`` under ``tracemalloc`` and fails (exit code 1)
+if the traced peak exceeds ``--max-mb``. With ``--check N`` the first N
+tickers are also resampled in memory and compared with the on-disk panel.
+The same bound is asserted on a small universe in
+``tests/test_streaming_ingest.py``; this script is for full-size runs.
+
+    poetry run python benchmarks/bench_ingest.py
+    poetry run python benchmarks/bench_ingest.py --tickers 5000 --max-mb 64 --check 200
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.data.resampler import MonthlyResampler
+from momentum_engine.data.streaming_ingest import StreamingMonthlyIngest
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+
+
+END_DATE = "2025-12-31"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=25)
+    parser.add_argument("--max-mb", type=float, default=32.0, help="Memory budget (and asserted peak).")
+    parser.add_argument("--check", type=int, default=100, help="Tickers compared with the in-memory path.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    fetcher = SyntheticPriceFetcher(end_date=END_DATE, seed=args.seed)
+    tickers = [f"SYN{i:05d}.NS" for i in range(args.tickers)]
+    start_date = (pd.Timestamp(END_DATE) - pd.DateOffset(years=args.years)).strftime("%Y-%m-%d")
+    max_bytes = int(args.max_mb * 1024**2)
+
+    full_daily_mb = np.busday_count(start_date, END_DATE) * args.tickers * 8 / 1024**2
+
+    with tempfile.TemporaryDirectory() as workdir:
+        ingest = StreamingMonthlyIngest(fetcher, workdir, max_bytes=max_bytes)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        panel = ingest.run(tickers, start_date, END_DATE)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"universe: {args.tickers} tickers x {args.years} years "
+              f"(full daily panel ~{full_daily_mb:,.0f} MB)")
+        print(f"ingest:   {elapsed:.2f}s, {len(fetcher.calls)} chunks, panel {panel.shape}")
+        print(f"peak:     {peak / 1024**2:.1f} MB traced (budget {args.max_mb:g} MB)")
+
+        failed = peak > max_bytes
+
+        if args.check:
+            sample = tickers[:args.check]
+            expected = MonthlyResampler.to_monthly(fetcher.fetch(sample, start_date))
+            actual = panel.columns(sample).to_frame()
+            matches = expected.index.equals(actual.index) and np.array_equal(
+                expected.to_numpy(), actual.to_numpy(), equal_nan=True
+            )
+            failed |= not matches
+            print(f"check:    {len(sample)} tickers vs in-memory resample {'ok' if matches else 'MISMATCH'}")
+
+    print("FAIL" if failed else "ok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Peak memory and view/copy check for PricePanel against the DataFrame path.
+
+Builds a synthetic daily panel (default 2,000 tickers x 25 years) and runs
+the same operations on a ``pd.DataFrame`` and on a ``PricePanel``, each
+under ``tracemalloc``. For every operation it reports the traced peak and
+whether the result shares memory with the source (``np.shares_memory``)
+or is a copy, then the copy count per path. Exits with code 1 if a panel
+operation that should be a view copies, or if a saved panel does not load
+back memory-mapped. The view and memmap guarantees are also covered by
+``tests/test_price_panel.py``.
+
+    poetry run python benchmarks/bench_panel.py
+    poetry run python benchmarks/bench_panel.py --tickers 500 --years 10
+"""
+
+import argparse
+import sys
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.data.price_panel import PricePanel
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.signals.momentum_12_1 import Momentum12_1
+
+
+END_DATE = "2025-12-31"
+
+
+def traced(function) -> tuple[object, float]:
+    """
+    ``function()`` and its traced peak in MB.
+    """
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak / 1024**2
+
+
+def values_of(result) -> np.ndarray:
+    if isinstance(result, PricePanel):
+        return result.values
+    if isinstance(result, np.ndarray):
+        return result
+    return result.to_numpy()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tickers = [f"SYN{i:05d}.NS" for i in range(args.tickers)]
+    start_date = (pd.Timestamp(END_DATE) - pd.DateOffset(years=args.years)).strftime("%Y-%m-%d")
+    frame = SyntheticPriceFetcher(end_date=END_DATE, seed=args.seed).fetch(tickers, start_date)
+    panel = PricePanel.from_frame(frame)
+
+    window = (frame.index[len(frame) // 2], frame.index[-1])
+    subset = tickers[len(tickers) // 4:len(tickers) // 2]
+    scattered = tickers[::7]
+
+    # (name, DataFrame operation, PricePanel operation, what the panel must
+    # return: "view", "copy" allowed, or None for a computed result that is
+    # only measured for peak memory)
+    operations = [
+        ("date window", lambda: frame.loc[window[0]:window[1]], lambda: panel.window(*window), "view"),
+        ("ticker range", lambda: frame[subset], lambda: panel.columns(subset), "view"),
+        ("scattered tickers", lambda: frame[scattered], lambda: panel.columns(scattered), "copy"),
+        ("single column", lambda: frame[tickers[1]], lambda: panel.column(tickers[1]), "view"),
+        ("first 1,000 rows", lambda: frame.iloc[:1000], lambda: panel.rows(0, 1000), "view"),
+        ("latest 12-1 row", lambda: Momentum12_1().compute(frame), lambda: Momentum12_1().compute(panel), None),
+    ]
+    slices = sum(expected is not None for *_, expected in operations)
+
+    print(f"panel: {panel.shape[0]:,} days x {panel.shape[1]:,} tickers "
+          f"({panel.nbytes / 1024**2:,.0f} MB)")
+    print(f"{'operation':<20}{'DataFrame':>22}{'PricePanel':>22}")
+
+    source = {"DataFrame": frame.to_numpy(), "PricePanel": panel.values}
+    copies = {"DataFrame": 0, "PricePanel": 0}
+    failed = False
+
+    for name, frame_op, panel_op, expected in operations:
+        cells = []
+        for path, operation in (("DataFrame", frame_op), ("PricePanel", panel_op)):
+            result, peak = traced(operation)
+            if expected is None:
+                cells.append(f"{peak:9.1f} MB {'-':>6}")
+                continue
+
+            shared = np.shares_memory(values_of(result), source[path])
+            copies[path] += not shared
+            cells.append(f"{peak:9.1f} MB {'view' if shared else 'copy':>6}")
+
+            if path == "PricePanel" and expected == "view" and not shared:
+                failed = True
+        print(f"{name:<20}{cells[0]:>22}{cells[1]:>22}")
+
+    print(f"copies: DataFrame {copies['DataFrame']} of {slices} selections, "
+          f"PricePanel {copies['PricePanel']} of {slices}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        panel.save(directory)
+        loaded, peak = traced(lambda: PricePanel.load(directory))
+        mapped = isinstance(loaded.values, np.memmap)
+        matches = np.array_equal(loaded.values, panel.values, equal_nan=True)
+        print(f"load:   {peak:.1f} MB traced, {'memory-mapped' if mapped else 'READ INTO MEMORY'}, "
+              f"{'ok' if matches else 'MISMATCH'}")
+        failed |= not (mapped and matches)
+        del loaded
+
+    print("FAIL" if failed else "ok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
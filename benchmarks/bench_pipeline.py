@@ -0,0 +1,225 @@
+"""
+Stage-level benchmarks for the momentum pipeline on synthetic data.
+
+Every stage runs against ``SyntheticPriceFetcher`` (no network). Prices are
+pre-loaded into a ``PriceSession`` so fetch time is excluded from the stages
+that read through the session.
+
+    poetry run python benchmarks/bench_pipeline.py --output bench.json
+    poetry run python benchmarks/bench_pipeline.py --tickers 50,500 --years 5 \
+        --compare bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.resampler import MonthlyResampler
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.decision.diagnostics import MomentumDiagnostics
+from momentum_engine.portfolio.weighting import WEIGHTINGS, PortfolioWeighter
+from momentum_engine.ranking.cross_sectional_ranker import CrossSectionalRanker
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.performance import PerformanceAnalyzer
+from momentum_engine.research.snapshot import SnapshotAnalyzer
+from momentum_engine.research.vectorized_backtester import VectorizedBacktest
+from momentum_engine.signals.momentum_12_1 import Momentum12_1
+from momentum_engine.signals.registry import SignalRegistry
+
+
+END_DATE = "2025-12-31"
+TOP_N = 20
+
+
+def timed(fn, repeats: int) -> tuple[list[float], object]:
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def write_inputs(workdir: Path, tickers: list[str], start_date: str) -> tuple[str, str]:
+    universe_path = workdir / "universe.csv"
+    pd.DataFrame({"ticker": tickers}).to_csv(universe_path, index=False)
+
+    config = {
+        "backtest": {"start_date": start_date, "end_date": END_DATE, "initial_capital": 1_000_000},
+        "universe": {"name": "synthetic", "file": str(universe_path)},
+        "momentum": {"lookback_months": 12, "skip_recent_months": 1},
+        "portfolio": {"top_n": TOP_N, "weighting": "equal"},
+        "output": {"directory": str(workdir / "output")},
+    }
+    config_path = workdir / "research.yaml"
+    config_path.write_text(yaml.safe_dump(config))
+
+    return str(config_path), str(universe_path)
+
+
+def bench_scale(n_tickers: int, years: int, repeats: int, seed: int) -> list[dict]:
+    tickers = [f"SYN{i:05d}.NS" for i in range(n_tickers)]
+    start_date = (pd.Timestamp(END_DATE) - pd.DateOffset(years=years)).strftime("%Y-%m-%d")
+
+    fetcher = SyntheticPriceFetcher(end_date=END_DATE, seed=seed)
+    session = PriceSession(fetcher)
+
+    # Snapshot and diagnostics read from a fixed 2010 start; load once so
+    # every stage is served from the warm session.
+    session_start = min(start_date, "2010-01-01")
+    daily = session.daily(tickers, start_date=session_start).loc[start_date:]
+
+    results = []
+
+    def record(stage: str, timings: list[float]) -> None:
+        results.append({
+            "stage": stage,
+            "tickers": n_tickers,
+            "years": years,
+            "repeats": len(timings),
+            "min_s": min(timings),
+            "median_s": statistics.median(timings),
+        })
+
+    timings, monthly = timed(lambda: MonthlyResampler.to_monthly(daily), repeats)
+    record("MonthlyResampler.to_monthly", timings)
+
+    signal_model = Momentum12_1(12, 1)
+    timings, signal = timed(lambda: signal_model.compute(monthly), repeats)
+    record("Momentum12_1.compute", timings)
+
+    # One signal vs every registered signal over a shared context.
+    timings, _ = timed(lambda: SignalRegistry.compute(monthly, ["mom_12_1"]), repeats)
+    record("SignalRegistry.compute[mom_12_1]", timings)
+    timings, _ = timed(lambda: SignalRegistry.compute(monthly), repeats)
+    record("SignalRegistry.compute[all]", timings)
+
+    timings, ranked = timed(lambda: CrossSectionalRanker.rank(signal), repeats)
+    record("CrossSectionalRanker.rank", timings)
+
+    # Monthly rebalance over the whole history; the weighter (and its
+    # rolling covariance) is rebuilt on every repeat.
+    values = monthly.to_numpy(dtype=float)
+    for method in WEIGHTINGS:
+        timings, _ = timed(
+            lambda: VectorizedBacktest.run(
+                monthly, monthly.index, 12, 1, TOP_N, 1e6,
+                weighter=PortfolioWeighter(method, values, TOP_N),
+            ),
+            repeats,
+        )
+        record(f"VectorizedBacktest.run[{method}]", timings)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        config_path, universe_path = write_inputs(workdir, tickers, start_date)
+
+        backtester = Backtester(config_path, session=session)
+        timings, bt_results = timed(backtester.run, repeats)
+        record("Backtester.run", timings)
+
+        timings, _ = timed(lambda: PerformanceAnalyzer.compute_metrics(bt_results), repeats)
+        record("PerformanceAnalyzer.compute_metrics", timings)
+
+        snapshot = SnapshotAnalyzer(universe_path, session=session)
+        timings, _ = timed(snapshot.run, repeats)
+        record("SnapshotAnalyzer.run", timings)
+
+        for mode in MomentumDiagnostics.MODES:
+            diagnostics = MomentumDiagnostics(
+                selected_tickers=ranked.index[:TOP_N].tolist(),
+                ranked_signal=ranked,
+                output_directory=str(workdir / "output"),
+                session=session,
+                mode=mode,
+            )
+            timings, _ = timed(diagnostics.generate, repeats)
+            record(f"MomentumDiagnostics.generate[{mode}]", timings)
+
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: list[dict], baseline_path: str) -> None:
+    with open(baseline_path, "r") as f:
+        baseline = json.load(f)["results"]
+
+    key = lambda row: (row["stage"], row["tickers"], row["years"])
+    previous = {key(row): row for row in baseline}
+
+    print(f"\n{'stage':40} {'tickers':>7} {'years':>5} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for row in current:
+        before = previous.get(key(row))
+        if before is None:
+            continue
+        ratio = row["median_s"] / before["median_s"] if before["median_s"] else float("nan")
+        print(
+            f"{row['stage']:40} {row['tickers']:>7} {row['years']:>5} "
+            f"{before['median_s']:>10.4f} {row['median_s']:>10.4f} {ratio:>7.2f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", default="50,500,5000", help="Comma-separated universe sizes.")
+    parser.add_argument("--years", default="5,30", help="Comma-separated history lengths in years.")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Write results JSON to this path.")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to compare against.")
+    args = parser.parse_args()
+
+    results = []
+    for n_tickers in [int(x) for x in args.tickers.split(",")]:
+        for years in [int(x) for x in args.years.split(",")]:
+            print(f"Benchmarking {n_tickers} tickers x {years} years ...", file=sys.stderr)
+            results.extend(bench_scale(n_tickers, years, args.repeats, args.seed))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+    for row in results:
+        print(f"{row['stage']:40} {row['tickers']:>7} {row['years']:>5} {row['median_s']:>10.4f}s")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        compare(results, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Load test for the local query service (``momentum serve``).
+
+Starts a ``QueryServer`` over a synthetic universe in a child process (or
+targets a running service with ``--port``), then opens ``--connections``
+keep-alive connections from a local asyncio client and issues a mix of
+rank, top-N, snapshot and signal-history queries. Reports p50/p99 latency
+per route and overall, and fails (exit code 1) if the overall p99 exceeds
+``--max-p99-ms`` or any request does not return 200.
+
+A ``POST /refresh`` is sent as the measured load starts, and the clients
+keep going past ``--requests`` if needed until that refresh has completed,
+so the latencies always include readers overlapping a state rebuild. The
+synthetic server also refreshes every ``--refresh`` seconds.
+
+    poetry run python benchmarks/bench_serve.py
+    poetry run python benchmarks/bench_serve.py --tickers 2000 --requests 20000 --connections 16
+    poetry run python benchmarks/bench_serve.py --port 8765      # against `momentum serve`
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+END_DATE = "2025-12-31"
+
+
+def serve_synthetic(port: int, n_tickers: int, refresh: float, workdir: str) -> None:
+    from momentum_engine.data.price_session import PriceSession
+    from momentum_engine.data.synthetic import SyntheticPriceFetcher
+    from momentum_engine.service.query_server import QueryServer
+    from momentum_engine.service.ranked_state import RankedState
+
+    # Two overlapping universes, as with nifty100 + niftynext50.
+    tickers = [f"SYN{i:05d}.NS" for i in range(n_tickers)]
+    files = []
+    for name, members in (("large", tickers[: n_tickers // 2]), ("broad", tickers)):
+        path = Path(workdir) / f"{name}.csv"
+        pd.DataFrame({"ticker": members}).to_csv(path, index=False)
+        files.append(str(path))
+
+    def build_state():
+        session = PriceSession(SyntheticPriceFetcher(end_date=END_DATE))
+        return RankedState.build(RankedState.load_universes(files), session)
+
+    server = QueryServer(build_state, port=port, refresh_interval=refresh or None, log=lambda message: None)
+    asyncio.run(server.serve_forever())
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def request(reader, writer, path: str, method: str = "GET") -> tuple[int, bytes]:
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n".encode())
+    await writer.drain()
+
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    length = next(
+        int(line.split(":", 1)[1]) for line in header_lines if line.lower().startswith("content-length")
+    )
+    return int(status_line.split(" ")[1]), await reader.readexactly(length)
+
+
+async def wait_ready(port: int, timeout: float = 120.0) -> dict:
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status, body = await request(reader, writer, "/health")
+            writer.close()
+            if status == 200:
+                return json.loads(body)
+        except OSError:
+            pass
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"Service on port {port} not ready after {timeout:.0f}s")
+        await asyncio.sleep(0.2)
+
+
+async def discover(port: int, health: dict) -> tuple[list[str], list[str]]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    universes = list(health["universes"])
+    tickers = []
+    for universe in universes:
+        _, body = await request(reader, writer, f"/top/{universe}?n=100000")
+        tickers += [row["ticker"] for row in json.loads(body)["rows"]]
+    writer.close()
+    return universes, sorted(set(tickers))
+
+
+def query_mix(universes: list[str], tickers: list[str], signals: list[str], rng: random.Random):
+    # Route name and path; weights roughly follow dashboard usage.
+    routes = [
+        ("rank", 0.4, lambda: f"/rank/{rng.choice(tickers)}?signal={rng.choice(signals)}"),
+        ("top", 0.3, lambda: f"/top/{rng.choice(universes)}?n=20&signal={rng.choice(signals)}"),
+        ("snapshot", 0.15, lambda: f"/snapshot/{rng.choice(universes)}?limit=50"),
+        ("history", 0.15, lambda: f"/signals/{rng.choice(tickers)}?start=2020-01-01"),
+    ]
+    names = [name for name, _, _ in routes]
+    weights = [weight for _, weight, _ in routes]
+    paths = {name: path for name, _, path in routes}
+
+    while True:
+        name = rng.choices(names, weights)[0]
+        yield name, paths[name]()
+
+
+async def refresh_during_load(port: int, done: asyncio.Event, timeout: float = 120.0) -> bool:
+    """
+    ``POST /refresh`` and wait until ``/health`` counts one more completed
+    refresh. Sets ``done`` either way; returns False if the refresh failed
+    or timed out.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        _, body = await request(reader, writer, "/health")
+        before = json.loads(body)["refreshes"]
+        await request(reader, writer, "/refresh", method="POST")
+
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(0.02)
+            _, body = await request(reader, writer, "/health")
+            health = json.loads(body)
+            if health["refreshes"] > before:
+                return True
+            if not health["refreshing"] and health["last_error"]:
+                return False
+        return False
+    finally:
+        writer.close()
+        done.set()
+
+
+async def client(port: int, queries, n_requests: int, results: list, failures: list, until=None) -> None:
+    # With ``until`` (an Event), keep going past ``n_requests`` until it is set.
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = 0
+    while sent < n_requests or (until is not None and not until.is_set()):
+        sent += 1
+        route, path = next(queries)
+        start = time.perf_counter()
+        status, _ = await request(reader, writer, path)
+        results.append((route, time.perf_counter() - start))
+        if status != 200:
+            failures.append((status, path))
+    writer.close()
+
+
+async def load_test(args, port: int) -> int:
+    health = await wait_ready(port)
+    universes, tickers = await discover(port, health)
+    rng = random.Random(args.seed)
+    queries = query_mix(universes, tickers, health["signals"], rng)
+
+    # Warm-up (connection setup, first-call paths) is not measured.
+    await asyncio.gather(*[client(port, queries, 20, [], []) for _ in range(args.connections)])
+
+    results, failures = [], []
+    per_connection = -(-args.requests // args.connections)
+    refresh_done = asyncio.Event()
+    start = time.perf_counter()
+    refreshed, *_ = await asyncio.gather(
+        refresh_during_load(port, refresh_done),
+        *[
+            client(port, queries, per_connection, results, failures, until=refresh_done)
+            for _ in range(args.connections)
+        ],
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"service:  {health['tickers']} tickers, {len(universes)} universes, month-end {health['as_of']}")
+    print(f"load:     {len(results)} requests over {args.connections} connections in {elapsed:.2f}s "
+          f"({len(results) / elapsed:,.0f} req/s), state refreshed during test: {'yes' if refreshed else 'no'}")
+    print(f"\n{'route':10} {'count':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+
+    by_route: dict[str, list[float]] = {}
+    for route, latency in results:
+        by_route.setdefault(route, []).append(latency)
+
+    def row(name: str, latencies: list[float]) -> float:
+        ms = np.array(latencies) * 1000
+        p50, p99 = np.percentile(ms, [50, 99])
+        print(f"{name:10} {len(ms):>7} {p50:>8.3f} {p99:>8.3f} {ms.max():>8.3f}")
+        return p99
+
+    for route, latencies in sorted(by_route.items()):
+        row(route, latencies)
+    p99 = row("all", [latency for _, latency in results])
+
+    failed = p99 > args.max_p99_ms or bool(failures) or not refreshed
+    if not refreshed:
+        print("\nThe refresh triggered during the test did not complete.")
+    if failures:
+        print(f"\n{len(failures)} non-200 responses, e.g. {failures[0]}")
+    print(f"\np99 {p99:.3f} ms (budget {args.max_p99_ms:g} ms) {'FAIL' if failed else 'ok'}")
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=None, help="Test a running service instead of a synthetic one.")
+    parser.add_argument("--tickers", type=int, default=500, help="Synthetic universe size.")
+    parser.add_argument("--refresh", type=float, default=2.0, help="Synthetic server refresh interval (seconds).")
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--max-p99-ms", type=float, default=25.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.port is not None:
+        return asyncio.run(load_test(args, args.port))
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as workdir:
+        server = multiprocessing.Process(
+            target=serve_synthetic, args=(port, args.tickers, args.refresh, workdir), daemon=True
+        )
+        server.start()
+        try:
+            return asyncio.run(load_test(args, port))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
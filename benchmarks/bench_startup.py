@@ -0,0 +1,90 @@
+"""
+CLI startup-time budget check.
+
+Runs ``momentum version`` (and optionally other argument lists) in fresh
+interpreters, reports the median wall time and fails when it exceeds the
+budget or when a heavy dependency is imported. Exit code 1 on failure, so
+it can run in CI or a pre-commit hook. The import check alone also runs
+as part of the test suite (``tests/test_cli_startup.py``).
+
+    poetry run python benchmarks/bench_startup.py
+    poetry run python benchmarks/bench_startup.py --budget-ms 150 --repeats 15
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Modules a light command must not import.
+HEAVY_MODULES = ("pandas", "numpy", "yfinance", "plotly", "scipy")
+
+PROBE = """
+import json, sys
+from momentum_engine.cli.main import cli
+try:
+    cli({args!r}, standalone_mode=False)
+finally:
+    loaded = sorted({{name.split(".")[0] for name in sys.modules}} & set({heavy!r}))
+    print(json.dumps(loaded), file=sys.stderr)
+"""
+
+
+def run_once(args: list[str]) -> tuple[float, list[str]]:
+    code = PROBE.format(args=args, heavy=HEAVY_MODULES)
+
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+
+    if completed.returncode != 0:
+        raise RuntimeError(f"momentum {' '.join(args)} failed:\n{completed.stderr}")
+
+    return elapsed, json.loads(completed.stderr.strip().splitlines()[-1])
+
+
+def baseline_ms(repeats: int) -> float:
+    # Bare interpreter start, reported so the budget can be read against it.
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Median wall-time budget per command.")
+    parser.add_argument("--repeats", type=int, default=9)
+    parser.add_argument("--command", action="append", default=None,
+                        help="Command line to check, e.g. 'version' or '--help' (repeatable).")
+    args = parser.parse_args()
+
+    commands = args.command or ["version", "--help"]
+
+    print(f"python startup: {baseline_ms(args.repeats):.1f} ms (median)")
+
+    failed = False
+    for command in commands:
+        argv = command.split()
+        results = [run_once(argv) for _ in range(args.repeats)]
+        median_ms = statistics.median(elapsed for elapsed, _ in results) * 1000
+        heavy = results[-1][1]
+
+        ok = median_ms <= args.budget_ms and not heavy
+        failed |= not ok
+
+        status = "ok" if ok else "FAIL"
+        print(f"momentum {command:12} {median_ms:8.1f} ms (budget {args.budget_ms:.0f} ms) {status}")
+        if heavy:
+            print(f"  heavy modules imported: {', '.join(heavy)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,15 @@
+"""
+Command-line entry point.
+
+Commands import their dependencies (pandas, yfinance, plotly, the research
+modules) inside the command body, so ``momentum version`` and ``--help``
+only load click. ``benchmarks/bench_startup.py`` checks the startup budget.
+"""
+
 import click
-from momentum_engine.engine import LiveMomentumEngine
-from momentum_engine.research.backtester import Backtester
-from momentum_engine.research.backtester import Backtester
-from momentum_engine.research.performance import PerformanceAnalyzer
-from momentum_engine.research.snapshot import SnapshotAnalyzer
 from datetime import datetime
 from pathlib import Path
+import time
 
 
 UNIVERSE_SHORTCUTS = {
@@ -13,6 +17,83 @@ UNIVERSE_SHORTCUTS = {
     "niftynext50": "data/ind_niftynext50list.csv",
 }
 
+def store_options(command):
+    command = click.option("--offline", is_flag=True, help="Read prices from the local store only.")(command)
+    command = click.option("--store", default="data/prices", help="Local price store directory.")(command)
+    return command
+
+
+def profile_option(command):
+    return click.option(
+        "--profile", is_flag=True,
+        help="Write per-stage timings to output/profiles/ (JSON and Chrome trace).",
+    )(command)
+
+
+def cache_options(command):
+    command = click.option("--cache-dir", default="output/cache", help="Result cache directory.")(command)
+    command = click.option("--no-cache", is_flag=True, help="Recompute instead of reading the result cache.")(command)
+    return command
+
+
+def build_cache(no_cache, cache_dir):
+    if no_cache:
+        return None
+
+    from momentum_engine.research.result_cache import ResultCache
+
+    return ResultCache(cache_dir)
+
+
+def build_profiler(profile):
+    from momentum_engine.core.profiling import NullProfiler, StageProfiler
+
+    return StageProfiler() if profile else NullProfiler()
+
+
+def save_profile(profiler, command):
+    if not profiler.enabled:
+        return
+
+    ts = datetime.today().strftime("%Y-%m-%d_%H%M%S")
+    json_path, trace_path = profiler.save(f"output/profiles/{ts}_{command}")
+
+    click.echo(f"\nStage profile ({len(profiler.records)} stages):")
+    for record in sorted(profiler.records, key=lambda record: record["start_s"]):
+        click.echo(f"  {record['stage']:32} {record['wall_s']:>9.3f}s wall "
+                   f"{record['thread_cpu_s']:>9.3f}s thread cpu {record['process_cpu_s']:>9.3f}s process cpu")
+    click.echo(f"Profile saved to {json_path} and {trace_path}")
+
+
+def build_session(store, offline, profiler=None):
+    from momentum_engine.data.chunked_fetcher import ChunkedPriceFetcher
+    from momentum_engine.data.price_session import PriceSession
+    from momentum_engine.data.price_store import PriceStore, StoredPriceFetcher
+
+    downloader = ChunkedPriceFetcher()
+    fetcher = StoredPriceFetcher(PriceStore(store), source=downloader.fetch, offline=offline)
+    session = PriceSession(fetcher, profiler=profiler)
+    session.downloader = downloader
+    return session
+
+
+def echo_download_failures(session):
+    # Failures accumulate over the run's fetches; report them once and
+    # start afresh (``watch`` reuses the session across checks).
+    failures = dict(session.downloader.failures)
+    session.downloader.clear_failures()
+    if not failures:
+        return
+
+    click.echo(f"\nDownload failures ({len(failures)}):")
+    for ticker, reason in sorted(failures.items()):
+        click.echo(f"  {ticker}: {reason}")
+
+
+def parse_list(value, cast=int):
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+
 @click.group()
 def cli():
     """Momentum Engine CLI"""
@@ -26,35 +107,138 @@ def version():
 
 @cli.command(name="run-live")
 @click.option("--config", "-c", required=True, help="Path to config file.")
-def run_live(config):
-    engine = LiveMomentumEngine(config)
+@store_options
+@profile_option
+def run_live(config, store, offline, profile):
+    from momentum_engine.engine import LiveMomentumEngine
+
+    profiler = build_profiler(profile)
+    engine = LiveMomentumEngine(config, session=build_session(store, offline, profiler), profiler=profiler)
     weights, decision_path = engine.run()
+    echo_download_failures(engine.session)
 
     click.echo(f"Decision report saved to: {decision_path}")
+
+    stats = engine.session.stats()
+    click.echo(f"Price session: {stats['hits']} cache hits, {stats['misses']} misses")
     click.echo("Selected portfolio:")
 
     for ticker, weight in weights.items():
         click.echo(f"{ticker} -> {weight}")
 
+    save_profile(profiler, "run-live")
+
+@cli.command(name="watch")
+@click.option("--config", "-c", required=True, help="Path to config file.")
+@click.option("--state", default=None, help="Rolling state file, written at exactly this path (default: <output>/live_state.npz).")
+@click.option("--interval", default=3600, type=int, help="Seconds between checks for a closed month.")
+@click.option("--once", is_flag=True, help="Check once and exit.")
+@store_options
+def watch(config, state, interval, once, store, offline):
+    """
+    Keep live signal state in memory and emit a decision CSV when a month closes.
+    """
+    from momentum_engine.engine import LiveMomentumEngine
+    from momentum_engine.signals.live_state import LiveSignalState
+
+    engine = LiveMomentumEngine(config, session=build_session(store, offline))
+    state_path = state or f"{engine.output_dir}/live_state.npz"
+
+    if Path(state_path).exists():
+        live_state = LiveSignalState.load(state_path)
+    else:
+        live_state = engine.seed_state()
+        live_state.save(state_path)
+
+    click.echo(f"Watching {len(live_state.tickers)} tickers; last month-end: {live_state.last_date.date()}")
+
+    while True:
+        for decision_path in engine.update_state(live_state):
+            click.echo(f"Decision report saved to: {decision_path}")
+            live_state.save(state_path)
+
+        echo_download_failures(engine.session)
+
+        if once:
+            break
+        time.sleep(interval)
+
+def run_backtest_batch(configs, universes, session, profiler):
+    from momentum_engine.research.batch_backtest import BatchBacktest
+
+    batch = BatchBacktest(configs, universes or None, session=session, profiler=profiler)
+    comparison, consolidated = batch.run()
+    echo_download_failures(session)
+
+    click.echo(f"Backtest complete: {len(comparison)} runs on one price load.\n")
+
+    display = comparison.copy()
+    for col in ["CAGR", "Annualized Volatility", "Max Drawdown"]:
+        if col in display:
+            display[col] = (display[col] * 100).round(2)
+    click.echo(display.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+    output_dir = batch.backtesters[0].config["output"]["directory"]
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    ts = datetime.today().strftime("%Y-%m-%d")
+    comparison_path = f"{output_dir}/{ts}_backtest_comparison.csv"
+    consolidated_path = f"{output_dir}/{ts}_backtest_consolidated.csv"
+    comparison.to_csv(comparison_path, index=False)
+    consolidated.to_csv(consolidated_path, index=False)
+
+    click.echo(f"\nSaved to {comparison_path} and {consolidated_path}")
+
+
 @cli.command(name="backtest")
-@click.option("--config", "-c", default="config/research.yaml", help="Path to config file.")
-@click.option("--universe", "-u", default=None, help="Universe CSV file or shortcut (n100, n200, next50).")
-def backtest(config, universe):
+@click.option("--config", "-c", "configs", default=["config/research.yaml"], multiple=True, help="Path to config file (repeatable).")
+@click.option("--universe", "-u", "universes", multiple=True, help="Universe CSV file or shortcut (repeatable).")
+@click.option("--vectorized", is_flag=True, help="Use the single-pass vectorized backtest.")
+@store_options
+@cache_options
+@profile_option
+def backtest(configs, universes, vectorized, store, offline, no_cache, cache_dir, profile):
     """
     Run a full backtest engine.
+
+    Several -c and/or -u values run every combination on one shared price
+    load (vectorized engine) and print a comparison table. Single runs are
+    served from the result cache when config, universe and prices are
+    unchanged.
     """
-    
-    if universe in UNIVERSE_SHORTCUTS:
-        universe = UNIVERSE_SHORTCUTS[universe]
+    from momentum_engine.research.backtester import Backtester
+    from momentum_engine.research.performance import PerformanceAnalyzer
+
+    universes = [UNIVERSE_SHORTCUTS.get(universe, universe) for universe in universes]
 
-    bt = Backtester(config, universe_override=universe)
-    results = bt.run()
+    profiler = build_profiler(profile)
+
+    if len(configs) > 1 or len(universes) > 1:
+        run_backtest_batch(list(configs), universes, build_session(store, offline, profiler), profiler)
+        save_profile(profiler, "backtest")
+        return
+
+    config = configs[0]
+    universe = universes[0] if universes else None
+    bt = Backtester(
+        config,
+        universe_override=universe,
+        session=build_session(store, offline, profiler),
+        profiler=profiler,
+    )
+    cache = build_cache(no_cache, cache_dir)
+    if cache is not None:
+        metrics = bt.run_cached(cache, vectorized=vectorized)["metrics"]
+    else:
+        results = bt.run_vectorized() if vectorized else bt.run()
+        metrics = PerformanceAnalyzer.compute_metrics(results)
+    echo_download_failures(bt.session)
 
     click.echo("Backtest complete.")
     click.echo(f"Universe: {bt.universe_name}")
     click.echo(f"Universe size: {len(bt.universe)}")
-
-    metrics = PerformanceAnalyzer.compute_metrics(results)
+    if cache is not None:
+        click.echo(f"Result cache: {'hit' if cache.hits else 'miss'}")
 
     click.echo("\nPerformance Metrics:")
     for k, v in metrics.items():
@@ -63,34 +247,362 @@ def backtest(config, universe):
         else:
             click.echo(f"{k}: {v:.2f}")
 
-@cli.command(name="snapshot")
-@click.option("--universe", "-u", required=True, help="Universe shortcut or CSV file.")
-def snapshot(universe):
+    save_profile(profiler, "backtest")
+
+@cli.command(name="sweep")
+@click.option("--config", "-c", default="config/research.yaml", help="Path to config file.")
+@click.option("--universe", "-u", default=None, help="Universe CSV file or shortcut.")
+@click.option("--lookback", default="6,9,12", help="Comma-separated lookback months.")
+@click.option("--skip", default="0,1", help="Comma-separated skip months.")
+@click.option("--top-n", default="10,20,30", help="Comma-separated portfolio sizes.")
+@click.option("--rebalance", default="quarterly", help="Comma-separated frequencies (monthly, quarterly).")
+@click.option("--workers", "-w", default=None, type=int, help="Worker processes (default: all cores).")
+@store_options
+def sweep(config, universe, lookback, skip, top_n, rebalance, workers, store, offline):
+    """
+    Backtest every parameter combination on one shared price load.
+    """
+    from momentum_engine.research.backtester import Backtester
+    from momentum_engine.research.sweep import ParameterSweep
 
     if universe in UNIVERSE_SHORTCUTS:
         universe = UNIVERSE_SHORTCUTS[universe]
 
-    analyzer = SnapshotAnalyzer(universe)
-    df = analyzer.run()
+    bt = Backtester(config, universe_override=universe, session=build_session(store, offline))
 
-    click.echo(f"Universe: {analyzer.universe_name}")
-    click.echo(f"Universe size: {len(df)}\n")
+    param_sweep = ParameterSweep(
+        bt,
+        lookbacks=parse_list(lookback),
+        skips=parse_list(skip),
+        top_ns=parse_list(top_n),
+        rebalances=parse_list(rebalance, cast=str),
+    )
+    results = param_sweep.run(workers=workers)
+    echo_download_failures(bt.session)
 
-        # Drop rows with missing 12M (optional but recommended)
-    df = df.dropna(subset=["12M"])
+    click.echo(f"Sweep complete: {len(results)} combinations.")
+    click.echo(f"Universe: {bt.universe_name}")
+    click.echo(results.sort_values("Sharpe Ratio", ascending=False).head(20).to_string(index=False))
 
-    # Format for human-readable output
-    df_display = df.copy()
+    output_dir = bt.config["output"]["directory"]
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    for col in ["1M", "3M", "12M", "36M", "60M"]:
-        df_display[col] = (df_display[col] * 100).round(2)
+    ts = datetime.today().strftime("%Y-%m-%d")
+    output_path = f"{output_dir}/{ts}_{bt.universe_name}_sweep.csv"
+    results.to_csv(output_path, index=False)
 
-    click.echo(df_display.to_string(index=False))
+    click.echo(f"\nSaved to {output_path}")
 
-    output_dir = "output/snapshots"
+@cli.command(name="walkforward")
+@click.option("--config", "-c", default="config/research.yaml", help="Path to config file.")
+@click.option("--universe", "-u", default=None, help="Universe CSV file or shortcut.")
+@click.option("--lookback", default="6,9,12", help="Comma-separated lookback months.")
+@click.option("--skip", default="1", help="Comma-separated skip months.")
+@click.option("--top-n", default="10,20,30", help="Comma-separated portfolio sizes.")
+@click.option("--rebalance", default="quarterly", help="Rebalance frequency (monthly, quarterly).")
+@click.option("--in-sample", default=60, type=int, help="In-sample window in months.")
+@click.option("--out-of-sample", default=12, type=int, help="Out-of-sample window (and step) in months.")
+@click.option("--anchored", is_flag=True, help="Expanding in-sample windows from the first period.")
+@click.option("--objective", default="Sharpe Ratio", help="In-sample score to maximise.")
+@click.option("--workers", "-w", default=None, type=int, help="Worker processes (default: all cores).")
+@store_options
+def walkforward(
+    config, universe, lookback, skip, top_n, rebalance, in_sample, out_of_sample,
+    anchored, objective, workers, store, offline,
+):
+    """
+    Walk-forward parameter selection with a stitched out-of-sample curve.
+    """
+    from momentum_engine.research.backtester import Backtester
+    from momentum_engine.research.walkforward import WalkForward
+
+    if universe in UNIVERSE_SHORTCUTS:
+        universe = UNIVERSE_SHORTCUTS[universe]
+
+    bt = Backtester(config, universe_override=universe, session=build_session(store, offline))
+
+    walk_forward = WalkForward(
+        bt,
+        lookbacks=parse_list(lookback),
+        skips=parse_list(skip),
+        top_ns=parse_list(top_n),
+        rebalance=rebalance,
+        in_sample_months=in_sample,
+        out_of_sample_months=out_of_sample,
+        anchored=anchored,
+        objective=objective,
+    )
+    result = walk_forward.run(workers=workers)
+    echo_download_failures(bt.session)
+
+    click.echo(f"Walk-forward complete: {len(result.windows)} windows, {len(walk_forward.sweep.grid)} combinations.")
+    click.echo(f"Universe: {bt.universe_name}\n")
+    click.echo(result.windows.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    click.echo("\nOut-of-sample performance:")
+    click.echo(result.metrics.to_string(float_format=lambda v: f"{v:.4f}"))
+
+    output_dir = bt.config["output"]["directory"]
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    ts = datetime.today().strftime("%Y-%m-%d")
+    output_path = f"{output_dir}/{ts}_{bt.universe_name}_walkforward.csv"
+    windows_path = f"{output_dir}/{ts}_{bt.universe_name}_walkforward_windows.csv"
+    result.equity.to_csv(output_path, index=False)
+    result.windows.to_csv(windows_path, index=False)
+
+    click.echo(f"\nSaved to {output_path}")
+    click.echo(f"Windows saved to {windows_path}")
+
+@cli.command(name="robustness")
+@click.option("--config", "-c", default="config/research.yaml", help="Path to config file.")
+@click.option("--universe", "-u", default=None, help="Universe CSV file or shortcut.")
+@click.option("--paths", "-n", default=10_000, type=int, help="Number of bootstrap paths.")
+@click.option("--block", default=6.0, type=float, help="Mean block length in months.")
+@click.option("--rebalance", default="quarterly", help="Rebalance frequency (monthly, quarterly).")
+@click.option("--seed", default=0, type=int, help="Random seed.")
+@click.option("--workers", "-w", default=None, type=int, help="Worker processes (default: all cores).")
+@store_options
+def robustness(config, universe, paths, block, rebalance, seed, workers, store, offline):
+    """
+    Metric distributions over stationary block-bootstrap resamples.
+    """
+    from momentum_engine.research.backtester import Backtester
+    from momentum_engine.research.robustness import RobustnessAnalyzer
+
+    if universe in UNIVERSE_SHORTCUTS:
+        universe = UNIVERSE_SHORTCUTS[universe]
+
+    bt = Backtester(config, universe_override=universe, session=build_session(store, offline))
+
+    analyzer = RobustnessAnalyzer(bt, n_paths=paths, mean_block=block, rebalance=rebalance, seed=seed)
+    result = analyzer.run(workers=workers)
+    echo_download_failures(bt.session)
+
+    click.echo(f"Robustness complete: {len(result.paths)} paths, mean block {block:g} months.")
+    click.echo(f"Universe: {bt.universe_name}\n")
+    click.echo(result.summary.to_string(float_format=lambda v: f"{v:.4f}"))
+
+    output_dir = bt.config["output"]["directory"]
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    ts = datetime.today().strftime("%Y-%m-%d")
+    output_path = f"{output_dir}/{ts}_{bt.universe_name}_robustness.csv"
+    result.paths.to_csv(output_path, index_label="path")
+
+    click.echo(f"\nSaved to {output_path}")
+
+@cli.command(name="simulate")
+@click.option("--config", "-c", default="config/research.yaml", help="Path to config file.")
+@click.option("--universe", "-u", default=None, help="Universe CSV file or shortcut.")
+@click.option("--rebalance", default=None, help="monthly, quarterly or comma-separated dates (default: config).")
+@click.option("--cost-bps", default=None, type=float, help="Transaction cost per unit of turnover, in bps.")
+@click.option("--slippage-bps", default=None, type=float, help="Slippage per unit of turnover, in bps.")
+@store_options
+def simulate(config, universe, rebalance, cost_bps, slippage_bps, store, offline):
+    """
+    Daily mark-to-market simulation with turnover costs.
+    """
+    from momentum_engine.research.backtester import Backtester
+    from momentum_engine.research.simulator import DailySimulator
+
+    if universe in UNIVERSE_SHORTCUTS:
+        universe = UNIVERSE_SHORTCUTS[universe]
+
+    if rebalance and rebalance not in ("monthly", "quarterly"):
+        rebalance = parse_list(rebalance, cast=str)
+
+    bt = Backtester(config, universe_override=universe, session=build_session(store, offline))
+
+    simulator = DailySimulator(bt, rebalance=rebalance, cost_bps=cost_bps, slippage_bps=slippage_bps)
+    result = simulator.run()
+    echo_download_failures(bt.session)
+
+    click.echo("Simulation complete.")
+    click.echo(f"Universe: {bt.universe_name}")
+    click.echo(f"Rebalances: {len(result.rebalances)}")
+    click.echo(f"Cost + slippage: {simulator.cost_bps + simulator.slippage_bps:g} bps per unit turnover")
+    click.echo(f"Average turnover: {result.rebalances['turnover'].mean() * 100:.2f}%")
+    click.echo(f"Total costs: {result.rebalances['cost'].sum():,.2f}")
+
+    click.echo("\nPerformance Metrics (daily):")
+    for k, v in result.metrics().items():
+        if "Duration" in k or k == "Periods":
+            click.echo(f"{k}: {v:.0f}")
+        elif "Drawdown" in k or "Volatility" in k or "CAGR" in k or "Hit Rate" in k:
+            click.echo(f"{k}: {v * 100:.2f}%")
+        else:
+            click.echo(f"{k}: {v:.2f}")
+
+    output_dir = bt.config["output"]["directory"]
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    ts = datetime.today().strftime("%Y-%m-%d")
+    output_path = f"{output_dir}/{ts}_{bt.universe_name}_nav.csv"
+    result.nav.to_csv(output_path, index_label="date")
+
+    click.echo(f"\nSaved to {output_path}")
+
+@cli.command(name="ingest")
+@click.option("--universe", "-u", "universes", required=True, multiple=True, help="Universe shortcut or CSV file (repeatable).")
+@click.option("--start", default="2000-01-01", help="First date of history.")
+@click.option("--output", "-o", default="data/monthly", help="Directory for the month-end panel.")
+@click.option("--max-memory-mb", default=256, type=float, help="Peak memory budget for daily chunks.")
+@store_options
+@profile_option
+def ingest(universes, start, output, max_memory_mb, store, offline, profile):
+    """
+    Stream daily prices in chunks into an on-disk month-end panel.
+    """
+    from momentum_engine.data.streaming_ingest import StreamingMonthlyIngest
+    from momentum_engine.universe.csv_universe import CSVUniverse
+
+    tickers = [
+        ticker
+        for universe in universes
+        for ticker in CSVUniverse(UNIVERSE_SHORTCUTS.get(universe, universe)).get_tickers()
+    ]
+
+    profiler = build_profiler(profile)
+    session = build_session(store, offline, profiler)
+    streaming = StreamingMonthlyIngest(
+        session.fetcher,
+        output,
+        max_bytes=int(max_memory_mb * 1024**2),
+        profiler=profiler,
+    )
+    panel = streaming.run(tickers, start)
+    echo_download_failures(session)
+
+    click.echo(f"Month-end panel: {panel.shape[0]} months x {panel.shape[1]} tickers")
+    if streaming.failures:
+        missing = list(streaming.failures)
+        click.echo(f"No prices for {len(missing)} tickers: {', '.join(missing[:10])}"
+                   + (" ..." if len(missing) > 10 else ""))
+    click.echo(f"Saved to {output} (load with PricePanel.load)")
+
+    save_profile(profiler, "ingest")
+
+@cli.command(name="signals")
+@click.option("--universe", "-u", required=True, help="Universe shortcut or CSV file.")
+@click.option("--signals", "-s", "names", default=None, help="Comma-separated signals (default: all registered).")
+@click.option("--sort", default=None, help="Signal to sort by (default: the last requested).")
+@click.option("--start", default="2010-01-01", help="First date of price history.")
+@store_options
+def signals(universe, names, sort, start, store, offline):
+    """
+    Latest cross-section of several signals computed in one pass.
+    """
+    from momentum_engine.signals.registry import SignalRegistry
+    from momentum_engine.universe.csv_universe import CSVUniverse
+
+    universe = UNIVERSE_SHORTCUTS.get(universe, universe)
+    names = parse_list(names, cast=str) if names else SignalRegistry.names()
+
+    session = build_session(store, offline)
+    monthly = session.monthly(CSVUniverse(universe).get_tickers(), start_date=start)
+    echo_download_failures(session)
+
+    table = SignalRegistry.latest(monthly, names).dropna(how="all")
+    table = table.sort_values(sort or names[-1], ascending=False)
+    table.insert(0, "Ticker", table.index)
+
+    click.echo(f"Universe: {Path(universe).stem}  (month-end {monthly.index[-1].date()})\n")
+    click.echo(table.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+    output_dir = "output/signals"
     Path(output_dir).mkdir(parents=True, exist_ok=True)
+    output_path = f"{output_dir}/{datetime.today().strftime('%Y-%m-%d')}_{Path(universe).stem}.csv"
+    table.to_csv(output_path, index=False)
+
+    click.echo(f"\nSaved to {output_path}")
+
+@cli.command(name="serve")
+@click.option("--universe", "-u", "universes", multiple=True, default=("nifty100",), help="Universe shortcut or CSV file (repeatable).")
+@click.option("--port", "-p", default=8765, type=int, help="Port on 127.0.0.1.")
+@click.option("--start", default="2010-01-01", help="First date of price history.")
+@click.option("--refresh", default=3600, type=int, help="Seconds between background refreshes (0: only on POST /refresh).")
+@store_options
+def serve(universes, port, start, refresh, store, offline):
+    """
+    Local JSON query service with ranks, snapshots and signals held in memory.
+    """
+    import asyncio
+
+    from momentum_engine.service.query_server import HOST, QueryServer
+    from momentum_engine.service.ranked_state import RankedState
 
+    universe_files = [UNIVERSE_SHORTCUTS.get(universe, universe) for universe in universes]
+
+    def build_state():
+        # A new session per refresh, so prices are re-read (and synced
+        # when online) instead of served from the previous panel.
+        session = build_session(store, offline)
+        state = RankedState.build(RankedState.load_universes(universe_files), session, start)
+        echo_download_failures(session)
+        return state
+
+    server = QueryServer(build_state, port=port, refresh_interval=refresh or None, log=click.echo)
+
+    async def run():
+        await server.start()
+        click.echo(f"Serving on http://{HOST}:{server.port} (Ctrl+C to stop)")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        click.echo("Stopped.")
+
+@cli.command(name="snapshot")
+@click.option("--universe", "-u", "universes", required=True, multiple=True, help="Universe shortcut or CSV file (repeatable).")
+@click.option("--view", default=None, help="Materialised trailing-return view file (default: one per ticker set under output/snapshots/views/).")
+@click.option("--rebuild", is_flag=True, help="Ignore the saved view and rebuild it from history.")
+@store_options
+@cache_options
+@profile_option
+def snapshot(universes, view, rebuild, store, offline, no_cache, cache_dir, profile):
+    from momentum_engine.research.snapshot import SnapshotAnalyzer
+
+    universes = [UNIVERSE_SHORTCUTS.get(universe, universe) for universe in universes]
+
+    profiler = build_profiler(profile)
+    analyzer = SnapshotAnalyzer(
+        universes,
+        session=build_session(store, offline, profiler),
+        profiler=profiler,
+        view_path=view,
+        cache=None if rebuild else build_cache(no_cache, cache_dir),
+    )
+    if view is None:
+        analyzer.view_path = analyzer.default_view_path()
+    if rebuild:
+        Path(analyzer.view_path).unlink(missing_ok=True)
+
+    frames = analyzer.run_all()
+    echo_download_failures(analyzer.session)
+
+    output_dir = "output/snapshots"
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
     ts = datetime.today().strftime("%Y-%m-%d")
-    df.to_csv(f"{output_dir}/{ts}_{analyzer.universe_name}.csv", index=False)
 
-    click.echo(f"\nSaved to output/snapshots/")
\ No newline at end of file
+    for universe_name, df in frames.items():
+        click.echo(f"Universe: {universe_name}")
+        click.echo(f"Universe size: {len(df)}\n")
+
+        # Drop rows with missing 12M (optional but recommended)
+        df = df.dropna(subset=["12M"])
+
+        # Format for human-readable output
+        df_display = df.copy()
+
+        for col in ["1M", "3M", "12M", "36M", "60M"]:
+            df_display[col] = (df_display[col] * 100).round(2)
+
+        click.echo(df_display.to_string(index=False))
+        click.echo("")
+
+        df.to_csv(f"{output_dir}/{ts}_{universe_name}.csv", index=False)
+
+    click.echo(f"Saved to output/snapshots/")
+
+    save_profile(profiler, "snapshot")
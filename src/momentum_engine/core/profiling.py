@@ -0,0 +1,154 @@
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS.
+    resource = None
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "meta", "_wall", "_thread_cpu", "_process_cpu")
+
+    def __init__(self, profiler: "StageProfiler", name: str, meta: dict):
+        self.profiler = profiler
+        self.name = name
+        self.meta = meta
+
+    def shape(self, data) -> None:
+        """
+        Record the row/column counts of a DataFrame, Series or array.
+        """
+        shape = getattr(data, "shape", None)
+        if shape is None:
+            return
+        self.meta["rows"] = int(shape[0])
+        self.meta["columns"] = int(shape[1]) if len(shape) > 1 else 1
+
+    def __enter__(self) -> "_Stage":
+        self._wall = time.perf_counter()
+        self._thread_cpu = time.thread_time()
+        self._process_cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        wall_end = time.perf_counter()
+        self.profiler._record({
+            "stage": self.name,
+            "start_s": self._wall - self.profiler.origin,
+            "wall_s": wall_end - self._wall,
+            "thread_cpu_s": time.thread_time() - self._thread_cpu,
+            "process_cpu_s": time.process_time() - self._process_cpu,
+            "process_peak_rss_mb": StageProfiler.peak_rss_mb(),
+            "thread": threading.get_ident(),
+            **self.meta,
+        })
+
+
+class StageProfiler:
+    """
+    Records wall time, CPU time, peak RSS and row/column counts per stage.
+
+        with profiler.stage("resample") as stage:
+            monthly = MonthlyResampler.to_monthly(prices)
+            stage.shape(monthly)
+
+    Only ``wall_s`` and ``thread_cpu_s`` (CPU of the thread that ran the
+    stage) belong to the stage alone. ``process_cpu_s`` is the whole
+    process's CPU over the stage, so it includes worker threads and any
+    stage overlapping in another thread. ``process_peak_rss_mb`` is the
+    process's lifetime peak RSS at the end of the stage, not the stage's
+    own peak.
+
+    Stages may nest. Results are written as JSON and as a Chrome trace
+    (open in chrome://tracing or Perfetto). Peak RSS is None where the
+    ``resource`` module is unavailable (Windows).
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.records: list[dict] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def peak_rss_mb() -> float | None:
+        if resource is None:
+            return None
+        # ru_maxrss is KiB on Linux and bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak / scale
+
+    def stage(self, name: str, **meta) -> _Stage:
+        return _Stage(self, name, meta)
+
+    def _record(self, record: dict) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def chrome_trace(self) -> dict:
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = {k: v for k, v in record.items() if k not in ("stage", "start_s", "wall_s", "thread")}
+            events.append({
+                "name": record["stage"],
+                "cat": "stage",
+                "ph": "X",
+                "ts": record["start_s"] * 1e6,
+                "dur": record["wall_s"] * 1e6,
+                "pid": pid,
+                "tid": record["thread"],
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, prefix: str) -> tuple[str, str]:
+        """
+        Write ``<prefix>.json`` and ``<prefix>.trace.json``.
+        """
+        Path(prefix).parent.mkdir(parents=True, exist_ok=True)
+
+        json_path = f"{prefix}.json"
+        trace_path = f"{prefix}.trace.json"
+
+        records = sorted(self.records, key=lambda record: record["start_s"])
+        with open(json_path, "w") as f:
+            json.dump({"stages": records}, f, indent=2)
+        with open(trace_path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+        return json_path, trace_path
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def shape(self, data) -> None:
+        pass
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class NullProfiler:
+    """
+    Profiler used when profiling is off: every stage is a shared no-op.
+    """
+
+    enabled = False
+
+    def stage(self, name: str, **meta) -> _NullStage:
+        return _NULL_STAGE
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class MonthEndBuffer:
+    """
+    Ring buffer of the last ``size`` month-end price rows for a fixed set of
+    tickers, shared by ``LiveSignalState`` and ``TrailingReturnView``.
+
+    ``push`` adds a bar; a bar for the same month as the latest one
+    replaces it, an older one is rejected. ``row(k)`` is the bar ``k``
+    months before the latest. ``rebased`` records the store's per-ticker
+    rewrite counts (``PriceStore.rebased``) the buffered prices were read
+    at, when known.
+
+    Subclasses list their constructor arguments in ``PARAMETERS`` (saved
+    alongside the buffer) and derive their outputs in ``_refresh``, which
+    ``load`` calls.
+    """
+
+    PARAMETERS: tuple[str, ...] = ()
+
+    def __init__(self, tickers: list[str], size: int):
+        self.tickers = pd.Index(tickers)
+        self.size = size
+        self.prices = np.full((size, len(self.tickers)), np.nan)
+        self.dates = np.full(size, np.datetime64("NaT"), dtype="datetime64[ns]")
+        self.count = 0
+        self.rebased: list[int] | None = None
+
+    @property
+    def last_date(self) -> pd.Timestamp | None:
+        if self.count == 0:
+            return None
+        return pd.Timestamp(self.dates[(self.count - 1) % self.size])
+
+    def _slot(self, months_back: int) -> int:
+        return (self.count - 1 - months_back) % self.size
+
+    def row(self, months_back: int) -> np.ndarray:
+        return self.prices[self._slot(months_back)]
+
+    def clear(self) -> None:
+        self.prices[:] = np.nan
+        self.dates[:] = np.datetime64("NaT")
+        self.count = 0
+
+    def push(self, date, prices: pd.Series) -> None:
+        date = pd.Timestamp(date)
+        last = self.last_date
+
+        if last is not None and date.to_period("M") == last.to_period("M"):
+            slot = self._slot(0)
+        elif last is not None and date < last:
+            raise ValueError(f"Bar for {date.date()} is older than the latest buffered bar {last.date()}.")
+        else:
+            slot = self.count % self.size
+            self.count += 1
+
+        self.prices[slot] = prices.reindex(self.tickers).to_numpy(dtype=float)
+        self.dates[slot] = date.to_datetime64()
+
+    def _refresh(self) -> None:
+        pass
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        rebased = {} if self.rebased is None else {"rebased": self.rebased}
+        parameters = {name: getattr(self, name) for name in self.PARAMETERS}
+        # Through a file handle: given a name, np.savez appends ".npz" to
+        # any path without it and ``load(path)`` would not find the file.
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                tickers=np.array(self.tickers, dtype=str),
+                prices=self.prices,
+                dates=self.dates,
+                count=self.count,
+                **parameters,
+                **rebased,
+            )
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as data:
+            buffer = cls(data["tickers"].tolist(), **{name: int(data[name]) for name in cls.PARAMETERS})
+            buffer.prices = data["prices"]
+            buffer.dates = data["dates"]
+            buffer.count = int(data["count"])
+            if "rebased" in data.files:
+                buffer.rebased = data["rebased"].tolist()
+
+        buffer._refresh()
+        return buffer
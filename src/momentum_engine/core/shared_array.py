@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """
+    Picklable reference to a NumPy array living in shared memory.
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedArray:
+    """
+    Places a NumPy array in shared memory so worker processes can map it
+    instead of receiving a pickled copy.
+
+    The creating process owns the block and must call ``close`` (usually via
+    the context manager) to release it.
+    """
+
+    def __init__(self, array: np.ndarray):
+        array = np.ascontiguousarray(array)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf)
+        self.array[...] = array
+        self.handle = SharedArrayHandle(self._shm.name, array.shape, array.dtype.str)
+
+    def close(self) -> None:
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def attach(handle: SharedArrayHandle) -> tuple[np.ndarray, shared_memory.SharedMemory]:
+        """
+        Map an existing block. Keep the returned ``SharedMemory`` alive for as
+        long as the array is used.
+        """
+        shm = shared_memory.SharedMemory(name=handle.name)
+        array = np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=shm.buf)
+        return array, shm
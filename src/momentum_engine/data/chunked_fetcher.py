@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pandas as pd
+
+from momentum_engine.data.yahoo_fetcher import YahooPriceFetcher
+
+
+class RateLimiter:
+    """
+    Spaces calls at least ``1 / requests_per_second`` apart across threads.
+    """
+
+    def __init__(self, requests_per_second: float, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+
+        if slot > now:
+            self.sleep(slot - now)
+
+
+class ChunkedPriceFetcher:
+    """
+    Downloads a large universe in chunks on a bounded thread pool.
+
+    Each chunk is rate limited and retried with exponential backoff. A chunk
+    that still fails is split into single-ticker requests so one bad symbol
+    cannot sink its neighbours. Tickers that fail or return no prices are
+    left out of the panel and reported in ``failures``.
+
+    ``failures`` accumulates over every ``fetch`` call (a store sync fetches
+    once per start-date group) until ``clear_failures`` is called, so the
+    report at the end of a run covers all of them.
+    """
+
+    def __init__(
+        self,
+        download: Callable[[list[str], str], pd.DataFrame] = YahooPriceFetcher.fetch,
+        chunk_size: int = 25,
+        max_workers: int = 4,
+        requests_per_second: float = 2.0,
+        retries: int = 3,
+        backoff: float = 1.0,
+        sleep=time.sleep,
+    ):
+        self.download = download
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.sleep = sleep
+        self.limiter = RateLimiter(requests_per_second, sleep=sleep)
+
+        self.failures: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _attempt(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        for attempt in range(self.retries + 1):
+            self.limiter.wait()
+            try:
+                data = self.download(tickers, start_date)
+                if isinstance(data, pd.Series):
+                    data = data.to_frame(tickers[0])
+                return data
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                self.sleep(self.backoff * 2 ** attempt)
+
+    def clear_failures(self) -> None:
+        with self._lock:
+            self.failures = {}
+
+    def _record_failure(self, ticker: str, reason: str) -> None:
+        with self._lock:
+            self.failures[ticker] = reason
+
+    def _fetch_chunk(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        try:
+            data = self._attempt(tickers, start_date)
+        except Exception as exc:
+            if len(tickers) == 1:
+                self._record_failure(tickers[0], f"{type(exc).__name__}: {exc}")
+                return pd.DataFrame()
+
+            # Isolate the bad symbol(s) by retrying one ticker at a time.
+            parts = [self._fetch_chunk([ticker], start_date) for ticker in tickers]
+            return pd.concat(parts, axis=1)
+
+        present = []
+        for ticker in tickers:
+            if ticker not in data.columns or data[ticker].isna().all():
+                self._record_failure(ticker, "no data")
+            else:
+                present.append(ticker)
+
+        return data[present]
+
+    def fetch(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        chunks = [
+            tickers[i:i + self.chunk_size]
+            for i in range(0, len(tickers), self.chunk_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            parts = list(pool.map(lambda chunk: self._fetch_chunk(chunk, start_date), chunks))
+
+        parts = [part for part in parts if not part.empty]
+        if not parts:
+            return pd.DataFrame(columns=pd.Index([], name="Ticker"), dtype=float)
+
+        # Outer-join on dates so every ticker sits on one aligned calendar.
+        prices = pd.concat(parts, axis=1).sort_index()
+        columns = [ticker for ticker in tickers if ticker in prices.columns]
+        return prices[columns]
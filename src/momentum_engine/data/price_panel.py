@@ -0,0 +1,103 @@
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class PricePanel:
+    """
+    Dates x tickers price matrix backed by one contiguous NumPy array.
+
+    Row windows and single columns are returned as views of the same buffer;
+    only a non-contiguous ticker selection copies. Panels can be saved to a
+    directory and loaded back memory-mapped.
+    """
+
+    __slots__ = ("values", "dates", "tickers", "_positions")
+
+    def __init__(self, values: np.ndarray, dates, tickers):
+        if values.ndim != 2 or values.shape != (len(dates), len(tickers)):
+            raise ValueError("Panel values must be shaped (dates, tickers).")
+
+        self.values = values
+        self.dates = pd.DatetimeIndex(dates)
+        self.tickers = pd.Index([sys.intern(str(ticker)) for ticker in tickers])
+        self._positions = None
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, dtype=np.float64) -> "PricePanel":
+        values = np.ascontiguousarray(frame.to_numpy(dtype=dtype))
+        return cls(values, frame.index, frame.columns)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=self.dates, columns=self.tickers, copy=False)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    @property
+    def is_view(self) -> bool:
+        return self.values.base is not None
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def position(self, ticker: str) -> int:
+        if self._positions is None:
+            self._positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+        return self._positions[ticker]
+
+    def column(self, ticker: str) -> np.ndarray:
+        return self.values[:, self.position(ticker)]
+
+    def columns(self, tickers: list[str]) -> "PricePanel":
+        positions = np.array([self.position(ticker) for ticker in tickers], dtype=np.intp)
+
+        if len(positions) and np.array_equal(positions, np.arange(positions[0], positions[0] + len(positions))):
+            values = self.values[:, positions[0]:positions[0] + len(positions)]
+        else:
+            values = self.values[:, positions]
+
+        return PricePanel(values, self.dates, self.tickers[positions])
+
+    def rows(self, start: int, stop: int | None = None) -> "PricePanel":
+        return PricePanel(self.values[start:stop], self.dates[start:stop], self.tickers)
+
+    def window(self, start=None, end=None) -> "PricePanel":
+        """
+        Rows with ``start <= date <= end``; either bound may be omitted.
+        """
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start), side="left")
+        hi = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end), side="right")
+        return self.rows(lo, hi)
+
+    def row(self, position: int) -> pd.Series:
+        return pd.Series(self.values[position], index=self.tickers, copy=False)
+
+    def save(self, directory: str) -> None:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+
+        np.save(path / "values.npy", np.ascontiguousarray(self.values))
+        np.save(path / "dates.npy", self.dates.values.astype("datetime64[ns]"))
+        with open(path / "tickers.json", "w") as f:
+            json.dump(list(self.tickers), f)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "PricePanel":
+        path = Path(directory)
+        mode = "r" if mmap else None
+
+        values = np.load(path / "values.npy", mmap_mode=mode)
+        dates = np.load(path / "dates.npy")
+        with open(path / "tickers.json", "r") as f:
+            tickers = json.load(f)
+
+        return cls(values, dates, tickers)
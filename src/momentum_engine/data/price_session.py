@@ -0,0 +1,102 @@
+import pandas as pd
+
+from momentum_engine.core.profiling import NullProfiler
+from momentum_engine.data.resampler import MonthlyResampler
+from momentum_engine.data.yahoo_fetcher import YahooPriceFetcher
+
+
+class PriceSession:
+    """
+    Price cache shared by every stage of a single run.
+
+    Daily prices are fetched once per ticker and start date; monthly prices
+    are derived once per start date. Later requests are served as column
+    slices of the cached panels. ``hits`` and ``misses`` count how requests
+    were answered.
+    """
+
+    def __init__(self, fetcher=None, profiler=None):
+        self.fetcher = fetcher or YahooPriceFetcher
+        self.profiler = profiler or NullProfiler()
+        self.hits = 0
+        self.misses = 0
+
+        self._start: pd.Timestamp | None = None
+        self._daily: pd.DataFrame | None = None
+        self._requested: set[str] = set()
+        self._monthly: dict[pd.Timestamp, pd.DataFrame] = {}
+
+    def _load(self, tickers: list[str], start: pd.Timestamp) -> None:
+        if self._start is None or start < self._start:
+            # Earlier history needed: refetch everything known from the new start.
+            wanted = list(dict.fromkeys([*self._requested, *tickers]))
+            with self.profiler.stage("fetch", tickers=len(wanted)) as stage:
+                self._start = start
+                self._daily = self.fetcher.fetch(wanted, start_date=start.strftime("%Y-%m-%d"))
+                self._requested = set(wanted)
+                stage.shape(self._daily)
+        else:
+            missing = [ticker for ticker in tickers if ticker not in self._requested]
+            with self.profiler.stage("fetch", tickers=len(missing)) as stage:
+                fetched = self.fetcher.fetch(missing, start_date=self._start.strftime("%Y-%m-%d"))
+                self._daily = pd.concat([self._daily, fetched], axis=1).sort_index()
+                self._requested.update(missing)
+                stage.shape(fetched)
+
+        self._monthly.clear()
+
+    def _covers(self, tickers: list[str], start: pd.Timestamp) -> bool:
+        return (
+            self._start is not None
+            and start >= self._start
+            and all(ticker in self._requested for ticker in tickers)
+        )
+
+    def daily(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        start = pd.Timestamp(start_date)
+
+        if self._covers(tickers, start):
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._load(tickers, start)
+
+        columns = [ticker for ticker in tickers if ticker in self._daily.columns]
+        return self._daily.loc[start:, columns]
+
+    def monthly(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        start = pd.Timestamp(start_date)
+
+        if not self._covers(tickers, start):
+            self.misses += 1
+            self._load(tickers, start)
+        elif start in self._monthly:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        if start not in self._monthly:
+            with self.profiler.stage("resample") as stage:
+                self._monthly[start] = MonthlyResampler.to_monthly(self._daily.loc[start:])
+                stage.shape(self._monthly[start])
+
+        monthly = self._monthly[start]
+        columns = [ticker for ticker in tickers if ticker in monthly.columns]
+        return monthly[columns]
+
+    def rebased(self, tickers: list[str]) -> list[int] | None:
+        """
+        ``PriceStore.rebased`` counts of ``tickers``, or None when the
+        fetcher is not backed by a store.
+        """
+        rebased = getattr(self.fetcher, "rebased", None)
+        if rebased is None:
+            return None
+        return rebased(list(tickers))
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "tickers": len(self._requested),
+        }
@@ -0,0 +1,297 @@
+import hashlib
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.data.yahoo_fetcher import NoPriceDataError, YahooPriceFetcher
+
+
+PRICE_DTYPE = np.dtype([("date", "datetime64[D]"), ("close", "float64")])
+
+
+class PriceStore:
+    """
+    Persistent on-disk store of daily close prices.
+
+    One memory-mapped NumPy partition per ticker (``<TICKER>.npy``) plus a
+    ``manifest.json`` recording, per ticker, the earliest date its history
+    was requested from, the last stored date, the day it was last synced
+    and how many times stored history was rewritten (``rebased``).
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        path = self.directory / self.MANIFEST
+        if not path.exists():
+            return {}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _save_manifest(self) -> None:
+        path = self.directory / self.MANIFEST
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    def _partition(self, ticker: str) -> Path:
+        return self.directory / f"{ticker}.npy"
+
+    def entry(self, ticker: str) -> dict | None:
+        return self._manifest.get(ticker)
+
+    def last_date(self, ticker: str) -> pd.Timestamp | None:
+        entry = self.entry(ticker)
+        if entry is None or entry.get("last") is None:
+            return None
+        return pd.Timestamp(entry["last"])
+
+    def load(self, ticker: str) -> np.ndarray:
+        path = self._partition(ticker)
+        if not path.exists():
+            return np.empty(0, dtype=PRICE_DTYPE)
+        return np.load(path, mmap_mode="r")
+
+    def write(self, ticker: str, series: pd.Series, covered_from: str) -> None:
+        """
+        Merge ``series`` into the ticker partition.
+
+        Stored rows on or after the first new date are replaced, so a partial
+        bar saved intraday is overwritten by the refreshed one.
+        """
+        series = series.dropna()
+        existing = self.load(ticker)
+        previous = self._manifest.get(ticker, {})
+        rebased = previous.get("rebased", 0)
+
+        if len(series):
+            new_dates = series.index.values.astype("datetime64[D]")
+            if len(existing) and new_dates[0] <= existing["date"][0]:
+                # A refetch of the whole history (earlier start date).
+                rebased += 1
+            kept = np.array(existing[existing["date"] < new_dates[0]])
+
+            new = np.empty(len(series), dtype=PRICE_DTYPE)
+            new["date"] = new_dates
+            new["close"] = series.values
+            merged = np.concatenate([kept, new])
+
+            path = self._partition(ticker)
+            tmp = path.with_suffix(".tmp.npy")
+            np.save(tmp, merged)
+            os.replace(tmp, path)
+        else:
+            merged = existing
+
+        covered = min(filter(None, [previous.get("covered_from"), covered_from]))
+
+        self._manifest[ticker] = {
+            "covered_from": covered,
+            "last": str(merged["date"][-1]) if len(merged) else None,
+            "synced": date.today().isoformat(),
+            "rebased": rebased,
+        }
+
+    def rescale(self, ticker: str, factor: float) -> None:
+        """
+        Apply a back-adjustment factor to the whole stored history.
+        """
+        path = self._partition(ticker)
+        if not path.exists():
+            return
+
+        data = np.array(self.load(ticker))
+        data["close"] *= factor
+
+        tmp = path.with_suffix(".tmp.npy")
+        np.save(tmp, data)
+        os.replace(tmp, path)
+
+        entry = self._manifest[ticker]
+        entry["rebased"] = entry.get("rebased", 0) + 1
+
+    def commit(self) -> None:
+        self._save_manifest()
+
+    def version(self, tickers: list[str]) -> str:
+        """
+        Digest of the stored data for ``tickers``.
+
+        Built from each ticker's manifest coverage and the size and
+        modification time of its partition, so any write or rescale of one
+        of these tickers changes it and writes to other tickers do not.
+        """
+        digest = hashlib.sha256()
+        for ticker in sorted(set(tickers)):
+            entry = self.entry(ticker) or {}
+            path = self._partition(ticker)
+            stat = path.stat() if path.exists() else None
+
+            digest.update(json.dumps([
+                ticker,
+                entry.get("covered_from"),
+                entry.get("last"),
+                stat.st_size if stat else None,
+                stat.st_mtime_ns if stat else None,
+            ]).encode())
+
+        return digest.hexdigest()
+
+    def rebased(self, tickers: list[str]) -> list[int]:
+        """
+        Per-ticker count of rewrites of already-stored history (rescales
+        and full refetches).
+
+        Unlike ``version`` it does not move when new days are appended, so
+        anything derived incrementally from stored prices is stale exactly
+        when a ticker's count has changed.
+        """
+        return [(self.entry(ticker) or {}).get("rebased", 0) for ticker in tickers]
+
+    def read(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        start = np.datetime64(pd.Timestamp(start_date).date(), "D")
+
+        columns = {}
+        for ticker in tickers:
+            data = self.load(ticker)
+            if not len(data):
+                continue
+
+            data = data[data["date"] >= start]
+            columns[ticker] = pd.Series(
+                data["close"],
+                index=pd.DatetimeIndex(data["date"].astype("datetime64[ns]")),
+            )
+
+        if not columns:
+            return pd.DataFrame(columns=pd.Index([], name="Ticker"), dtype=float)
+
+        prices = pd.concat(columns, axis=1).sort_index()
+        prices.index.name = "Date"
+        prices.columns.name = "Ticker"
+        return prices
+
+
+class StoredPriceFetcher:
+    """
+    Drop-in replacement for ``YahooPriceFetcher`` backed by a ``PriceStore``.
+
+    Only the days missing from the store are requested from ``source``;
+    reads are always served from the store. With ``offline=True`` the source
+    is never called.
+    """
+
+    # Stored bars re-requested on each delta fetch. The older one is used to
+    # detect dividend/split back-adjustments made by Yahoo since the last sync.
+    OVERLAP_BARS = 2
+
+    def __init__(
+        self,
+        store: PriceStore,
+        source: Callable[[list[str], str], pd.DataFrame] = YahooPriceFetcher.fetch,
+        offline: bool = False,
+    ):
+        self.store = store
+        self.source = source
+        self.offline = offline
+
+    def _fetch_start(self, ticker: str, start_date: str) -> str | None:
+        """
+        Date to request ``ticker`` from, or None when the store is current.
+        """
+        entry = self.store.entry(ticker)
+        today = date.today().isoformat()
+
+        if entry is None or start_date < entry["covered_from"]:
+            return start_date
+
+        if entry["synced"] == today:
+            return None
+
+        if entry["last"] is None:
+            return start_date
+
+        stored = self.store.load(ticker)["date"]
+        overlap = stored[-self.OVERLAP_BARS:]
+        return str(overlap[0])
+
+    def sync(self, tickers: list[str], start_date: str) -> None:
+        start_date = pd.Timestamp(start_date).strftime("%Y-%m-%d")
+
+        groups: dict[str, list[str]] = {}
+        for ticker in tickers:
+            fetch_start = self._fetch_start(ticker, start_date)
+            if fetch_start is not None:
+                groups.setdefault(fetch_start, []).append(ticker)
+
+        for fetch_start, group in groups.items():
+            fetched = self.source(group, fetch_start)
+            if isinstance(fetched, pd.Series):
+                fetched = fetched.to_frame(group[0])
+
+            for ticker in group:
+                # Tickers the source could not return stay unsynced and are
+                # requested again on the next run.
+                if ticker not in fetched.columns:
+                    continue
+
+                series = fetched[ticker].dropna()
+                self._rebase(ticker, series, fetch_start)
+                self.store.write(ticker, series, covered_from=min(fetch_start, start_date))
+
+        self.store.commit()
+
+    def _rebase(self, ticker: str, series: pd.Series, fetch_start: str) -> None:
+        """
+        Rescale stored history when the overlapping bar no longer matches.
+        """
+        last = self.store.last_date(ticker)
+        if last is None or series.empty or pd.Timestamp(fetch_start) > last:
+            return
+
+        stored = self.store.load(ticker)
+        anchor = stored[stored["date"] == np.datetime64(fetch_start, "D")]
+        anchor_ts = pd.Timestamp(fetch_start)
+
+        if not len(anchor) or anchor_ts not in series.index:
+            return
+
+        factor = series[anchor_ts] / anchor["close"][0]
+        if not np.isclose(factor, 1.0, rtol=1e-9, atol=0.0):
+            self.store.rescale(ticker, factor)
+
+    def version(self, tickers: list[str], start_date: str) -> str:
+        """
+        Store version of ``tickers`` after bringing them up to date.
+        """
+        if not self.offline:
+            self.sync(tickers, start_date)
+        return self.store.version(tickers)
+
+    def rebased(self, tickers: list[str]) -> list[int]:
+        """
+        ``PriceStore.rebased`` of ``tickers`` as last synced.
+        """
+        return self.store.rebased(tickers)
+
+    def fetch(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        if not self.offline:
+            self.sync(tickers, start_date)
+
+        prices = self.store.read(tickers, start_date)
+
+        if prices.empty:
+            raise NoPriceDataError("No stored prices found for the requested tickers.")
+
+        return prices
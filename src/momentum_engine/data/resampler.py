@@ -1,11 +1,138 @@
+import threading
+
+import numpy as np
 import pandas as pd
 
 
+class CalendarResampler:
+    """
+    Resamples daily prices to weekly, monthly or quarterly bars labelled
+    with the last trading date of each period.
+
+    Period boundaries are found once per trading calendar (one
+    ``searchsorted`` of the calendar period edges against the date index)
+    and cached, so every later resample of a panel on the same calendar is
+    a NumPy gather of the boundary rows. ``last`` and ``first`` take the last/first valid
+    value of each column within the period, like ``resample().last()``.
+    The cache is shared by all threads (batch backtests, the query
+    service's refresh thread) and guarded by a lock.
+    """
+
+    FREQUENCIES = {
+        "weekly": "W-SUN",
+        "monthly": "ME",
+        "quarterly": "QE",
+    }
+
+    # Calendars kept in the boundary cache (oldest evicted first).
+    CACHE_SIZE = 32
+
+    _cache: dict[tuple, tuple[pd.DatetimeIndex, np.ndarray]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def period_ends(cls, index: pd.DatetimeIndex, frequency: str = "monthly") -> np.ndarray:
+        """
+        Positions of the last row of every non-empty period in ``index``.
+        """
+        if frequency not in cls.FREQUENCIES:
+            raise ValueError(f"Unsupported frequency: {frequency}")
+
+        index = pd.DatetimeIndex(index)
+        if len(index) == 0:
+            return np.array([], dtype=np.intp)
+
+        key = (frequency, len(index), index[0], index[-1])
+        with cls._lock:
+            cached = cls._cache.get(key)
+        if cached is not None and (cached[0] is index or cached[0].equals(index)):
+            return cached[1]
+
+        edges = pd.date_range(
+            index[0].normalize(),
+            index[-1].normalize(),
+            freq=cls.FREQUENCIES[frequency],
+        )
+        ends = index.searchsorted(edges + pd.Timedelta(days=1), side="left") - 1
+        ends = np.unique(np.append(ends[ends >= 0], len(index) - 1))
+
+        with cls._lock:
+            if key not in cls._cache and len(cls._cache) >= cls.CACHE_SIZE:
+                cls._cache.pop(next(iter(cls._cache)))
+            cls._cache[key] = (index, ends)
+        return ends
+
+    @classmethod
+    def period_starts(cls, index: pd.DatetimeIndex, frequency: str = "monthly") -> np.ndarray:
+        ends = cls.period_ends(index, frequency)
+        return np.concatenate([[0], ends[:-1] + 1]).astype(np.intp)
+
+    @classmethod
+    def _gather(cls, prices: pd.DataFrame, frequency: str, how: str) -> pd.DataFrame:
+        values = prices.to_numpy(dtype=float)
+        ends = cls.period_ends(prices.index, frequency)
+        starts = cls.period_starts(prices.index, frequency)
+
+        # Take the boundary row, then step inwards only for the cells that
+        # are still missing, until each is filled or leaves its period.
+        if how == "last":
+            anchor, step, limit = ends, -1, starts
+        else:
+            anchor, step, limit = starts, 1, ends
+
+        out = values[anchor]
+        periods, columns = np.nonzero(np.isnan(out))
+        rows = anchor[periods]
+
+        while len(periods):
+            rows = rows + step
+            inside = rows >= limit[periods] if step < 0 else rows <= limit[periods]
+            periods, columns, rows = periods[inside], columns[inside], rows[inside]
+
+            found = values[rows, columns]
+            hit = ~np.isnan(found)
+            out[periods[hit], columns[hit]] = found[hit]
+            periods, columns, rows = periods[~hit], columns[~hit], rows[~hit]
+
+        return pd.DataFrame(out, index=prices.index[ends], columns=prices.columns)
+
+    @classmethod
+    def last(cls, prices: pd.DataFrame, frequency: str = "monthly") -> pd.DataFrame:
+        return cls._gather(prices, frequency, "last")
+
+    @classmethod
+    def first(cls, prices: pd.DataFrame, frequency: str = "monthly") -> pd.DataFrame:
+        return cls._gather(prices, frequency, "first")
+
+    @classmethod
+    def ohlc(cls, prices: pd.DataFrame, frequency: str = "monthly") -> dict[str, pd.DataFrame]:
+        """
+        Open/high/low/close per period and column, keyed by field name.
+        """
+        starts = cls.period_starts(prices.index, frequency)
+        values = prices.to_numpy(dtype=float)
+        close = cls.last(prices, frequency)
+
+        with np.errstate(invalid="ignore"):
+            high = np.fmax.reduceat(values, starts, axis=0)
+            low = np.fmin.reduceat(values, starts, axis=0)
+
+        return {
+            "open": cls.first(prices, frequency),
+            "high": pd.DataFrame(high, index=close.index, columns=prices.columns),
+            "low": pd.DataFrame(low, index=close.index, columns=prices.columns),
+            "close": close,
+        }
+
+
 class MonthlyResampler:
     """
     Converts daily price data to month-end prices.
+
+    Rows are labelled with the last trading date of each month and hold
+    each ticker's last valid price in that month.
     """
 
     @staticmethod
     def to_monthly(prices: pd.DataFrame) -> pd.DataFrame:
-        return prices.resample("ME").last()
\ No newline at end of file
+        return CalendarResampler.last(prices, "monthly")
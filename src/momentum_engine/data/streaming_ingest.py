@@ -0,0 +1,145 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.core.profiling import NullProfiler
+from momentum_engine.data.price_panel import PricePanel
+from momentum_engine.data.resampler import CalendarResampler
+from momentum_engine.data.yahoo_fetcher import NoPriceDataError
+
+
+class StreamingMonthlyIngest:
+    """
+    Builds an on-disk month-end panel without holding the daily panel of the
+    whole universe in memory.
+
+    Tickers are fetched in chunks sized so that one chunk's daily panel
+    (times ``OVERHEAD`` for the copies made while fetching and resampling)
+    fits in ``max_bytes``. Each chunk is reduced to month-end bars and
+    written into a memory-mapped month x ticker matrix; month labels are the
+    latest trading date seen for the month in any chunk. The result is the
+    same panel ``MonthlyResampler.to_monthly`` gives on the full daily
+    frame, saved in the ``PricePanel`` layout so ``PricePanel.load``
+    memory-maps it.
+
+    Tickers left out of the panel are reported in ``failures`` (ticker to
+    reason), as ``ChunkedPriceFetcher`` does: every ticker of a chunk the
+    fetcher had no prices for, and tickers a chunk's result did not
+    include. Any other fetch error propagates.
+    """
+
+    # Peak bytes per daily cell in a chunk: fetched frame, float copy,
+    # resample gather and its NaN mask.
+    OVERHEAD = 4
+
+    def __init__(
+        self,
+        fetcher,
+        directory: str,
+        max_bytes: int = 256 * 1024**2,
+        profiler=None,
+    ):
+        self.fetcher = fetcher
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.profiler = profiler or NullProfiler()
+        self.failures: dict[str, str] = {}
+
+    @staticmethod
+    def _months(start: pd.Timestamp, end: pd.Timestamp) -> pd.PeriodIndex:
+        return pd.period_range(start.to_period("M"), end.to_period("M"), freq="M")
+
+    def chunk_size(self, n_days: int, n_tickers: int, n_months: int) -> int:
+        """
+        Tickers per chunk for ``n_days`` of history within the byte budget.
+
+        The month-end panel itself (read back once at the end) is charged
+        to the budget too.
+        """
+        available = self.max_bytes - n_months * n_tickers * np.dtype(float).itemsize * 2
+        per_ticker = n_days * np.dtype(float).itemsize * self.OVERHEAD
+
+        if available < per_ticker:
+            raise ValueError(
+                f"max_bytes={self.max_bytes:,} is too small: one ticker needs "
+                f"~{per_ticker:,} bytes next to a {n_months}x{n_tickers} month-end panel."
+            )
+        return int(min(n_tickers, available // per_ticker))
+
+    def run(self, tickers: list[str], start_date: str, end_date: str | None = None) -> PricePanel:
+        tickers = list(dict.fromkeys(tickers))
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date or pd.Timestamp.today()).normalize()
+
+        months = self._months(start, end)
+        n_days = int(np.busday_count(start.date(), (end + pd.Timedelta(days=1)).date()))
+        size = self.chunk_size(n_days, len(tickers), len(months))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        scratch = self.directory / "values.tmp.npy"
+        values = np.lib.format.open_memmap(scratch, mode="w+", dtype=float, shape=(len(months), len(tickers)))
+        values[:] = np.nan
+
+        labels = np.full(len(months), np.datetime64("NaT"), dtype="datetime64[ns]")
+        returned = np.zeros(len(tickers), dtype=bool)
+        self.failures = {}
+
+        for lo in range(0, len(tickers), size):
+            chunk = tickers[lo:lo + size]
+
+            with self.profiler.stage("ingest.chunk", tickers=len(chunk)) as stage:
+                try:
+                    daily = self.fetcher.fetch(chunk, start_date=start.strftime("%Y-%m-%d"))
+                except NoPriceDataError as exc:
+                    self.failures.update(dict.fromkeys(chunk, f"chunk skipped: {exc}"))
+                    continue
+                daily = daily.loc[:end]
+                stage.shape(daily)
+
+                if daily.empty:
+                    self.failures.update(dict.fromkeys(chunk, "chunk skipped: no prices"))
+                    continue
+
+                monthly = CalendarResampler.last(daily, "monthly")
+                del daily
+
+                rows = months.get_indexer(monthly.index.to_period("M"))
+                columns = pd.Index(chunk).get_indexer(monthly.columns)
+                keep = columns >= 0
+
+                values[np.ix_(rows, lo + columns[keep])] = monthly.to_numpy(dtype=float)[:, keep]
+                returned[lo + columns[keep]] = True
+                labels[rows] = np.fmax(labels[rows], monthly.index.values)
+
+        values.flush()
+
+        # Months with no trading day in any chunk and tickers the fetcher
+        # never returned are dropped, as in the in-memory path.
+        rows = np.flatnonzero(~np.isnat(labels))
+        columns = np.flatnonzero(returned)
+        for i in np.flatnonzero(~returned):
+            self.failures.setdefault(tickers[i], "no data")
+
+        panel = PricePanel(
+            np.ascontiguousarray(values[np.ix_(rows, columns)]),
+            labels[rows],
+            [tickers[i] for i in columns],
+        )
+        del values
+        os.remove(scratch)
+
+        panel.save(self.directory)
+        with open(self.directory / "ingest.json", "w") as f:
+            json.dump({
+                "start_date": start.strftime("%Y-%m-%d"),
+                "end_date": end.strftime("%Y-%m-%d"),
+                "requested": len(tickers),
+                "chunk_size": size,
+                "max_bytes": self.max_bytes,
+                "failures": self.failures,
+            }, f, indent=2)
+
+        return PricePanel.load(self.directory)
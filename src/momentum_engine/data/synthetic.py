@@ -0,0 +1,78 @@
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+
+class SyntheticPriceFetcher:
+    """
+    Offline stand-in for ``YahooPriceFetcher``.
+
+    Generates a deterministic business-day random walk per ticker (seeded
+    from the ticker name) up to ``end_date``, and records every request in
+    ``calls`` so callers can check exactly which days were asked for.
+
+    ``latency`` delays each request; any request containing a ticker in
+    ``failing`` raises, and the first ``transient_errors`` requests raise
+    regardless, to exercise retry and fault-isolation paths.
+    """
+
+    def __init__(
+        self,
+        end_date: str | None = None,
+        seed: int = 0,
+        latency: float = 0.0,
+        failing: set[str] | None = None,
+        transient_errors: int = 0,
+        origin: str = "1990-01-01",
+    ):
+        self.end_date = pd.Timestamp(end_date or pd.Timestamp.today()).normalize()
+        self.seed = seed
+        self.latency = latency
+        self.failing = set(failing or ())
+        self.transient_errors = transient_errors
+        self.origin = pd.Timestamp(origin)
+        self.calls: list[tuple[list[str], str]] = []
+        self._lock = threading.Lock()
+        self._calendar: tuple[pd.Timestamp, pd.DatetimeIndex] | None = None
+
+    def _dates(self) -> pd.DatetimeIndex:
+        # Every path starts at ``origin`` so that overlapping requests always
+        # agree on the prices they share; the calendar is built once per end date.
+        if self._calendar is None or self._calendar[0] != self.end_date:
+            self._calendar = (self.end_date, pd.bdate_range(self.origin, self.end_date))
+        return self._calendar[1]
+
+    def _path(self, ticker: str, length: int) -> np.ndarray:
+        rng = np.random.default_rng([self.seed, zlib.crc32(ticker.encode())])
+        returns = rng.normal(0.0004, 0.02, length)
+        return 100 * np.exp(np.cumsum(returns))
+
+    def fetch(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        with self._lock:
+            self.calls.append((list(tickers), start_date))
+            transient = self.transient_errors > 0
+            self.transient_errors -= transient
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if transient:
+            raise ConnectionError("synthetic transient error")
+
+        bad = self.failing.intersection(tickers)
+        if bad:
+            raise ValueError(f"synthetic failure for {sorted(bad)}")
+
+        dates = self._dates()
+        first = dates.searchsorted(pd.Timestamp(start_date))
+
+        values = np.empty((len(dates) - first, len(tickers)))
+        for column, ticker in enumerate(tickers):
+            values[:, column] = self._path(ticker, len(dates))[first:]
+
+        prices = pd.DataFrame(values, index=dates[first:], columns=list(tickers))
+        prices.index.name = "Date"
+        return prices
@@ -1,14 +1,24 @@
-import yfinance as yf
 import pandas as pd
 
 
+class NoPriceDataError(ValueError):
+    """
+    A fetch returned no prices for any of the requested tickers.
+    """
+
+
 class YahooPriceFetcher:
     """
     Fetches adjusted daily price data from Yahoo Finance.
+
+    ``yfinance`` is imported on the first download, so store-backed
+    (``--offline``) runs never load it.
     """
 
     @staticmethod
     def fetch(tickers: list[str], start_date: str) -> pd.DataFrame:
+        import yfinance as yf
+
         data = yf.download(
             tickers,
             start=start_date,
@@ -17,6 +27,6 @@ class YahooPriceFetcher:
         )
 
         if "Close" not in data:
-            raise ValueError("Close prices not found in Yahoo response.")
+            raise NoPriceDataError("Close prices not found in Yahoo response.")
 
         return data["Close"]
\ No newline at end of file
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from momentum_engine.ranking.panel_ranker import PanelRanker
+
 
 class DecisionReport:
     """
@@ -7,15 +10,21 @@ class DecisionReport:
     """
 
     @staticmethod
-    def generate(signal: pd.Series, ranked: pd.Series, top_n: int) -> pd.DataFrame:
+    def generate(signal: pd.Series, top_n: int) -> pd.DataFrame:
+        ranking = PanelRanker.rank(signal.to_numpy(dtype=float), top_n=top_n)
+        ranks = ranking.ranks[0]
+        valid = ~np.isnan(ranks)
+        order = np.argsort(ranks[valid], kind="stable")
+
         df = pd.DataFrame({
-            "ticker": ranked.index,
-            "momentum_12_1": ranked.values
+            "ticker": signal.index[valid][order],
+            "momentum_12_1": signal.to_numpy()[valid][order],
         })
 
-        df["rank"] = range(1, len(df) + 1)
+        df["rank"] = ranks[valid][order].astype(int)
+        df["percentile"] = ranking.percentiles[0][valid][order]
         df["cutoff_rank"] = top_n
-        df["selected"] = df["rank"] <= top_n
+        df["selected"] = ranking.top_n[0][valid][order]
         df["universe_size"] = len(signal)
 
-        return df
\ No newline at end of file
+        return df
@@ -1,11 +1,78 @@
+import base64
+import json
+
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.io as pio
 from pathlib import Path
-
-from momentum_engine.data.yahoo_fetcher import YahooPriceFetcher
-from momentum_engine.data.resampler import MonthlyResampler
-from momentum_engine.signals.momentum_12_1 import Momentum12_1
+from typing import TYPE_CHECKING
+
+from momentum_engine.core.profiling import NullProfiler
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.signals.registry import SignalContext
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# Decodes the shared data block and draws each section's charts with WebGL
+# traces once the section scrolls into view.
+_COMPACT_SCRIPT = r"""
+(function () {
+  var block = JSON.parse(document.getElementById("series-data").textContent);
+
+  function decode(b64, Type) {
+    var raw = atob(b64), bytes = new Uint8Array(raw.length);
+    for (var i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+    return new Type(bytes.buffer);
+  }
+
+  var days = decode(block.dates, Int32Array);
+  var prices = decode(block.prices, Float32Array);
+  var momentum = decode(block.momentum, Float32Array);
+  var n = days.length;
+  var dates = Array.from(days, function (d) { return new Date(d * 86400000).toISOString().slice(0, 10); });
+
+  function column(values, k) {
+    var x = [], y = [];
+    for (var i = 0; i < n; i++) {
+      var v = values[k * n + i];
+      if (!isNaN(v)) { x.push(dates[i]); y.push(v); }
+    }
+    return {x: x, y: y};
+  }
+
+  function draw(id, ticker, series, title, yTitle, height, symbol, zeroLine) {
+    var last = series.x.length - 1;
+    var layout = {
+      title: ticker + title, height: height, plot_bgcolor: "white",
+      xaxis: {title: "Date", gridcolor: "#ebf0f8"}, yaxis: {title: yTitle, gridcolor: "#ebf0f8"},
+      margin: {l: 40, r: 20, t: 50, b: 40}
+    };
+    if (zeroLine) {
+      layout.shapes = [{type: "line", xref: "paper", x0: 0, x1: 1, y0: 0, y1: 0, line: {width: 1, dash: "dash"}}];
+    }
+    Plotly.newPlot(id, [
+      {type: "scattergl", mode: "lines", name: yTitle === "Price" ? "Monthly Price" : yTitle, x: series.x, y: series.y, line: {width: 2}},
+      {type: "scattergl", mode: "markers", name: "Latest", x: [series.x[last]], y: [series.y[last]], marker: {size: 10, symbol: symbol}}
+    ], layout, {responsive: true});
+  }
+
+  function render(el) {
+    var k = Number(el.dataset.series), ticker = block.tickers[k];
+    draw("price-" + k, ticker, column(prices, k), " - Monthly Price (2010-present)", "Price", 360, "circle", false);
+    draw("momentum-" + k, ticker, column(momentum, k), " - 12-1 Momentum History", "MOM_12_1", 320, "diamond", true);
+  }
+
+  var charts = document.querySelectorAll("[data-series]");
+  if (!("IntersectionObserver" in window)) { charts.forEach(render); return; }
+  var observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) { observer.unobserve(entry.target); render(entry.target); }
+    });
+  }, {rootMargin: "400px"});
+  charts.forEach(function (el) { observer.observe(el); });
+})();
+"""
 
 
 class MomentumDiagnostics:
@@ -17,12 +84,40 @@ class MomentumDiagnostics:
     - Full historical 12-1 momentum history
     - Latest month highlight
     - Current rank and latest MOM_12_1 value
+
+    ``mode="full"`` (default) renders one server-side Plotly figure per
+    chart. ``mode="compact"`` writes every series once into a base64
+    float32 data block and draws WebGL charts in the browser from it, so
+    build time and file size grow with the data rather than with one
+    embedded Plotly figure per chart; histories longer than ``max_points``
+    rows are decimated, always keeping the latest bar. ``plotlyjs`` is passed through as
+    ``include_plotlyjs`` (``"inline"`` or ``"cdn"``).
     """
 
-    def __init__(self, selected_tickers: list[str], ranked_signal: pd.Series, output_directory: str):
+    MODES = ("full", "compact")
+
+    def __init__(
+        self,
+        selected_tickers: list[str],
+        ranked_signal: pd.Series,
+        output_directory: str,
+        session: PriceSession = None,
+        profiler=None,
+        mode: str = "full",
+        max_points: int = 600,
+        plotlyjs: str = "inline",
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported report mode: {mode}")
+
         self.selected_tickers = selected_tickers
         self.ranked_signal = ranked_signal
         self.output_directory = Path(output_directory)
+        self.session = session or PriceSession()
+        self.profiler = profiler or NullProfiler()
+        self.mode = mode
+        self.max_points = max_points
+        self.plotlyjs = plotlyjs
 
     def _compute_full_momentum_series(
         self,
@@ -36,19 +131,17 @@ class MomentumDiagnostics:
         Formula matches Momentum12_1.compute():
         monthly.shift(skip) / monthly.shift(lookback + skip) - 1
         """
-        signal_model = Momentum12_1(lookback=lookback, skip=skip)
-        return (
-            monthly_prices.shift(signal_model.skip)
-            / monthly_prices.shift(signal_model.lookback + signal_model.skip)
-            - 1
-        )
+        context = SignalContext(monthly_prices)
+        return context.frame(context.momentum(lookback, skip))
 
     def _rank_of(self, ticker: str) -> int | None:
         if ticker not in self.ranked_signal.index:
             return None
         return int(self.ranked_signal.index.get_loc(ticker)) + 1
 
-    def _build_price_chart(self, ticker: str, series: pd.Series) -> go.Figure:
+    def _build_price_chart(self, ticker: str, series: pd.Series) -> "go.Figure":
+        import plotly.graph_objects as go
+
         latest_date = series.index[-1]
         latest_value = series.iloc[-1]
 
@@ -83,7 +176,9 @@ class MomentumDiagnostics:
 
         return fig
 
-    def _build_momentum_chart(self, ticker: str, series: pd.Series) -> go.Figure:
+    def _build_momentum_chart(self, ticker: str, series: pd.Series) -> "go.Figure":
+        import plotly.graph_objects as go
+
         latest_date = series.index[-1]
         latest_value = series.iloc[-1]
 
@@ -119,24 +214,26 @@ class MomentumDiagnostics:
 
         return fig
 
-    def generate(self) -> str:
-        if not self.selected_tickers:
-            raise ValueError("No selected tickers provided for diagnostics.")
+    def _ranked_selected(self) -> list[str]:
+        # Always render sections in explicit rank order (1 -> N).
+        selected_set = set(self.selected_tickers)
+        return [ticker for ticker in self.ranked_signal.index if ticker in selected_set]
 
-        self.output_directory.mkdir(parents=True, exist_ok=True)
+    def _meta_text(self, ticker: str) -> str:
+        current_rank = self._rank_of(ticker)
+        current_momentum = self.ranked_signal[ticker] if ticker in self.ranked_signal.index else float("nan")
 
-        prices = YahooPriceFetcher.fetch(self.selected_tickers, start_date="2010-01-01")
-        monthly = MonthlyResampler.to_monthly(prices)
-        momentum_history = self._compute_full_momentum_series(monthly, lookback=12, skip=1)
+        rank_text = "NA" if current_rank is None else str(current_rank)
+        mom_text = f"{current_momentum:.4f}" if pd.notna(current_momentum) else "NA"
+        return f"Current Rank: {rank_text} | Current MOM_12_1: {mom_text}"
 
-        # Always render sections in explicit rank order (1 -> N).
-        selected_set = set(self.selected_tickers)
-        ranked_selected = [ticker for ticker in self.ranked_signal.index if ticker in selected_set]
+    def _render_sections(self, monthly: pd.DataFrame, momentum_history: pd.DataFrame) -> list[str]:
+        import plotly.io as pio
 
         sections: list[str] = []
-        include_plotlyjs = True
+        include_plotlyjs = "cdn" if self.plotlyjs == "cdn" else True
 
-        for ticker in ranked_selected:
+        for ticker in self._ranked_selected():
             if ticker not in monthly.columns:
                 continue
 
@@ -146,9 +243,6 @@ class MomentumDiagnostics:
             if price_series.empty or momentum_series.empty:
                 continue
 
-            current_rank = self._rank_of(ticker)
-            current_momentum = self.ranked_signal[ticker] if ticker in self.ranked_signal.index else float("nan")
-
             price_fig = self._build_price_chart(ticker, price_series)
             momentum_fig = self._build_momentum_chart(ticker, momentum_series)
 
@@ -167,19 +261,88 @@ class MomentumDiagnostics:
                 default_height="320px",
             )
 
-            rank_text = "NA" if current_rank is None else str(current_rank)
-            mom_text = f"{current_momentum:.4f}" if pd.notna(current_momentum) else "NA"
-
             section = f"""
 <section class=\"ticker-section\">
   <h2>{ticker}</h2>
-  <p class=\"meta\">Current Rank: {rank_text} | Current MOM_12_1: {mom_text}</p>
+  <p class=\"meta\">{self._meta_text(ticker)}</p>
   <div class=\"chart\">{price_html}</div>
   <div class=\"chart\">{momentum_html}</div>
 </section>
 """
             sections.append(section)
 
+        return sections
+
+    @staticmethod
+    def _decimate(n_rows: int, max_points: int) -> np.ndarray:
+        """
+        Row positions to keep: every k-th row plus the last row, so the
+        latest point survives decimation.
+        """
+        if n_rows <= max_points:
+            return np.arange(n_rows)
+
+        step = -(-n_rows // max_points)
+        keep = np.arange(0, n_rows, step)
+        if keep[-1] != n_rows - 1:
+            keep = np.append(keep, n_rows - 1)
+        return keep
+
+    @staticmethod
+    def _encode(values: np.ndarray, dtype) -> str:
+        return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode("ascii")
+
+    def _render_compact(self, monthly: pd.DataFrame, momentum_history: pd.DataFrame) -> list[str]:
+        from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+        tickers = [
+            ticker for ticker in self._ranked_selected()
+            if ticker in monthly.columns
+            and monthly[ticker].notna().any()
+            and ticker in momentum_history.columns
+            and momentum_history[ticker].notna().any()
+        ]
+
+        keep = self._decimate(len(monthly.index), self.max_points)
+        days = monthly.index.values[keep].astype("datetime64[D]").astype(np.int32)
+
+        # Columnar block: one shared date axis, then price and momentum
+        # columns in section order, all as little-endian binary.
+        block = {
+            "dates": self._encode(days, "<i4"),
+            "prices": self._encode(monthly[tickers].to_numpy(dtype=np.float32)[keep].T, "<f4"),
+            "momentum": self._encode(
+                momentum_history[tickers].to_numpy(dtype=np.float32)[keep].T, "<f4"
+            ),
+            "tickers": tickers,
+        }
+
+        sections = [
+            f"""
+<section class=\"ticker-section\">
+  <h2>{ticker}</h2>
+  <p class=\"meta\">{self._meta_text(ticker)}</p>
+  <div class=\"chart\" id=\"price-{i}\" data-series=\"{i}\" style=\"height:360px\"></div>
+  <div class=\"chart\" id=\"momentum-{i}\" style=\"height:320px\"></div>
+</section>
+"""
+            for i, ticker in enumerate(tickers)
+        ]
+
+        if self.plotlyjs == "cdn":
+            bundle = f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+        else:
+            bundle = f"<script>{get_plotlyjs()}</script>"
+
+        sections.append(f"""
+{bundle}
+<script id=\"series-data\" type=\"application/json\">{json.dumps(block)}</script>
+<script>{_COMPACT_SCRIPT}</script>
+""")
+
+        return sections
+
+    def _write_html(self, sections: list[str]) -> str:
         html = f"""
 <!DOCTYPE html>
 <html lang=\"en\">
@@ -209,3 +372,26 @@ class MomentumDiagnostics:
         output_path.write_text(html, encoding="utf-8")
 
         return str(output_path)
+
+    def generate(self) -> str:
+        if not self.selected_tickers:
+            raise ValueError("No selected tickers provided for diagnostics.")
+
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+
+        with self.profiler.stage("diagnostics.data") as stage:
+            monthly = self.session.monthly(self.selected_tickers, start_date="2010-01-01")
+            stage.shape(monthly)
+
+        with self.profiler.stage("diagnostics.momentum_history") as stage:
+            momentum_history = self._compute_full_momentum_series(monthly, lookback=12, skip=1)
+            stage.shape(momentum_history)
+
+        with self.profiler.stage("diagnostics.render", tickers=len(self.selected_tickers), mode=self.mode):
+            if self.mode == "compact":
+                sections = self._render_compact(monthly, momentum_history)
+            else:
+                sections = self._render_sections(monthly, momentum_history)
+
+        with self.profiler.stage("diagnostics.write"):
+            return self._write_html(sections)
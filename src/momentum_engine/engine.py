@@ -1,64 +1,171 @@
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from momentum_engine.core.config import ConfigLoader
+from momentum_engine.core.profiling import NullProfiler
 from momentum_engine.universe.nifty100 import Nifty100Universe
-from momentum_engine.data.yahoo_fetcher import YahooPriceFetcher
+from momentum_engine.data.price_session import PriceSession
 from momentum_engine.data.resampler import MonthlyResampler
 from momentum_engine.signals.momentum_12_1 import Momentum12_1
+from momentum_engine.signals.live_state import LiveSignalState
 from momentum_engine.ranking.cross_sectional_ranker import CrossSectionalRanker
 from momentum_engine.portfolio.equal_weight import EqualWeightPortfolio
+from momentum_engine.portfolio.weighting import PortfolioWeighter
 from momentum_engine.decision.decision_report import DecisionReport
 from momentum_engine.decision.diagnostics import MomentumDiagnostics
 
 
 class LiveMomentumEngine:
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, session: PriceSession = None, profiler=None):
         self.config = ConfigLoader(config_path).load()
+        self.session = session or PriceSession()
+        self.profiler = profiler or NullProfiler()
 
-    def run(self) -> None:
-        # Universe
+        self.lookback = self.config["momentum"]["lookback_months"]
+        self.skip = self.config["momentum"]["skip_recent_months"]
+        self.top_n = self.config["portfolio"]["top_n"]
+        self.weighting = self.config["portfolio"].get("weighting", "equal")
+        self.output_dir = self.config["output"]["directory"]
+        self.report_mode = self.config["output"].get("report_mode", "full")
+
+    def _tickers(self) -> list[str]:
         universe_name = self.config["universe"]["name"]
 
         if universe_name != "nifty100":
             raise ValueError(f"Unsupported universe: {universe_name}")
 
-        tickers = Nifty100Universe.get_tickers()
+        return Nifty100Universe.get_tickers()
+
+    def _weights(self, ranked: pd.Series, monthly: pd.DataFrame | None) -> dict[str, float]:
+        """
+        Top-N weights: equal, or per ``portfolio.weighting`` from the
+        trailing covariance of ``monthly`` (history up to the decision month).
+        """
+        weights = EqualWeightPortfolio.construct(ranked.index.tolist(), self.top_n)
+        if self.weighting == "equal" or monthly is None:
+            return weights
+
+        weighter = PortfolioWeighter.from_config(self.config["portfolio"], monthly.to_numpy(dtype=float))
+        columns = monthly.columns.get_indexer(list(weights))
+        return dict(zip(weights, weighter.weights(len(monthly) - 1, columns).round(6)))
+
+    def _write_decision(
+        self,
+        signal: pd.Series,
+        ranked: pd.Series,
+        date_str: str,
+        monthly: pd.DataFrame | None = None,
+    ):
+        weights = self._weights(ranked, monthly)
+        decision_df = DecisionReport.generate(signal, self.top_n)
+        decision_df["weight"] = decision_df["ticker"].map(weights).fillna(0.0)
+
+        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+
+        decision_path = f"{self.output_dir}/{date_str}_decision.csv"
+        decision_df.to_csv(decision_path, index=False)
+
+        return weights, decision_path
+
+    def run(self) -> None:
+        # Universe
+        tickers = self._tickers()
 
         # Data
-        start_date = self.config["data"]["start_date"]
-        prices = YahooPriceFetcher.fetch(tickers, start_date=start_date)
-        monthly = MonthlyResampler.to_monthly(prices)
+        with self.profiler.stage("live.data") as stage:
+            start_date = self.config["data"]["start_date"]
+            monthly = self.session.monthly(tickers, start_date=start_date)
+            stage.shape(monthly)
 
         # Signal
-        lookback = self.config["momentum"]["lookback_months"]
-        skip = self.config["momentum"]["skip_recent_months"]
-        signal = Momentum12_1(lookback, skip).compute(monthly)
+        with self.profiler.stage("live.signal") as stage:
+            signal = Momentum12_1(self.lookback, self.skip).compute(monthly)
+            stage.shape(signal)
 
         # Ranking
-        ranked = CrossSectionalRanker.rank(signal)
+        with self.profiler.stage("live.ranking"):
+            ranked = CrossSectionalRanker.rank(signal)
 
-        # Portfolio
-        top_n = self.config["portfolio"]["top_n"]
-        weights = EqualWeightPortfolio.construct(ranked.index.tolist(), top_n)
+        # Portfolio + decision report
+        with self.profiler.stage("live.decision"):
+            date_str = datetime.today().strftime("%Y-%m-%d")
+            weights, decision_path = self._write_decision(signal, ranked, date_str, monthly)
 
-        # Decision report
-        decision_df = DecisionReport.generate(signal, ranked, top_n)
+        # Diagnostics report (reporting-only; does not alter ranking/selection logic)
+        with self.profiler.stage("live.diagnostics"):
+            diagnostics = MomentumDiagnostics(
+                selected_tickers=list(weights.keys()),
+                ranked_signal=ranked,
+                output_directory=self.output_dir,
+                session=self.session,
+                profiler=self.profiler,
+                mode=self.report_mode,
+            )
+            diagnostics.generate()
 
-        output_dir = self.config["output"]["directory"]
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        return weights, decision_path
 
-        date_str = datetime.today().strftime("%Y-%m-%d")
-        decision_path = f"{output_dir}/{date_str}_decision.csv"
-        decision_df.to_csv(decision_path, index=False)
+    # -------------------------
+    # Incremental (watch) mode
+    # -------------------------
 
-        # Diagnostics report (reporting-only; does not alter ranking/selection logic)
-        diagnostics = MomentumDiagnostics(
-            selected_tickers=list(weights.keys()),
-            ranked_signal=ranked,
-            output_directory=output_dir,
-        )
-        diagnostics.generate()
+    @staticmethod
+    def _closed_months(monthly: pd.DataFrame, today: pd.Timestamp) -> pd.DataFrame:
+        return monthly.loc[monthly.index.to_period("M") < today.to_period("M")]
 
-        return weights, decision_path
+    def seed_state(self, today: pd.Timestamp | None = None) -> LiveSignalState:
+        """
+        Build the rolling state from full history, up to the last closed month.
+        """
+        today = pd.Timestamp(today or datetime.today())
+        start_date = self.config["data"]["start_date"]
+
+        monthly = self.session.monthly(self._tickers(), start_date=start_date)
+        closed = self._closed_months(monthly, today)
+
+        state = LiveSignalState.from_monthly(closed, self.lookback, self.skip)
+        state.rebased = self.session.rebased(state.tickers)
+        return state
+
+    def update_state(self, state: LiveSignalState, today: pd.Timestamp | None = None) -> list[str]:
+        """
+        Append any month closed since the state's last bar and write a
+        decision CSV for each. Only the last couple of months are fetched,
+        unless the store has rescaled a ticker's history since the state
+        was built: the buffered months are then re-read first.
+        """
+        today = pd.Timestamp(today or datetime.today())
+        start = (state.last_date - pd.DateOffset(months=1)).replace(day=1)
+        if self.weighting != "equal":
+            # Covariance-based weights need the trailing window as well.
+            window = self.config["portfolio"].get("covariance_window", 36)
+            start = (state.last_date - pd.DateOffset(months=window + 1)).replace(day=1)
+
+        # Straight to the fetcher: the session would serve stale cached bars.
+        daily = self.session.fetcher.fetch(state.tickers.tolist(), start_date=start.strftime("%Y-%m-%d"))
+
+        rebased = self.session.rebased(state.tickers)
+        if rebased is not None and not np.array_equal(rebased, state.rebased):
+            # The fetch above synced the store, so this read is local.
+            start = min(start, (state.last_date - pd.DateOffset(months=state.size)).replace(day=1))
+            daily = self.session.fetcher.fetch(state.tickers.tolist(), start_date=start.strftime("%Y-%m-%d"))
+            monthly = MonthlyResampler.to_monthly(daily)
+            state.reset(monthly.loc[monthly.index.to_period("M") <= state.last_date.to_period("M")])
+            state.rebased = rebased
+
+        closed = self._closed_months(MonthlyResampler.to_monthly(daily), today)
+        new_bars = closed.loc[closed.index.to_period("M") > state.last_date.to_period("M")]
+
+        paths = []
+        for date, prices in new_bars.iterrows():
+            ranked = state.append(date, prices)
+            _, decision_path = self._write_decision(
+                state.signal, ranked, date.strftime("%Y-%m-%d"), closed.loc[:date]
+            )
+            paths.append(decision_path)
+
+        return paths
@@ -0,0 +1,314 @@
+import numpy as np
+
+
+WEIGHTINGS = ("equal", "inverse_vol", "min_variance", "risk_parity")
+
+
+class RollingCovariance:
+    """
+    Trailing-window covariance of monthly log returns, updated incrementally.
+
+    Running sums over the window are kept for the currently tracked names
+    (the last requested selection): cross products ``X'X``, pairwise sums
+    ``X'M`` and pairwise counts ``M'M`` (``X`` is returns with missing
+    values as 0, ``M`` the observed mask). Moving the window end forward
+    adds the rows that enter and subtracts the rows that leave; when the
+    selection changes, retained names keep their sums and only the rows and
+    columns of newly selected names are computed from the window. Each
+    rebalance therefore costs O(selection^2) rather than a full recompute
+    over the window or the whole universe. The result equals
+    ``DataFrame.cov`` (pairwise-complete) on the window.
+    """
+
+    def __init__(self, values: np.ndarray, window: int = 36):
+        if window < 2:
+            raise ValueError("Covariance window must be at least 2 months")
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.log(values[1:] / values[:-1])
+
+        # Row t holds the return from month t-1 to t; row 0 has none.
+        observed = np.zeros(values.shape, dtype=bool)
+        observed[1:] = np.isfinite(returns)
+        self.returns = np.zeros(values.shape)
+        self.returns[1:] = np.where(observed[1:], returns, 0.0)
+        self.observed = observed.astype(float)
+
+        self.window = window
+        self.end = -1
+        self.tracked = np.array([], dtype=np.intp)
+        self.products = self.sums = self.counts = np.zeros((0, 0))
+
+    def _bounds(self, end: int) -> tuple[int, int]:
+        return max(end - self.window + 1, 0), end + 1
+
+    def _cross(self, lo: int, hi: int, left: np.ndarray, right: np.ndarray):
+        x, m = self.returns[lo:hi], self.observed[lo:hi]
+        return (
+            x[:, left].T @ x[:, right],
+            x[:, left].T @ m[:, right],
+            m[:, left].T @ m[:, right],
+        )
+
+    def _update(self, lo: int, hi: int, sign: float) -> None:
+        if hi <= lo or not len(self.tracked):
+            return
+        products, sums, counts = self._cross(lo, hi, self.tracked, self.tracked)
+        self.products += sign * products
+        self.sums += sign * sums
+        self.counts += sign * counts
+
+    def advance(self, row: int) -> None:
+        """
+        Move the window to the ``window`` returns ending at ``row``.
+        """
+        if row < self.end:
+            raise ValueError("RollingCovariance only moves forward")
+
+        old_lo, old_hi = self._bounds(self.end)
+        new_lo, new_hi = self._bounds(row)
+
+        if new_lo >= old_hi:
+            self.products[:] = self.sums[:] = self.counts[:] = 0.0
+            self._update(new_lo, new_hi, 1.0)
+        else:
+            self._update(old_lo, new_lo, -1.0)
+            self._update(old_hi, new_hi, 1.0)
+
+        self.end = row
+
+    def track(self, columns: np.ndarray) -> None:
+        """
+        Keep running sums for ``columns``: retained names reuse theirs, new
+        names get theirs from the current window.
+        """
+        columns = np.asarray(columns, dtype=np.intp)
+        position = {column: i for i, column in enumerate(self.tracked)}
+        previous = np.array([position.get(column, -1) for column in columns], dtype=np.intp)
+        kept, added = previous >= 0, previous < 0
+
+        blocks = []
+        for old in (self.products, self.sums, self.counts):
+            block = np.zeros((len(columns), len(columns)))
+            block[np.ix_(kept, kept)] = old[np.ix_(previous[kept], previous[kept])]
+            blocks.append(block)
+
+        if added.any():
+            lo, hi = self._bounds(self.end)
+            new = columns[added]
+            right = self._cross(lo, hi, columns, new)
+            left = self._cross(lo, hi, new, columns)
+            for block, r, l in zip(blocks, right, left):
+                block[:, added] = r
+                block[added, :] = l
+
+        self.products, self.sums, self.counts = blocks
+        self.tracked = columns
+
+    def covariance(self, columns: np.ndarray, min_periods: int | None = None) -> np.ndarray:
+        """
+        Pairwise-complete covariance of ``columns`` over the current window.
+
+        Pairs with fewer than ``min_periods`` joint observations (default
+        half the window) are 0; a name whose own variance is missing gets
+        the mean variance of the others.
+        """
+        self.track(columns)
+        min_periods = min_periods or max(self.window // 2, 2)
+
+        count = np.rint(self.counts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = (self.products - self.sums * self.sums.T / count) / (count - 1)
+        cov[~(count >= min_periods) | ~np.isfinite(cov)] = 0.0
+
+        variance = np.diag(cov).copy()
+        known = variance > 0
+        if not known.all():
+            variance[~known] = variance[known].mean() if known.any() else 1.0
+            cov[~known, :] = cov[:, ~known] = 0.0
+            cov[np.diag_indices_from(cov)] = variance
+
+        return cov
+
+
+class PortfolioWeighter:
+    """
+    Weights for the names selected at each rebalance.
+
+    ``equal`` assigns ``1 / top_n`` as ``EqualWeightPortfolio``. The other
+    methods use the trailing ``window``-month covariance from a
+    ``RollingCovariance`` advanced rebalance by rebalance, shrunk towards its
+    diagonal by ``shrinkage`` so it stays invertible when names outnumber
+    months:
+
+    - ``inverse_vol``: weights proportional to ``1 / sigma``.
+    - ``min_variance``: long-only minimum variance (active-set solver).
+    - ``risk_parity``: equal risk contribution, by Newton's method on the
+      convex formulation ``min y'Sy/2 - sum(log y) / n``.
+
+    A pairwise-complete estimate over missing data can be indefinite even
+    after shrinkage; ``min_variance`` and ``risk_parity`` then get it with
+    its negative eigenvalues clipped (``positive_definite``).
+
+    The invested fraction is ``len(selected) / top_n`` for every method, so
+    a short candidate list leaves the same cash as in equal weighting.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        values: np.ndarray,
+        top_n: int,
+        window: int = 36,
+        shrinkage: float = 0.25,
+    ):
+        if method not in WEIGHTINGS:
+            raise ValueError(f"Unsupported weighting: {method} (available: {', '.join(WEIGHTINGS)})")
+        if not 0 <= shrinkage <= 1:
+            raise ValueError("shrinkage must be between 0 and 1")
+
+        self.method = method
+        self.top_n = top_n
+        self.shrinkage = shrinkage
+        self.estimator = None if method == "equal" else RollingCovariance(values, window)
+
+    @classmethod
+    def from_config(cls, portfolio: dict, values: np.ndarray) -> "PortfolioWeighter":
+        return cls(
+            portfolio.get("weighting", "equal"),
+            values,
+            portfolio["top_n"],
+            window=portfolio.get("covariance_window", 36),
+            shrinkage=portfolio.get("shrinkage", 0.25),
+        )
+
+    @staticmethod
+    def positive_definite(cov: np.ndarray, floor: float = 1e-10) -> np.ndarray:
+        """
+        ``cov`` unchanged when it is positive definite, otherwise with its
+        eigenvalues raised to at least ``floor`` times the largest.
+        """
+        try:
+            np.linalg.cholesky(cov)
+            return cov
+        except np.linalg.LinAlgError:
+            pass
+
+        eigenvalues, vectors = np.linalg.eigh(cov)
+        eigenvalues = np.maximum(eigenvalues, floor * eigenvalues[-1])
+        clipped = (vectors * eigenvalues) @ vectors.T
+        return (clipped + clipped.T) / 2
+
+    @staticmethod
+    def inverse_vol(cov: np.ndarray) -> np.ndarray:
+        weights = 1 / np.sqrt(np.diag(cov))
+        return weights / weights.sum()
+
+    @staticmethod
+    def _equality_solution(cov: np.ndarray, free: np.ndarray) -> np.ndarray:
+        # Minimum variance with weights summing to 1 over the free names only.
+        target = np.zeros(len(cov))
+        solved = np.linalg.solve(cov[np.ix_(free, free)], np.ones(free.sum()))
+        target[free] = solved / solved.sum()
+        return target
+
+    @staticmethod
+    def min_variance(cov: np.ndarray, tol: float = 1e-12) -> np.ndarray:
+        """
+        Long-only minimum variance (weights >= 0, summing to 1).
+
+        Starts from repeatedly dropping names with a negative unconstrained
+        weight, which is usually optimal or close, then runs a primal
+        active-set method from there until the KKT conditions hold.
+        """
+        free = np.ones(len(cov), dtype=bool)
+        while True:
+            weights = PortfolioWeighter._equality_solution(cov, free)
+            negative = free & (weights < 0)
+            if not negative.any():
+                break
+            free &= ~negative
+
+        for _ in range(4 * len(cov)):
+            target = PortfolioWeighter._equality_solution(cov, free)
+            direction = target - weights
+
+            if np.abs(direction).max() > tol:
+                # Move towards the target until a free weight hits zero.
+                blocking = free & (direction < 0)
+                ratios = -weights[blocking] / direction[blocking]
+                step = min(1.0, ratios.min()) if len(ratios) else 1.0
+                weights = weights + step * direction
+
+                if step < 1.0:
+                    hit = np.flatnonzero(blocking)[np.argmin(ratios)]
+                    weights[hit] = 0.0
+                    free[hit] = False
+                continue
+
+            # At the optimum for this free set: release the bound name whose
+            # marginal variance is most below the free names' level.
+            gradient = cov @ weights
+            level = gradient[free].mean()
+            slack = np.where(free, np.inf, gradient - level)
+            release = np.argmin(slack)
+            if slack[release] >= -tol * max(abs(level), 1.0):
+                break
+            free[release] = True
+
+        weights = np.maximum(weights, 0.0)
+        return weights / weights.sum()
+
+    @staticmethod
+    def risk_parity(cov: np.ndarray, tol: float = 1e-10, max_iter: int = 50) -> np.ndarray:
+        n = len(cov)
+        budget = 1 / n
+        # Start from inverse vol scaled to y'Sy = 1, the optimum's scale.
+        start = PortfolioWeighter.inverse_vol(cov)
+        y = start / np.sqrt(start @ cov @ start)
+
+        for _ in range(max_iter):
+            gradient = cov @ y - budget / y
+            if np.abs(gradient).max() < tol:
+                break
+
+            hessian = cov + np.diag(budget / y**2)
+            step = np.linalg.solve(hessian, gradient)
+
+            # Damp the step so every weight stays positive.
+            scale = 1.0
+            while (y - scale * step <= 0).any():
+                scale /= 2
+            y = y - scale * step
+
+        return y / y.sum()
+
+    def weights(self, row: int, columns: np.ndarray) -> np.ndarray:
+        """
+        Weights for ``columns`` (panel positions) selected at ``row``,
+        using returns up to and including that row.
+        """
+        columns = np.asarray(columns, dtype=np.intp)
+        invested = len(columns) * round(1 / self.top_n, 6)
+
+        if self.method == "equal" or len(columns) <= 1:
+            return np.full(len(columns), round(1 / self.top_n, 6))
+
+        self.estimator.advance(row)
+        cov = self.estimator.covariance(columns)
+        cov = (1 - self.shrinkage) * cov + self.shrinkage * np.diag(np.diag(cov))
+        if self.method != "inverse_vol":
+            cov = self.positive_definite(cov)
+
+        solver = getattr(self, self.method)
+        return solver(cov) * invested
+
+    def matrix(self, rows: np.ndarray, selected: np.ndarray) -> np.ndarray:
+        """
+        Rebalances x tickers weights for boolean ``selected`` at ``rows``.
+        """
+        weights = np.zeros(selected.shape)
+        for k, row in enumerate(rows):
+            columns = np.flatnonzero(selected[k])
+            weights[k, columns] = self.weights(row, columns)
+        return weights
@@ -1,11 +1,21 @@
 import pandas as pd
 
+from momentum_engine.data.price_panel import PricePanel
+
 
 class CrossSectionalRanker:
     """
     Ranks stocks by descending signal value.
+
+    Ties keep the order of the input (stable sort), matching ``PanelRanker``.
     """
 
     @staticmethod
-    def rank(signal: pd.Series) -> pd.Series:
-        return signal.sort_values(ascending=False)
\ No newline at end of file
+    def rank(signal: pd.Series | PricePanel) -> pd.Series:
+        """
+        A ``PricePanel`` of signal values is ranked on its latest row.
+        """
+        if isinstance(signal, PricePanel):
+            signal = signal.row(len(signal) - 1).dropna()
+
+        return signal.sort_values(ascending=False, kind="stable")
\ No newline at end of file
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.data.price_panel import PricePanel
+
+
+@dataclass(frozen=True)
+class PanelRanking:
+    """
+    Ranks (1 = highest signal), percentiles (1.0 = highest) and top-N
+    membership for every row of a signal matrix. Missing signals have NaN
+    rank and percentile and are never selected.
+    """
+
+    ranks: np.ndarray
+    percentiles: np.ndarray
+    top_n: np.ndarray
+
+
+class PanelRanker:
+    """
+    Ranks a dates x tickers signal matrix in one vectorized call.
+
+    Policy (identical for full ranking and top-N selection):
+    - Higher signal ranks first.
+    - Ties are broken by column order: the earlier ticker ranks first.
+    - NaN signals are excluded: unranked and never selected.
+    """
+
+    @staticmethod
+    def _values(signal) -> np.ndarray:
+        if isinstance(signal, PricePanel):
+            values = signal.values
+        elif isinstance(signal, (pd.DataFrame, pd.Series)):
+            values = signal.to_numpy(dtype=float)
+        else:
+            values = np.asarray(signal, dtype=float)
+
+        return np.atleast_2d(values)
+
+    @staticmethod
+    def _keys(values: np.ndarray) -> np.ndarray:
+        # Ascending keys: best signal first, NaN last.
+        return np.where(np.isnan(values), np.inf, -values)
+
+    @staticmethod
+    def top_n_mask(signal, top_n: int) -> np.ndarray:
+        """
+        Top-N membership per row using partial selection (no full sort).
+        """
+        values = PanelRanker._values(signal)
+        valid = ~np.isnan(values)
+
+        if top_n <= 0:
+            return np.zeros(values.shape, dtype=bool)
+        if top_n >= values.shape[1]:
+            return valid
+
+        keys = PanelRanker._keys(values)
+        threshold = np.partition(keys, top_n - 1, axis=1)[:, top_n - 1:top_n]
+
+        above = keys < threshold
+        at = (keys == threshold) & valid
+
+        # Fill the remaining slots from the tied names in column order.
+        remaining = top_n - above.sum(axis=1, keepdims=True)
+        tied = at & (np.cumsum(at, axis=1) <= remaining)
+
+        return (above | tied) & valid
+
+    @staticmethod
+    def rank(signal, top_n: int | None = None) -> PanelRanking:
+        values = PanelRanker._values(signal)
+        valid = ~np.isnan(values)
+        n_valid = valid.sum(axis=1, keepdims=True)
+
+        # Missing signals go last first, then by key: a -inf signal has the
+        # same key as NaN but still ranks ahead of every missing one.
+        order = np.lexsort((PanelRanker._keys(values), ~valid), axis=1)
+        positions = np.empty_like(order)
+        np.put_along_axis(positions, order, np.arange(values.shape[1])[None, :], axis=1)
+
+        ranks = np.where(valid, positions + 1.0, np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percentiles = np.where(valid, (n_valid - ranks + 1) / n_valid, np.nan)
+
+        if top_n is None:
+            selected = np.zeros(values.shape, dtype=bool)
+        else:
+            selected = valid & (ranks <= top_n)
+
+        return PanelRanking(ranks=ranks, percentiles=percentiles, top_n=selected)
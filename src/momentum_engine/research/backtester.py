@@ -1,19 +1,32 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from momentum_engine.core.config import ConfigLoader
+from momentum_engine.core.profiling import NullProfiler
 from momentum_engine.universe.nifty100 import Nifty100Universe
-from momentum_engine.data.yahoo_fetcher import YahooPriceFetcher
-from momentum_engine.data.resampler import MonthlyResampler
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.resampler import CalendarResampler
 from momentum_engine.signals.momentum_12_1 import Momentum12_1
 from momentum_engine.ranking.cross_sectional_ranker import CrossSectionalRanker
 from momentum_engine.portfolio.equal_weight import EqualWeightPortfolio
+from momentum_engine.portfolio.weighting import PortfolioWeighter
 from momentum_engine.universe.csv_universe import CSVUniverse
+from momentum_engine.universe.membership import MembershipIndex
+from momentum_engine.research.performance import PerformanceAnalyzer
+from momentum_engine.research.result_cache import ResultCache
+from momentum_engine.research.vectorized_backtester import VectorizedBacktest
 
 
 class Backtester:
 
-    def __init__(self, config_path: str, universe_override: str = None):
+    def __init__(
+        self,
+        config_path: str,
+        universe_override: str = None,
+        session: PriceSession = None,
+        profiler=None,
+    ):
         self.config = ConfigLoader(config_path).load()
 
         self.start = pd.to_datetime(self.config["backtest"]["start_date"])
@@ -32,38 +45,82 @@ class Backtester:
         self.universe_file = universe_file
         self.universe_name = Path(universe_file).stem
 
-        universe_loader = CSVUniverse(universe_file)
-        self.universe = universe_loader.get_tickers()
+        # A directory of dated constituent files gives point-in-time
+        # membership; only tickers that were ever members in the window
+        # are fetched.
+        if Path(universe_file).is_dir():
+            self.membership = MembershipIndex.from_directory(universe_file)
+            self.universe = self.membership.ever_members(self.start, self.end)
+        else:
+            self.membership = None
+            universe_loader = CSVUniverse(universe_file)
+            self.universe = universe_loader.get_tickers()
 
         self.lookback = self.config["momentum"]["lookback_months"]
         self.skip = self.config["momentum"]["skip_recent_months"]
         self.top_n = self.config["portfolio"]["top_n"]
-        
+        self.weighting = self.config["portfolio"].get("weighting", "equal")
+
+        self.session = session or PriceSession()
+        self.profiler = profiler or NullProfiler()
+
+    def load_monthly(self) -> pd.DataFrame:
+        with self.profiler.stage("backtest.data") as stage:
+            monthly = self.session.monthly(
+                self.universe,
+                start_date=self.start.strftime("%Y-%m-%d")
+            )
+
+            # Restrict to backtest window
+            monthly = monthly.loc[
+                (monthly.index >= self.start) &
+                (monthly.index <= self.end)
+            ]
+            stage.shape(monthly)
+
+        return monthly
+
+    def weighter(self, monthly: pd.DataFrame) -> PortfolioWeighter:
+        return PortfolioWeighter.from_config(self.config["portfolio"], monthly.to_numpy(dtype=float))
+
+    def membership_mask(self, monthly: pd.DataFrame) -> np.ndarray | None:
+        """
+        Dates x tickers eligibility mask, or None for a static universe.
+        """
+        if self.membership is None:
+            return None
+        return self.membership.mask(monthly.index, monthly.columns)
+
+    @staticmethod
+    def rebalance_dates(monthly: pd.DataFrame, frequency: str = "quarterly") -> pd.DatetimeIndex:
+        """
+        Month-end rows to rebalance on: every row, or the last row of each
+        calendar quarter.
+        """
+        if frequency == "quarterly":
+            return monthly.index[CalendarResampler.period_ends(monthly.index, "quarterly")]
+        if frequency == "monthly":
+            return monthly.index
+
+        raise ValueError(f"Unsupported rebalance frequency: {frequency}")
+
     def run(self) -> pd.DataFrame:
 
-        print(f"Universe size: {len(self.universe)}")
         # -------------------------
         # 1. Fetch & prepare data
         # -------------------------
 
-        prices = YahooPriceFetcher.fetch(
-            self.universe,
-            start_date=self.start.strftime("%Y-%m-%d")
-        )
-
-        monthly = MonthlyResampler.to_monthly(prices)
-
-        # Restrict to backtest window
-        monthly = monthly.loc[
-            (monthly.index >= self.start) &
-            (monthly.index <= self.end)
-        ]
+        monthly = self.load_monthly()
 
         # -------------------------
         # 2. Generate quarterly rebalance dates
         # -------------------------
 
-        rebalance_dates = monthly.resample("QE").last().index
+        rebalance_dates = self.rebalance_dates(monthly)
+        members = self.membership_mask(monthly)
+
+        first_eligible = VectorizedBacktest.first_eligible(monthly.index, self.lookback, self.skip)
+        weighter = self.weighter(monthly)
 
         capital = self.initial_capital
         portfolio_history = []
@@ -72,54 +129,129 @@ class Backtester:
         # 3. Loop through rebalance periods
         # -------------------------
 
-        for i in range(len(rebalance_dates) - 1):
+        with self.profiler.stage("backtest.rebalance_loop", rebalances=len(rebalance_dates) - 1):
+            for i in range(len(rebalance_dates) - 1):
 
-            date = rebalance_dates[i]
-            next_rebalance_date = rebalance_dates[i + 1]
+                date = rebalance_dates[i]
+                next_rebalance_date = rebalance_dates[i + 1]
 
-            # Ensure enough lookback history exists
-            if date < monthly.index[0] + pd.DateOffset(months=self.lookback + self.skip):
-                continue
+                # Ensure enough lookback history exists
+                if date < first_eligible:
+                    continue
 
-            # -------------------------
-            # Compute momentum signal
-            # -------------------------
+                # -------------------------
+                # Compute momentum signal
+                # -------------------------
 
-            signal = Momentum12_1(
-                self.lookback,
-                self.skip
-            ).compute(monthly.loc[:date])
+                signal = Momentum12_1(
+                    self.lookback,
+                    self.skip
+                ).compute(monthly.loc[:date])
 
-            ranked = CrossSectionalRanker.rank(signal)
+                if members is not None:
+                    is_member = members[monthly.index.get_loc(date)]
+                    signal = signal[signal.index.isin(monthly.columns[is_member])]
 
-            weights = EqualWeightPortfolio.construct(
-                ranked.index.tolist(),
-                self.top_n
-            )
+                ranked = CrossSectionalRanker.rank(signal)
+
+                weights = EqualWeightPortfolio.construct(
+                    ranked.index.tolist(),
+                    self.top_n
+                )
 
-            # -------------------------
-            # Compute portfolio return over full quarter
-            # -------------------------
+                if self.weighting != "equal":
+                    columns = monthly.columns.get_indexer(list(weights))
+                    row = monthly.index.get_loc(date)
+                    weights = dict(zip(weights, weighter.weights(row, columns)))
 
-            current_prices = monthly.loc[date]
-            next_prices = monthly.loc[next_rebalance_date]
+                # -------------------------
+                # Compute portfolio return over full quarter
+                # -------------------------
 
-            portfolio_return = 0.0
+                current_prices = monthly.loc[date]
+                next_prices = monthly.loc[next_rebalance_date]
 
-            for ticker, weight in weights.items():
-                if ticker in current_prices and ticker in next_prices:
-                    ret = (next_prices[ticker] / current_prices[ticker]) - 1
-                    portfolio_return += ret * weight
+                portfolio_return = 0.0
 
-            capital *= (1 + portfolio_return)
+                for ticker, weight in weights.items():
+                    if ticker in current_prices and ticker in next_prices:
+                        ret = (next_prices[ticker] / current_prices[ticker]) - 1
+                        portfolio_return += ret * weight
 
-            portfolio_history.append({
-                "rebalance_date": date,
-                "next_date": next_rebalance_date,
-                "portfolio_return": portfolio_return,
-                "capital": capital
-            })
+                capital *= (1 + portfolio_return)
+
+                portfolio_history.append({
+                    "rebalance_date": date,
+                    "next_date": next_rebalance_date,
+                    "portfolio_return": portfolio_return,
+                    "capital": capital
+                })
 
         results_df = pd.DataFrame(portfolio_history)
 
-        return results_df
\ No newline at end of file
+        return results_df
+
+    def run_vectorized(self) -> pd.DataFrame:
+        """
+        Same results as ``run`` computed in a single vectorized pass.
+        """
+        monthly = self.load_monthly()
+
+        with self.profiler.stage("backtest.vectorized") as stage:
+            results = VectorizedBacktest.run(
+                monthly,
+                self.rebalance_dates(monthly),
+                self.lookback,
+                self.skip,
+                self.top_n,
+                self.initial_capital,
+                members=self.membership_mask(monthly),
+                weighter=self.weighter(monthly),
+            )
+            stage.shape(results)
+
+        return results
+
+    def cache_key(self, engine: str = "loop") -> str | None:
+        """
+        Result-cache key: the config (minus output settings and the universe
+        path), the universe contents and the price version of its tickers.
+        None when the price source is not a versioned store.
+        """
+        prices = ResultCache.price_version(self.session, self.universe, self.start.strftime("%Y-%m-%d"))
+        if prices is None:
+            return None
+
+        return ResultCache.key(
+            "backtest",
+            engine=engine,
+            config={k: v for k, v in self.config.items() if k not in ("output", "universe")},
+            universe=ResultCache.file_digest(self.universe_file),
+            prices=prices,
+        )
+
+    def run_cached(self, cache: ResultCache, vectorized: bool = False) -> dict:
+        """
+        ``run`` / ``run_vectorized`` through ``cache``.
+
+        Returns the artifacts dict: ``results``, ``metrics`` and the
+        ``monthly`` price and ``signal`` (momentum) panels.
+        """
+        key = self.cache_key("vectorized" if vectorized else "loop")
+
+        artifacts = cache.get(key)
+        if artifacts is not None:
+            return artifacts
+
+        results = self.run_vectorized() if vectorized else self.run()
+        monthly = self.load_monthly()
+        signal = VectorizedBacktest.momentum_matrix(monthly.to_numpy(dtype=float), self.lookback, self.skip)
+
+        artifacts = {
+            "results": results,
+            "metrics": PerformanceAnalyzer.compute_metrics(results),
+            "monthly": monthly,
+            "signal": pd.DataFrame(signal, index=monthly.index, columns=monthly.columns),
+        }
+        cache.put(key, artifacts)
+        return artifacts
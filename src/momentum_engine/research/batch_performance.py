@@ -0,0 +1,167 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class BatchPerformance:
+    """
+    ``metrics`` has one row per strategy. ``rolling_sharpe`` is a
+    strategies x periods matrix, NaN until the window is full.
+    """
+
+    metrics: pd.DataFrame
+    rolling_sharpe: np.ndarray
+
+
+class BatchPerformanceAnalyzer:
+    """
+    Scores a strategies x periods matrix of periodic returns in one
+    vectorized pass.
+
+    Returns may be of any frequency; ``periods_per_year`` annualises them.
+    CAGR, volatility, Sharpe and max drawdown follow
+    ``PerformanceAnalyzer.compute_metrics`` on the same return path: CAGR
+    and drawdowns are measured on the capital curve from the end of the
+    first period, and a missing return leaves capital unknown from then on
+    (CAGR NaN, drawdown taken over the known part), while volatility,
+    Sharpe and the other statistics skip it. Leading NaNs are padding for
+    strategies that start later and are not counted at all.
+    """
+
+    @staticmethod
+    def _values(returns) -> tuple[np.ndarray, pd.Index]:
+        if isinstance(returns, pd.DataFrame):
+            return returns.to_numpy(dtype=float), returns.index
+
+        values = np.asarray(returns, dtype=float)
+        if values.ndim == 1:
+            values = values[None, :]
+        return values, pd.RangeIndex(len(values))
+
+    @staticmethod
+    def _started(values: np.ndarray) -> np.ndarray:
+        # True from each strategy's first valid period onwards.
+        return np.logical_or.accumulate(~np.isnan(values), axis=1)
+
+    @staticmethod
+    def drawdowns(returns) -> np.ndarray:
+        """
+        Strategies x periods drawdown matrix (0 at a new high, negative
+        below), NaN before a strategy starts and once capital is unknown.
+        """
+        values, _ = BatchPerformanceAnalyzer._values(returns)
+        started = BatchPerformanceAnalyzer._started(values)
+        equity = np.cumprod(1 + np.where(started, values, 0.0), axis=1)
+        equity[~started] = np.nan
+        peak = np.fmax.accumulate(equity, axis=1)
+        return equity / peak - 1
+
+    @staticmethod
+    def rolling_sharpe(returns, window: int, periods_per_year: int = 4) -> np.ndarray:
+        """
+        Sharpe ratio over the trailing ``window`` periods, from running sums
+        of returns and squared returns. Windows with fewer than two valid
+        periods or zero volatility are NaN.
+        """
+        values, _ = BatchPerformanceAnalyzer._values(returns)
+        n_strategies, n_periods = values.shape
+
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+
+        def trailing(x: np.ndarray) -> np.ndarray:
+            total = np.zeros((n_strategies, n_periods + 1))
+            np.cumsum(x, axis=1, out=total[:, 1:])
+            out = np.full((n_strategies, n_periods), np.nan)
+            if window <= n_periods:
+                out[:, window - 1:] = total[:, window:] - total[:, :-window]
+            return out
+
+        count = trailing(valid.astype(float))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = trailing(filled) / count
+            var = (trailing(filled ** 2) - count * mean ** 2) / (count - 1)
+            std = np.sqrt(np.clip(var, 0.0, None))
+            sharpe = mean / std * np.sqrt(periods_per_year)
+
+        sharpe[(count < 2) | ~(std > 1e-12)] = np.nan
+        return sharpe
+
+    @staticmethod
+    def compute(
+        returns,
+        periods_per_year: int = 4,
+        rolling_window: int | None = None,
+        dates=None,
+    ) -> BatchPerformance:
+        """
+        Metrics for every strategy (row) of ``returns``:
+        CAGR, Annualized Volatility, Sharpe Ratio, Sortino Ratio, Max Drawdown,
+        Calmar Ratio, Hit Rate and Max Drawdown Duration (in periods).
+
+        ``dates`` are the period end dates (``next_date`` of a backtest);
+        when given, CAGR years are calendar days / 365.25 as in
+        ``PerformanceAnalyzer``, otherwise ``periods / periods_per_year``.
+        ``rolling_window`` defaults to one year of periods.
+        """
+        values, index = BatchPerformanceAnalyzer._values(returns)
+        n_periods = values.shape[1]
+
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=1)
+        filled = np.where(valid, values, 0.0)
+
+        started = BatchPerformanceAnalyzer._started(values)
+        first = np.argmax(started, axis=1)
+        if dates is None:
+            years = (n_periods - 1 - first) / periods_per_year
+        else:
+            days = pd.DatetimeIndex(dates)
+            years = (days[-1] - days[first]).days.to_numpy() / 365.25
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Capital after the first period to capital after the last.
+            after_first = np.arange(n_periods) > first[:, None]
+            growth = np.prod(np.where(after_first, 1 + filled, 1.0), axis=1)
+            cagr = np.where(years > 0, growth ** (1 / years) - 1, 0.0)
+            cagr[(started & ~valid).any(axis=1)] = np.nan
+
+            mean = filled.sum(axis=1) / count
+            deviations = np.where(valid, values - mean[:, None], 0.0)
+            std = np.sqrt((deviations ** 2).sum(axis=1) / (count - 1))
+            downside = np.sqrt((np.minimum(filled, 0.0) ** 2).sum(axis=1) / count)
+
+            ann = np.sqrt(periods_per_year)
+            sharpe = np.where(std == 0, 0.0, mean / std * ann)
+            sortino = np.where(downside > 0, mean / downside * ann, 0.0)
+            hit_rate = (filled > 0).sum(axis=1) / count
+
+        drawdown = BatchPerformanceAnalyzer.drawdowns(values)
+        max_dd = np.nan_to_num(drawdown, nan=0.0).min(axis=1, initial=0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            calmar = np.where(max_dd < 0, cagr / -max_dd, 0.0)
+
+        # Longest underwater run: distance from the last period at a high
+        # (padding and unknown capital count as at a high).
+        positions = np.arange(n_periods)
+        last_high = np.maximum.accumulate(np.where(drawdown < 0, -1, positions), axis=1)
+        max_dd_duration = (positions - last_high).max(axis=1, initial=0)
+
+        metrics = pd.DataFrame({
+            "CAGR": cagr,
+            "Annualized Volatility": std * ann,
+            "Sharpe Ratio": sharpe,
+            "Sortino Ratio": sortino,
+            "Max Drawdown": max_dd,
+            "Calmar Ratio": calmar,
+            "Hit Rate": hit_rate,
+            "Max Drawdown Duration": max_dd_duration,
+            "Periods": count,
+        }, index=index)
+
+        window = rolling_window or periods_per_year
+        rolling = BatchPerformanceAnalyzer.rolling_sharpe(values, window, periods_per_year)
+
+        return BatchPerformance(metrics=metrics, rolling_sharpe=rolling)
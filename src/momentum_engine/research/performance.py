@@ -5,13 +5,16 @@ import numpy as np
 class PerformanceAnalyzer:
 
     @staticmethod
-    def compute_metrics(results: pd.DataFrame) -> dict:
+    def compute_metrics(results: pd.DataFrame, periods_per_year: int = 4) -> dict:
         """
         Compute performance statistics from backtest results.
         Expects results to contain:
         - capital
         - portfolio_return
         - next_date
+
+        ``periods_per_year`` annualises volatility and Sharpe
+        (4 for quarterly rebalancing, 12 for monthly).
         """
 
         df = results.copy()
@@ -27,11 +30,11 @@ class PerformanceAnalyzer:
 
         cagr = (end_cap / start_cap) ** (1 / n_years) - 1 if n_years > 0 else 0
 
-        # Annualized Volatility (quarterly → 4 periods per year)
-        ann_vol = returns.std() * np.sqrt(4)
+        # Annualized Volatility
+        ann_vol = returns.std() * np.sqrt(periods_per_year)
 
         # Sharpe Ratio (risk-free assumed 0)
-        sharpe = (returns.mean() / returns.std()) * np.sqrt(4) if returns.std() != 0 else 0
+        sharpe = (returns.mean() / returns.std()) * np.sqrt(periods_per_year) if returns.std() != 0 else 0
 
         # Max Drawdown
         equity_curve = df["capital"]
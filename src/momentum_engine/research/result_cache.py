@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of research results.
+
+    Entries are keyed by a SHA-256 of everything the result depends on:
+    the normalised config, the bytes of the universe file(s) and the price
+    data version of the tickers involved. Changing any input produces a
+    different key, so stale entries are never read; they simply age out.
+
+    Each entry is one pickle file holding a dict of artifacts. Reads touch
+    the file's modification time and writes evict the least recently used
+    entries until the cache fits in ``max_bytes``.
+    """
+
+    # Bump when the layout or meaning of cached artifacts changes, and for
+    # any code change that alters results for the same inputs (a weighting
+    # or metric fix): keys cover inputs only, not the code version.
+    FORMAT = 1
+
+    def __init__(self, directory: str = "output/cache", max_bytes: int = 512 * 1024**2):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def file_digest(path: str) -> str:
+        """
+        Digest of a file's bytes, or of every file (and its relative path)
+        in a directory, such as dated membership files.
+        """
+        path = Path(path)
+        digest = hashlib.sha256()
+
+        if not path.is_dir():
+            digest.update(path.read_bytes())
+            return digest.hexdigest()
+
+        for file in sorted(p for p in path.rglob("*") if p.is_file()):
+            digest.update(str(file.relative_to(path)).encode())
+            digest.update(file.read_bytes())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def price_version(session, tickers: list[str], start_date: str) -> str | None:
+        """
+        Price data version for ``tickers``, or None when the session is not
+        backed by a versioned store (results are then not cacheable).
+        """
+        version = getattr(session.fetcher, "version", None)
+        if version is None:
+            return None
+        return version(tickers, start_date)
+
+    @classmethod
+    def key(cls, kind: str, **parts) -> str:
+        payload = json.dumps(
+            {"kind": kind, "format": cls.FORMAT, **parts},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        # Explicit nanosecond stamp: filesystem clocks can be too coarse to
+        # order accesses made within the same tick.
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def get(self, key: str | None) -> dict | None:
+        path = self._path(key) if key else None
+        if path is None or not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                artifacts = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        self._touch(path)
+        self.hits += 1
+        return artifacts
+
+    def put(self, key: str | None, artifacts: dict) -> None:
+        if not key:
+            return
+
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(artifacts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._touch(path)
+
+        self.evict()
+
+    def entries(self) -> list[tuple[Path, os.stat_result]]:
+        """
+        Cache files, least recently used first.
+        """
+        entries = [(path, path.stat()) for path in self.directory.glob("*.pkl")]
+        return sorted(entries, key=lambda entry: entry[1].st_mtime_ns)
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self.entries())
+
+    def evict(self) -> list[Path]:
+        entries = self.entries()
+        total = sum(stat.st_size for _, stat in entries)
+
+        removed = []
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed.append(path)
+
+        return removed
+
+    def clear(self) -> None:
+        for path, _ in self.entries():
+            path.unlink(missing_ok=True)
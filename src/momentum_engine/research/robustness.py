@@ -0,0 +1,233 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.core.shared_array import SharedArray, SharedArrayHandle
+from momentum_engine.ranking.panel_ranker import PanelRanker
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.batch_performance import BatchPerformanceAnalyzer
+from momentum_engine.research.vectorized_backtester import VectorizedBacktest
+
+
+HOLDING_MONTHS = {
+    "monthly": 1,
+    "quarterly": 3,
+}
+
+# Per-process state set by ``_init_worker``.
+_WORKER: dict = {}
+
+
+class BlockBootstrap:
+    """
+    Stationary block bootstrap (Politis & Romano) over the rows of a panel.
+
+    Block lengths are geometric with mean ``mean_block``; blocks wrap around
+    the end of the sample. Paths are generated as a batch of row-index
+    arrays, so the return panel itself is never copied per path.
+    """
+
+    @staticmethod
+    def indices(rng: np.random.Generator, n_paths: int, length: int, mean_block: float) -> np.ndarray:
+        """
+        ``n_paths x length`` matrix of row indices into a ``length``-row sample.
+        """
+        new_block = rng.random((n_paths, length)) < 1 / mean_block
+        new_block[:, 0] = True
+
+        starts = np.where(new_block, rng.integers(0, length, (n_paths, length)), 0)
+        positions = np.arange(length)
+        block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+
+        first_row = np.take_along_axis(starts, block_start, axis=1)
+        return (first_row + positions - block_start) % length
+
+
+@dataclass(frozen=True)
+class RobustnessResult:
+    """
+    ``paths`` holds the metrics of every resampled path, ``historical``
+    the same metrics for the backtest itself (rebalanced on calendar
+    period ends, as ``momentum backtest``) and ``summary`` their
+    distribution (mean and quantiles).
+    """
+
+    paths: pd.DataFrame
+    historical: pd.Series
+    summary: pd.DataFrame
+
+
+def _init_worker(handle: SharedArrayHandle, members: np.ndarray | None, params: dict) -> None:
+    log_returns, shm = SharedArray.attach(handle)
+    _WORKER.update(shm=shm, log_returns=log_returns, members=members, **params)
+
+
+def _path_returns(index: np.ndarray) -> np.ndarray:
+    """
+    Rerun momentum selection on each resampled path.
+
+    ``index`` is ``paths x months`` rows into the shared monthly log-return
+    matrix. Returns ``paths x rebalances`` portfolio returns.
+    """
+    log_returns = _WORKER["log_returns"]
+    lookback, skip = _WORKER["lookback"], _WORKER["skip"]
+    holding, top_n = _WORKER["holding"], _WORKER["top_n"]
+
+    n_paths, length = index.shape
+    n_tickers = log_returns.shape[1]
+
+    # Cumulative log price per path (row k = price after k months) and a
+    # running count of missing months, so any window is two lookups.
+    sampled = log_returns[index]
+    missing = np.isnan(sampled)
+
+    cum = np.zeros((n_paths, length + 1, n_tickers))
+    np.cumsum(np.where(missing, 0.0, sampled), axis=1, out=cum[:, 1:])
+    gaps = np.zeros((n_paths, length + 1, n_tickers), dtype=np.int32)
+    np.cumsum(missing, axis=1, out=gaps[:, 1:])
+
+    rows = np.arange(lookback + skip, length - holding + 1, holding)
+    recent, past = rows - skip, rows - skip - lookback
+
+    with np.errstate(over="ignore"):
+        momentum = np.expm1(cum[:, recent] - cum[:, past])
+    momentum[gaps[:, recent] != gaps[:, past]] = np.nan
+
+    if _WORKER["members"] is not None:
+        # Eligibility travels with the sampled month: the member set at the
+        # price row that closes the last month before the rebalance.
+        source_rows = index[:, rows - 1] + 1
+        momentum[~_WORKER["members"][source_rows]] = np.nan
+
+    selected = PanelRanker.top_n_mask(momentum.reshape(-1, n_tickers), top_n).reshape(momentum.shape)
+
+    # Missing months inside the holding period are flat.
+    holding_returns = np.expm1(cum[:, rows + holding] - cum[:, rows])
+    weight = round(1 / top_n, 6)
+    return np.where(selected, holding_returns, 0.0).sum(axis=2) * weight
+
+
+def _simulate(task: tuple[np.random.SeedSequence, int]) -> np.ndarray:
+    seed, n_paths = task
+    rng = np.random.default_rng(seed)
+    length = _WORKER["log_returns"].shape[0]
+
+    index = BlockBootstrap.indices(rng, n_paths, length, _WORKER["mean_block"])
+    return _path_returns(index)
+
+
+class RobustnessAnalyzer:
+    """
+    Distribution of backtest metrics over stationary block-bootstrap
+    resamples of the monthly return panel.
+
+    Months are resampled jointly across tickers, so cross-sectional
+    correlation is kept. On each path the 12-1 selection is rerun every
+    ``holding`` months and scored with ``BatchPerformanceAnalyzer``.
+    Paths are generated in batches of ``batch_size`` with independent
+    seeds derived from ``seed``, so results do not depend on ``workers``.
+    Selected names are equally weighted; other ``portfolio.weighting``
+    methods are rejected.
+    """
+
+    QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+    def __init__(
+        self,
+        backtester: Backtester,
+        n_paths: int = 10_000,
+        mean_block: float = 6.0,
+        rebalance: str = "quarterly",
+        seed: int = 0,
+        batch_size: int = 250,
+    ):
+        if rebalance not in HOLDING_MONTHS:
+            raise ValueError(f"Unsupported rebalance frequency: {rebalance}")
+        if mean_block < 1:
+            raise ValueError("mean_block must be at least 1 month")
+        if backtester.weighting != "equal":
+            # Covariance weights would need a rolling estimator per path.
+            raise ValueError(
+                f"Robustness analysis supports equal weighting only "
+                f"(config has portfolio.weighting: {backtester.weighting})"
+            )
+
+        self.backtester = backtester
+        self.n_paths = n_paths
+        self.mean_block = mean_block
+        self.rebalance = rebalance
+        self.seed = seed
+        self.batch_size = batch_size
+
+    def _tasks(self) -> list[tuple[np.random.SeedSequence, int]]:
+        sizes = [self.batch_size] * (self.n_paths // self.batch_size)
+        if self.n_paths % self.batch_size:
+            sizes.append(self.n_paths % self.batch_size)
+
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        return list(zip(seeds, sizes))
+
+    def run(self, workers: int | None = None) -> RobustnessResult:
+        workers = workers or os.cpu_count() or 1
+
+        monthly = self.backtester.load_monthly()
+        values = monthly.to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_returns = np.log(values[1:] / values[:-1])
+        log_returns[~np.isfinite(log_returns)] = np.nan
+
+        holding = HOLDING_MONTHS[self.rebalance]
+        params = {
+            "lookback": self.backtester.lookback,
+            "skip": self.backtester.skip,
+            "top_n": self.backtester.top_n,
+            "holding": holding,
+            "mean_block": self.mean_block,
+        }
+        members = self.backtester.membership_mask(monthly)
+
+        with SharedArray(log_returns) as shared:
+            init_args = (shared.handle, members, params)
+
+            if workers == 1:
+                _init_worker(*init_args)
+                batches = [_simulate(task) for task in self._tasks()]
+
+                shm = _WORKER.pop("shm")
+                _WORKER.clear()
+                shm.close()
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=init_args,
+                ) as pool:
+                    batches = list(pool.map(_simulate, self._tasks()))
+
+        periods_per_year = 12 // holding
+        paths = BatchPerformanceAnalyzer.compute(np.vstack(batches), periods_per_year).metrics
+
+        # Paths step through rows; the historical row is the backtest on the
+        # calendar rebalance dates it would actually use.
+        backtest = VectorizedBacktest.run(
+            monthly,
+            Backtester.rebalance_dates(monthly, self.rebalance),
+            self.backtester.lookback,
+            self.backtester.skip,
+            self.backtester.top_n,
+            self.backtester.initial_capital,
+            members=members,
+        )
+        historical = BatchPerformanceAnalyzer.compute(
+            backtest["portfolio_return"].to_numpy(), periods_per_year, dates=backtest["next_date"]
+        ).metrics.iloc[0]
+
+        summary = paths.quantile(list(self.QUANTILES)).T
+        summary.columns = [f"p{int(q * 100)}" for q in self.QUANTILES]
+        summary.insert(0, "mean", paths.mean())
+        summary.insert(0, "historical", historical)
+
+        return RobustnessResult(paths=paths, historical=historical, summary=summary)
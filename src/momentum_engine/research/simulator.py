@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.ranking.panel_ranker import PanelRanker
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.batch_performance import BatchPerformanceAnalyzer
+from momentum_engine.research.vectorized_backtester import VectorizedBacktest
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """
+    ``nav`` is the daily net asset value, ``rebalances`` has one row per
+    rebalance (turnover, cost in currency, NAV after costs) and ``weights`` the target
+    weights set at each rebalance.
+    """
+
+    nav: pd.Series
+    rebalances: pd.DataFrame
+    weights: pd.DataFrame
+
+    def metrics(self) -> pd.Series:
+        """
+        Daily-return metrics from the first execution day onwards.
+        """
+        invested = self.nav.loc[self.rebalances["execution_date"].iloc[0]:]
+        returns = invested.pct_change().iloc[1:]
+        return BatchPerformanceAnalyzer.compute(
+            returns.to_numpy(), TRADING_DAYS_PER_YEAR, dates=returns.index
+        ).metrics.iloc[0]
+
+
+class DailySimulator:
+    """
+    Marks the momentum portfolio to market every trading day.
+
+    Target weights are set at each rebalance from the monthly 12-1 signal
+    (top N, weighted per the config's ``weighting`` as in ``Backtester``)
+    and executed at the close of the last trading day on or before the
+    rebalance date. Between
+    rebalances holdings drift with prices. Turnover is the sum of absolute
+    weight changes against the drifted weights, and ``cost_bps +
+    slippage_bps`` per unit of turnover is deducted from NAV at execution.
+
+    ``rebalance`` is ``"monthly"``, ``"quarterly"`` or a list of dates;
+    custom dates snap to the month-end on or before each date. Defaults
+    come from the optional ``simulation`` section of the research config.
+    """
+
+    def __init__(
+        self,
+        backtester: Backtester,
+        rebalance: str | list | None = None,
+        cost_bps: float | None = None,
+        slippage_bps: float | None = None,
+    ):
+        settings = backtester.config.get("simulation", {})
+
+        self.backtester = backtester
+        self.rebalance = rebalance or settings.get("rebalance", "quarterly")
+        self.cost_bps = settings.get("cost_bps", 0.0) if cost_bps is None else cost_bps
+        self.slippage_bps = settings.get("slippage_bps", 0.0) if slippage_bps is None else slippage_bps
+
+    def rebalance_dates(self, monthly: pd.DataFrame) -> pd.DatetimeIndex:
+        if isinstance(self.rebalance, str):
+            return Backtester.rebalance_dates(monthly, self.rebalance)
+
+        dates = pd.DatetimeIndex(pd.to_datetime(list(self.rebalance))).sort_values()
+        rows = monthly.index.searchsorted(dates, side="right") - 1
+        return monthly.index[np.unique(rows[rows >= 0])]
+
+    @staticmethod
+    def target_weights(
+        monthly_values: np.ndarray,
+        rows: np.ndarray,
+        lookback: int,
+        skip: int,
+        top_n: int,
+        members: np.ndarray | None = None,
+        weighter=None,
+    ) -> np.ndarray:
+        """
+        Rebalances x tickers targets for the given monthly rows: equal
+        weight, or from ``weighter`` (a ``PortfolioWeighter``).
+        """
+        scores = VectorizedBacktest.momentum_matrix(monthly_values, lookback, skip)[rows]
+        if members is not None:
+            scores = np.where(members[rows], scores, np.nan)
+
+        selected = PanelRanker.top_n_mask(scores, top_n)
+        if weighter is not None and weighter.method != "equal":
+            return weighter.matrix(rows, selected)
+        return selected * round(1 / top_n, 6)
+
+    @staticmethod
+    def simulate(
+        prices: np.ndarray,
+        rows: np.ndarray,
+        weights: np.ndarray,
+        cost_rate: float,
+        initial_capital: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Daily NAV for ``weights[k]`` held from day ``rows[k]`` to ``rows[k+1]``.
+
+        ``prices`` is a forward-filled days x tickers matrix. Each day's
+        holdings are valued as price relative to the segment's execution day,
+        so the whole path is one gather, one weighted row sum and a
+        cumulative product over segments. Unallocated weight (and names
+        without a price at execution) is held as cash.
+
+        Returns ``(nav, turnover, costs)``; the last two per rebalance.
+        """
+        n_days = len(prices)
+
+        tradable = np.isfinite(prices[rows]) & (prices[rows] > 0)
+        target = weights * tradable
+        cash = 1 - target.sum(axis=1)
+
+        def growth(day_rows: np.ndarray, segments: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            # Portfolio value on each day relative to its segment's execution day.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                relative = prices[day_rows] / prices[rows[segments]]
+            held = target[segments] * np.nan_to_num(relative, nan=1.0)
+            return held.sum(axis=1) + cash[segments], held
+
+        segment = np.searchsorted(rows, np.arange(n_days), side="right") - 1
+        invested = np.flatnonzero(segment >= 0)
+        daily_growth, _ = growth(invested, segment[invested])
+
+        # Value of each segment on the next execution day, and the drifted
+        # weights the next rebalance trades against.
+        before = np.zeros_like(target)
+        end_growth = np.ones(len(rows))
+        if len(rows) > 1:
+            previous = np.arange(len(rows) - 1)
+            end_growth[1:], drifted = growth(rows[1:], previous)
+            before[1:] = drifted / end_growth[1:, None]
+
+        turnover = np.abs(target - before).sum(axis=1)
+        costs = turnover * cost_rate
+
+        # NAV right after rebalance k: carried NAV x segment growth x (1 - cost).
+        after_cost = initial_capital * np.cumprod(end_growth * (1 - costs))
+
+        nav = np.full(n_days, float(initial_capital))
+        nav[invested] = after_cost[segment[invested]] * daily_growth
+
+        return nav, turnover, costs
+
+    def run(self) -> SimulationResult:
+        bt = self.backtester
+
+        monthly = bt.load_monthly()
+        daily = bt.session.daily(bt.universe, start_date=bt.start.strftime("%Y-%m-%d"))
+        daily = daily.loc[:bt.end, monthly.columns].ffill()
+
+        dates = self.rebalance_dates(monthly)
+        dates = dates[dates >= VectorizedBacktest.first_eligible(monthly.index, bt.lookback, bt.skip)]
+
+        weights = self.target_weights(
+            monthly.to_numpy(dtype=float),
+            monthly.index.get_indexer(dates),
+            bt.lookback,
+            bt.skip,
+            bt.top_n,
+            bt.membership_mask(monthly),
+            bt.weighter(monthly),
+        )
+
+        # Execute at the close of the last trading day on or before each date.
+        rows = daily.index.searchsorted(dates, side="right") - 1
+        keep = rows >= 0
+        rows, dates, weights = rows[keep], dates[keep], weights[keep]
+
+        nav, turnover, costs = self.simulate(
+            daily.to_numpy(dtype=float),
+            rows,
+            weights,
+            (self.cost_bps + self.slippage_bps) / 1e4,
+            bt.initial_capital,
+        )
+
+        rebalances = pd.DataFrame({
+            "rebalance_date": dates,
+            "execution_date": daily.index[rows],
+            "turnover": turnover,
+            "cost": nav[rows] * costs / (1 - costs),
+            "nav": nav[rows],
+        })
+
+        return SimulationResult(
+            nav=pd.Series(nav, index=daily.index, name="nav"),
+            rebalances=rebalances,
+            weights=pd.DataFrame(weights, index=dates, columns=monthly.columns),
+        )
@@ -1,63 +1,240 @@
+import hashlib
+import numpy as np
 import pandas as pd
+from datetime import datetime
 from pathlib import Path
 
+from momentum_engine.core.profiling import NullProfiler
+from momentum_engine.core.ring_buffer import MonthEndBuffer
 from momentum_engine.universe.csv_universe import CSVUniverse
-from momentum_engine.data.yahoo_fetcher import YahooPriceFetcher
-from momentum_engine.data.resampler import MonthlyResampler
-from momentum_engine.signals.momentum_12_1 import Momentum12_1
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.research.result_cache import ResultCache
+
+
+class TrailingReturnView(MonthEndBuffer):
+    """
+    Materialised snapshot columns (MOM_12_1 and trailing returns) for a set
+    of tickers.
+
+    Keeps only the last ``max(HORIZONS) + 1`` month-end prices in a
+    ``MonthEndBuffer`` and reads every column by positional lookup of two
+    rows. Appending a month-end bar refreshes the table in O(tickers); a
+    bar for the same month as the latest one replaces it, so a partial
+    current month can be updated in place.
+
+    Columns after appending month ``t`` equal the shift-based definitions
+    evaluated on ``monthly.loc[:t]``.
+    """
+
+    HORIZONS = (1, 3, 12, 36, 60)
+    PARAMETERS = ("lookback", "skip")
+
+    def __init__(self, tickers: list[str], lookback: int = 12, skip: int = 1):
+        super().__init__(tickers, self.window(lookback, skip))
+        self.lookback = lookback
+        self.skip = skip
+
+        self.table = pd.DataFrame(index=self.tickers)
+
+    @classmethod
+    def window(cls, lookback: int = 12, skip: int = 1) -> int:
+        """
+        Month-end rows kept in the ring buffer.
+        """
+        return max(max(cls.HORIZONS), lookback + skip) + 1
+
+    @classmethod
+    def from_monthly(cls, monthly: pd.DataFrame, lookback: int = 12, skip: int = 1) -> "TrailingReturnView":
+        view = cls(monthly.columns.tolist(), lookback, skip)
+        view.extend(monthly.iloc[-view.size:])
+        return view
+
+    def append(self, date, prices: pd.Series) -> pd.DataFrame:
+        """
+        Add the month-end bar for ``date`` and return the refreshed table.
+        """
+        self.push(date, prices)
+        self._refresh()
+        return self.table
+
+    def extend(self, monthly: pd.DataFrame) -> pd.DataFrame:
+        """
+        Append several month-end bars, refreshing the table once.
+        """
+        for date, prices in monthly.iterrows():
+            self.push(date, prices)
+        self._refresh()
+        return self.table
+
+    def _ratio(self, recent: int, base: int) -> np.ndarray:
+        if base >= self.count:
+            return np.full(len(self.tickers), np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.row(recent) / self.row(base) - 1
+
+    def _refresh(self) -> None:
+        columns = {"MOM_12_1": self._ratio(self.skip, self.lookback + self.skip)}
+        for months in self.HORIZONS:
+            columns[f"{months}M"] = self._ratio(0, months)
+
+        self.table = pd.DataFrame(columns, index=self.tickers)
+
+    def frame(self, tickers: list[str]) -> pd.DataFrame:
+        """
+        Snapshot table for ``tickers``: rows with a MOM_12_1 value, sorted
+        by it (highest first).
+        """
+        table = self.table.reindex(pd.Index(tickers).intersection(self.tickers, sort=False))
+        table = table.dropna(subset=["MOM_12_1"]).sort_values("MOM_12_1", ascending=False)
+
+        table.insert(0, "Ticker", table.index)
+        return table.reset_index(drop=True)
 
 
 class SnapshotAnalyzer:
-
-    def __init__(self, universe_file: str):
-        self.universe_file = universe_file
-        self.universe_name = Path(universe_file).stem
-
-        universe_loader = CSVUniverse(universe_file)
-        self.tickers = universe_loader.get_tickers()
-
-    def run(self):
-
-        # Fetch daily prices
-        prices = YahooPriceFetcher.fetch(
-            self.tickers,
-            start_date="2010-01-01"
+    """
+    Cross-sectional snapshot (MOM_12_1 plus 1M/3M/12M/36M/60M returns) for
+    one or more universes.
+
+    The deduplicated union of all universes is fetched once into a
+    ``TrailingReturnView``; each universe's table is a row selection of it.
+    With ``view_path`` the view is persisted, and later runs only fetch
+    and append the months since its last bar; it is rebuilt instead when
+    the store has rescaled or refetched any of its tickers' history
+    since. With ``cache`` the finished
+    tables are stored in a ``ResultCache`` keyed by the universe files and
+    the price version, and a repeat run reads them back directly.
+    """
+
+    HISTORY_START = "2010-01-01"
+    VIEW_DIRECTORY = "output/snapshots/views"
+
+    def __init__(
+        self,
+        universe_files: str | list[str],
+        session: PriceSession = None,
+        profiler=None,
+        view_path: str | None = None,
+        cache: ResultCache | None = None,
+    ):
+        if isinstance(universe_files, str):
+            universe_files = [universe_files]
+
+        self.universes: dict[str, list[str]] = {
+            Path(universe_file).stem: CSVUniverse(universe_file).get_tickers()
+            for universe_file in universe_files
+        }
+
+        self.universe_files = list(universe_files)
+        self.universe_file = universe_files[0]
+        self.universe_name = Path(universe_files[0]).stem
+        self.tickers = list(dict.fromkeys(t for tickers in self.universes.values() for t in tickers))
+
+        self.session = session or PriceSession()
+        self.profiler = profiler or NullProfiler()
+        self.view_path = view_path
+        self.cache = cache
+        self._view: TrailingReturnView | None = None
+
+    def default_view_path(self) -> str:
+        """
+        View file for this ticker set under ``VIEW_DIRECTORY``, so runs over
+        different universes do not overwrite each other's view.
+        """
+        digest = hashlib.sha256("\n".join(sorted(self.tickers)).encode()).hexdigest()[:12]
+        return str(Path(self.VIEW_DIRECTORY) / f"{'+'.join(self.universes)}_{digest}.npz")
+
+    def _load_view(self) -> TrailingReturnView | None:
+        view = self._view
+        if view is None and self.view_path and Path(self.view_path).exists():
+            view = TrailingReturnView.load(self.view_path)
+
+        if view is None or view.count == 0 or not set(self.tickers) <= set(view.tickers):
+            return None
+        return view
+
+    @staticmethod
+    def _window_start(today: pd.Timestamp | None = None) -> pd.Timestamp:
+        today = pd.Timestamp(today or datetime.today())
+        return (today - pd.DateOffset(months=TrailingReturnView.window() + 1)).replace(day=1)
+
+    def cache_key(self) -> str | None:
+        prices = ResultCache.price_version(
+            self.session, self.tickers, self._window_start().strftime("%Y-%m-%d")
         )
-
-        # Convert to month-end prices
-        monthly = MonthlyResampler.to_monthly(prices)
-
-        # Compute 12–1 momentum using official signal class
-        momentum_signal = Momentum12_1(
-            lookback=12,
-            skip=1
-        )
-
-        mom_latest = momentum_signal.compute(monthly)
-
-        # Helper function for trailing returns
-        def compute_return(months):
-            return (monthly.iloc[-1] / monthly.shift(months).iloc[-1]) - 1
-
-        snapshot_df = pd.DataFrame({
-            "Ticker": monthly.columns,
-            "MOM_12_1": mom_latest.reindex(monthly.columns).values,
-            "1M": compute_return(1).values,
-            "3M": compute_return(3).values,
-            "12M": compute_return(12).values,
-            "36M": compute_return(36).values,
-            "60M": compute_return(60).values,
-        })
-
-        # Drop rows where momentum is NaN
-        snapshot_df = snapshot_df.dropna(subset=["MOM_12_1"])
-
-        # Sort by official signal
-        snapshot_df = snapshot_df.sort_values(
-            "MOM_12_1",
-            ascending=False
+        if prices is None:
+            return None
+
+        return ResultCache.key(
+            "snapshot",
+            universes={
+                name: ResultCache.file_digest(path)
+                for name, path in zip(self.universes, self.universe_files)
+            },
+            horizons=TrailingReturnView.HORIZONS,
+            prices=prices,
         )
 
-        snapshot_df.reset_index(drop=True, inplace=True)
-
-        return snapshot_df
\ No newline at end of file
+    def update_view(self, today: pd.Timestamp | None = None) -> TrailingReturnView:
+        """
+        Build the view, or bring an existing one up to date by appending
+        only the months since (and including) its last bar.
+        """
+        view = self._load_view()
+
+        if view is not None:
+            start = view.last_date.replace(day=1)
+
+            with self.profiler.stage("snapshot.data", tickers=len(view.tickers)) as stage:
+                monthly = self.session.monthly(view.tickers.tolist(), start_date=start.strftime("%Y-%m-%d"))
+                stage.shape(monthly)
+
+            # Reading the new months synced the store: a rescaled ticker
+            # invalidates the buffered prices.
+            rebased = self.session.rebased(view.tickers)
+            if rebased is None or np.array_equal(rebased, view.rebased):
+                with self.profiler.stage("snapshot.view", incremental=True):
+                    view.extend(monthly.loc[monthly.index.to_period("M") >= view.last_date.to_period("M")])
+            else:
+                view = None
+
+        if view is None:
+            start = self._window_start(today)
+            size = TrailingReturnView.window()
+
+            with self.profiler.stage("snapshot.data", tickers=len(self.tickers)) as stage:
+                monthly = self.session.monthly(self.tickers, start_date=start.strftime("%Y-%m-%d"))
+                if len(monthly) < size:
+                    # Prices end before today (e.g. an offline store):
+                    # fall back to full history.
+                    monthly = self.session.monthly(self.tickers, start_date=self.HISTORY_START)
+                stage.shape(monthly)
+
+            with self.profiler.stage("snapshot.view"):
+                view = TrailingReturnView.from_monthly(monthly)
+                view.rebased = self.session.rebased(view.tickers)
+
+        self._view = view
+        if self.view_path:
+            view.save(self.view_path)
+
+        return view
+
+    def run_all(self) -> dict[str, pd.DataFrame]:
+        key = self.cache_key() if self.cache is not None else None
+        if key is not None:
+            frames = self.cache.get(key)
+            if frames is not None:
+                return frames
+
+        view = self.update_view()
+
+        with self.profiler.stage("snapshot.assemble", universes=len(self.universes)):
+            frames = {name: view.frame(tickers) for name, tickers in self.universes.items()}
+
+        if key is not None:
+            self.cache.put(key, frames)
+        return frames
+
+    def run(self) -> pd.DataFrame:
+        return self.run_all()[self.universe_name]
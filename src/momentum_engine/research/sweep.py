@@ -0,0 +1,194 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.core.shared_array import SharedArray, SharedArrayHandle
+from momentum_engine.portfolio.weighting import PortfolioWeighter
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.batch_performance import BatchPerformanceAnalyzer
+from momentum_engine.research.vectorized_backtester import VectorizedBacktest
+
+
+PERIODS_PER_YEAR = {
+    "monthly": 12,
+    "quarterly": 4,
+}
+
+# Per-process state set by ``_init_worker``.
+_WORKER: dict = {}
+
+
+def _init_worker(
+    handle: SharedArrayHandle,
+    index: pd.DatetimeIndex,
+    rebalance_dates: dict[str, pd.DatetimeIndex],
+    initial_capital: float,
+    members: np.ndarray | None,
+    portfolio: dict,
+) -> None:
+    values, shm = SharedArray.attach(handle)
+    _WORKER.update(
+        shm=shm,
+        monthly=pd.DataFrame(values, index=index, copy=False),
+        rebalance_dates=rebalance_dates,
+        initial_capital=initial_capital,
+        members=members,
+        portfolio=portfolio,
+    )
+
+
+def _evaluate(grid: list[dict]) -> list[dict]:
+    """
+    Backtest each combination and return its period returns aligned to the
+    rebalance dates (NaN before the first eligible rebalance).
+    """
+    monthly = _WORKER["monthly"]
+    values = monthly.to_numpy()
+
+    rows = []
+    momentum_cache: dict[tuple[int, int], np.ndarray] = {}
+
+    for params in grid:
+        key = (params["lookback"], params["skip"])
+        if key not in momentum_cache:
+            momentum_cache.clear()
+            momentum_cache[key] = VectorizedBacktest.momentum_matrix(values, *key)
+
+        # A fresh weighter per combination: its covariance window only
+        # moves forward through that combination's rebalances.
+        portfolio = {**_WORKER["portfolio"], "top_n": params["top_n"]}
+        weighter = None
+        if portfolio.get("weighting", "equal") != "equal":
+            weighter = PortfolioWeighter.from_config(portfolio, values)
+
+        rebalance_dates = _WORKER["rebalance_dates"][params["rebalance"]]
+        results = VectorizedBacktest.run(
+            monthly,
+            rebalance_dates,
+            params["lookback"],
+            params["skip"],
+            params["top_n"],
+            _WORKER["initial_capital"],
+            momentum=momentum_cache[key],
+            members=_WORKER["members"],
+            weighter=weighter,
+        )
+
+        returns = np.full(len(rebalance_dates) - 1, np.nan)
+        returns[rebalance_dates.get_indexer(results["rebalance_date"])] = results["portfolio_return"]
+        rows.append({**params, "returns": returns})
+
+    return rows
+
+
+class ParameterSweep:
+    """
+    Evaluates a grid of (lookback, skip, top_n, rebalance) combinations.
+
+    Prices are fetched and resampled once through ``Backtester``. The monthly
+    matrix is placed in shared memory and mapped by every worker; each worker
+    scores a contiguous slice of the grid, so combinations sharing a
+    (lookback, skip) reuse one momentum matrix. Workers return period
+    returns; every combination of a rebalance frequency is then scored in
+    one ``BatchPerformanceAnalyzer`` pass. Selected names are weighted per
+    the config's ``portfolio.weighting``.
+    """
+
+    def __init__(
+        self,
+        backtester: Backtester,
+        lookbacks: list[int],
+        skips: list[int],
+        top_ns: list[int],
+        rebalances: list[str],
+    ):
+        self.backtester = backtester
+
+        for rebalance in rebalances:
+            if rebalance not in PERIODS_PER_YEAR:
+                raise ValueError(f"Unsupported rebalance frequency: {rebalance}")
+
+        self.grid = [
+            {"lookback": lookback, "skip": skip, "top_n": top_n, "rebalance": rebalance}
+            for lookback, skip, top_n, rebalance in itertools.product(
+                lookbacks, skips, top_ns, rebalances
+            )
+        ]
+
+    @staticmethod
+    def _chunks(grid: list[dict], n_chunks: int) -> list[list[dict]]:
+        size = max(1, -(-len(grid) // n_chunks))
+        return [grid[i:i + size] for i in range(0, len(grid), size)]
+
+    def run(self, workers: int | None = None) -> pd.DataFrame:
+        rows, rebalance_dates = self.period_returns(workers)
+        return self._score(rows, rebalance_dates)
+
+    def period_returns(
+        self, workers: int | None = None
+    ) -> tuple[list[dict], dict[str, pd.DatetimeIndex]]:
+        """
+        Parameters and period returns of every combination (``returns``
+        aligned to that frequency's rebalance dates, NaN before the first
+        eligible rebalance), plus the rebalance dates per frequency.
+        """
+        workers = workers or os.cpu_count() or 1
+
+        monthly = self.backtester.load_monthly()
+        rebalance_dates = {
+            frequency: Backtester.rebalance_dates(monthly, frequency)
+            for frequency in {params["rebalance"] for params in self.grid}
+        }
+
+        # Several chunks per worker keeps the pool balanced when some
+        # combinations (monthly rebalancing) are slower than others.
+        chunks = self._chunks(self.grid, workers * 4)
+
+        with SharedArray(monthly.to_numpy(dtype=float)) as shared:
+            init_args = (
+                shared.handle,
+                monthly.index,
+                rebalance_dates,
+                self.backtester.initial_capital,
+                self.backtester.membership_mask(monthly),
+                self.backtester.config["portfolio"],
+            )
+
+            if workers == 1:
+                _init_worker(*init_args)
+                rows = [row for chunk in chunks for row in _evaluate(chunk)]
+
+                shm = _WORKER.pop("shm")
+                _WORKER.clear()
+                shm.close()
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=init_args,
+                ) as pool:
+                    rows = [row for chunk_rows in pool.map(_evaluate, chunks) for row in chunk_rows]
+
+        return rows, rebalance_dates
+
+    @staticmethod
+    def _score(rows: list[dict], rebalance_dates: dict[str, pd.DatetimeIndex]) -> pd.DataFrame:
+        returns = [row.pop("returns") for row in rows]
+        results = pd.DataFrame(rows)
+
+        scored = []
+        for frequency, group in results.groupby("rebalance", sort=False):
+            performance = BatchPerformanceAnalyzer.compute(
+                np.vstack([returns[i] for i in group.index]),
+                periods_per_year=PERIODS_PER_YEAR[frequency],
+                dates=rebalance_dates[frequency][1:],
+            )
+            metrics = performance.metrics.rename(columns={"Periods": "periods"})
+            metrics = metrics[["periods", *metrics.columns.drop("periods")]]
+            metrics.index = group.index
+            scored.append(metrics)
+
+        return results.join(pd.concat(scored))
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+from momentum_engine.data.price_panel import PricePanel
+from momentum_engine.ranking.panel_ranker import PanelRanker
+
+
+class VectorizedBacktest:
+    """
+    Single-pass equivalent of the ``Backtester.run`` rebalance loop.
+
+    The momentum matrix is computed once over the whole monthly panel, top-N
+    membership is selected for every rebalance row in one batch and period
+    returns are taken as matrix operations.
+    """
+
+    @staticmethod
+    def shift(values: np.ndarray, periods: int) -> np.ndarray:
+        shifted = np.full_like(values, np.nan)
+        if periods == 0:
+            shifted[:] = values
+        elif periods < len(values):
+            shifted[periods:] = values[:-periods]
+        return shifted
+
+    @staticmethod
+    def first_eligible(index: pd.DatetimeIndex, lookback: int, skip: int) -> pd.Timestamp:
+        """
+        First date with ``lookback + skip`` months of history before it.
+        """
+        if len(index) <= lookback + skip:
+            return pd.Timestamp.max
+        return index[lookback + skip]
+
+    @staticmethod
+    def momentum_matrix(values: np.ndarray, lookback: int, skip: int) -> np.ndarray:
+        """
+        Same formula as ``Momentum12_1.compute`` for every row at once.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                VectorizedBacktest.shift(values, skip)
+                / VectorizedBacktest.shift(values, lookback + skip)
+                - 1
+            )
+
+    @staticmethod
+    def portfolio_returns(
+        values: np.ndarray,
+        rows: np.ndarray,
+        next_rows: np.ndarray,
+        selected: np.ndarray,
+        weight: float | np.ndarray,
+    ) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            period_returns = values[next_rows] / values[rows] - 1
+
+        # Unselected names contribute exactly zero; a selected name with a
+        # missing price propagates NaN, as in the loop.
+        contributions = np.where(selected, period_returns, 0.0) * weight
+        return contributions.sum(axis=1)
+
+    @staticmethod
+    def run(
+        monthly: pd.DataFrame | PricePanel,
+        rebalance_dates: pd.DatetimeIndex,
+        lookback: int,
+        skip: int,
+        top_n: int,
+        initial_capital: float,
+        momentum: np.ndarray | None = None,
+        members: np.ndarray | None = None,
+        weighter=None,
+    ) -> pd.DataFrame:
+        """
+        ``momentum`` may be passed in when the same (lookback, skip) matrix
+        is reused across several runs. ``members`` is an optional boolean
+        mask over the panel; non-members are never selected. ``weighter``
+        (a ``PortfolioWeighter``) replaces equal weights.
+        """
+        if isinstance(monthly, PricePanel):
+            values, index = monthly.values, monthly.dates
+        else:
+            values, index = monthly.to_numpy(dtype=float), monthly.index
+
+        first_eligible = VectorizedBacktest.first_eligible(index, lookback, skip)
+        dates = rebalance_dates[:-1]
+        next_dates = rebalance_dates[1:]
+
+        eligible = dates >= first_eligible
+        dates = dates[eligible]
+        next_dates = next_dates[eligible]
+
+        rows = index.get_indexer(dates)
+        next_rows = index.get_indexer(next_dates)
+
+        if momentum is None:
+            momentum = VectorizedBacktest.momentum_matrix(values, lookback, skip)
+
+        scores = momentum[rows]
+        if members is not None:
+            scores = np.where(members[rows], scores, np.nan)
+
+        selected = PanelRanker.top_n_mask(scores, top_n)
+
+        if weighter is None or weighter.method == "equal":
+            weight = round(1 / top_n, 6)
+        else:
+            weight = weighter.matrix(rows, selected)
+
+        portfolio_return = VectorizedBacktest.portfolio_returns(
+            values, rows, next_rows, selected, weight
+        )
+
+        capital = initial_capital * np.cumprod(1 + portfolio_return)
+
+        return pd.DataFrame({
+            "rebalance_date": dates,
+            "next_date": next_dates,
+            "portfolio_return": portfolio_return,
+            "capital": capital,
+        })
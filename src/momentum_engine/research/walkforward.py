@@ -0,0 +1,220 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.batch_performance import BatchPerformanceAnalyzer
+from momentum_engine.research.sweep import PERIODS_PER_YEAR, ParameterSweep
+
+
+# In-sample scores to maximise when choosing parameters.
+OBJECTIVES = ("Sharpe Ratio", "Sortino Ratio", "CAGR", "Calmar Ratio")
+
+# Per-process state set by ``_init_worker``.
+_WORKER: dict = {}
+
+
+def _init_worker(returns: np.ndarray, dates: pd.DatetimeIndex, periods_per_year: int, objective: str) -> None:
+    _WORKER.update(returns=returns, dates=dates, periods_per_year=periods_per_year, objective=objective)
+
+
+def _select(window: tuple[int, int, int]) -> dict:
+    """
+    Best combination on the in-sample periods ``[lo, split)`` and its score
+    on the out-of-sample periods ``[split, hi)``.
+    """
+    lo, split, hi = window
+    returns, dates = _WORKER["returns"], _WORKER["dates"]
+    periods_per_year = _WORKER["periods_per_year"]
+    objective = _WORKER["objective"]
+
+    in_sample = BatchPerformanceAnalyzer.compute(
+        returns[:, lo:split], periods_per_year, dates=dates[lo:split]
+    ).metrics
+    # First maximum wins, so ties go to the earlier grid entry.
+    best = int(np.nanargmax(in_sample[objective].to_numpy()))
+    out_of_sample = BatchPerformanceAnalyzer.compute(
+        returns[best, split:hi], periods_per_year, dates=dates[split:hi]
+    ).metrics
+
+    return {
+        "combination": best,
+        "in_sample": in_sample[objective].iloc[best],
+        "out_of_sample": out_of_sample[objective].iloc[0],
+    }
+
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    """
+    ``equity`` is the stitched out-of-sample curve (one row per rebalance
+    period, with the parameters in force), ``windows`` one row per window
+    with its chosen parameters and objective in and out of sample, and
+    ``metrics`` scores the stitched curve against holding the config's
+    parameters over the same periods.
+    """
+
+    equity: pd.DataFrame
+    windows: pd.DataFrame
+    metrics: pd.DataFrame
+
+
+class WalkForward:
+    """
+    Rolling in-sample / out-of-sample parameter selection.
+
+    Every (lookback, skip, top_n) combination is backtested once over the
+    whole range through ``ParameterSweep``, which shares one momentum
+    matrix per (lookback, skip). A window's in-sample score is then a slice
+    of those period returns, so overlapping windows reuse the same signal
+    panels and portfolio returns instead of rerunning backtests. Windows are
+    independent and scored in parallel.
+
+    Window ``k`` picks the combination with the best ``objective`` over its
+    ``in_sample_months`` and holds it for the following
+    ``out_of_sample_months``; windows advance by the out-of-sample length,
+    so out-of-sample periods tile the range without overlap. ``anchored``
+    windows all start at the first period (expanding in-sample). Periods
+    start once every combination has a return, so all candidates are
+    scored on the same months. Every candidate, like the config baseline,
+    is weighted per the config's ``portfolio.weighting``.
+    """
+
+    def __init__(
+        self,
+        backtester: Backtester,
+        lookbacks: list[int],
+        skips: list[int],
+        top_ns: list[int],
+        rebalance: str = "quarterly",
+        in_sample_months: int = 60,
+        out_of_sample_months: int = 12,
+        anchored: bool = False,
+        objective: str = "Sharpe Ratio",
+    ):
+        if rebalance not in PERIODS_PER_YEAR:
+            raise ValueError(f"Unsupported rebalance frequency: {rebalance}")
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unsupported objective: {objective} (available: {', '.join(OBJECTIVES)})")
+
+        months_per_period = 12 // PERIODS_PER_YEAR[rebalance]
+        for months in (in_sample_months, out_of_sample_months):
+            if months <= 0 or months % months_per_period:
+                raise ValueError(
+                    f"Window lengths must be positive multiples of {months_per_period} "
+                    f"months for {rebalance} rebalancing (got {months})"
+                )
+
+        self.backtester = backtester
+        self.rebalance = rebalance
+        self.in_sample = in_sample_months // months_per_period
+        self.out_of_sample = out_of_sample_months // months_per_period
+        self.anchored = anchored
+        self.objective = objective
+
+        # The config's own parameters are always candidates, and the
+        # baseline the walk-forward curve is compared with.
+        self.baseline = {"lookback": backtester.lookback, "skip": backtester.skip, "top_n": backtester.top_n}
+        self.weighting = backtester.weighting
+        self.sweep = ParameterSweep(
+            backtester,
+            sorted(set(lookbacks) | {backtester.lookback}),
+            sorted(set(skips) | {backtester.skip}),
+            sorted(set(top_ns) | {backtester.top_n}),
+            [rebalance],
+        )
+
+    def windows(self, start: int, n_periods: int) -> list[tuple[int, int, int]]:
+        """
+        ``(in-sample start, split, out-of-sample end)`` period positions.
+        """
+        windows = []
+        split = start + self.in_sample
+        while split < n_periods:
+            lo = start if self.anchored else split - self.in_sample
+            windows.append((lo, split, min(split + self.out_of_sample, n_periods)))
+            split += self.out_of_sample
+        return windows
+
+    def run(self, workers: int | None = None) -> WalkForwardResult:
+        workers = workers or os.cpu_count() or 1
+
+        rows, rebalance_dates = self.sweep.period_returns(workers)
+        dates = rebalance_dates[self.rebalance]
+        returns = np.vstack([row.pop("returns") for row in rows])
+        params = pd.DataFrame(rows).drop(columns="rebalance")
+
+        complete = np.flatnonzero(~np.isnan(returns).any(axis=0))
+        windows = self.windows(complete[0], returns.shape[1]) if len(complete) else []
+        if not windows:
+            raise ValueError(
+                "Not enough history for one in-sample window plus one out-of-sample period"
+            )
+
+        periods_per_year = PERIODS_PER_YEAR[self.rebalance]
+        # Period k ends on rebalance date k + 1.
+        init_args = (returns, dates[1:], periods_per_year, self.objective)
+
+        if workers == 1 or len(windows) == 1:
+            _init_worker(*init_args)
+            selections = [_select(window) for window in windows]
+            _WORKER.clear()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(windows)),
+                initializer=_init_worker,
+                initargs=init_args,
+            ) as pool:
+                selections = list(pool.map(_select, windows))
+
+        windows_table = pd.DataFrame([
+            {
+                "window": k,
+                "in_sample_start": dates[lo],
+                "in_sample_end": dates[split],
+                "out_of_sample_end": dates[hi],
+                **params.iloc[selection["combination"]].to_dict(),
+                f"in_sample_{self.objective}": selection["in_sample"],
+                f"out_of_sample_{self.objective}": selection["out_of_sample"],
+            }
+            for k, ((lo, split, hi), selection) in enumerate(zip(windows, selections))
+        ])
+
+        # Stitch each window's out-of-sample periods of its chosen combination.
+        periods = np.concatenate([np.arange(split, hi) for _, split, hi in windows])
+        chosen = np.concatenate([
+            np.full(hi - split, selection["combination"])
+            for (_, split, hi), selection in zip(windows, selections)
+        ])
+        window = np.repeat(np.arange(len(windows)), [hi - split for _, split, hi in windows])
+
+        baseline = int(
+            (params[list(self.baseline)] == pd.Series(self.baseline)).all(axis=1).to_numpy().argmax()
+        )
+        initial_capital = self.backtester.initial_capital
+
+        equity = pd.DataFrame({
+            "rebalance_date": dates[periods],
+            "next_date": dates[periods + 1],
+            "window": window,
+            **{name: params[name].to_numpy()[chosen] for name in params.columns},
+            "portfolio_return": returns[chosen, periods],
+        })
+        equity["capital"] = initial_capital * np.cumprod(1 + equity["portfolio_return"])
+        equity["config_return"] = returns[baseline, periods]
+        equity["config_capital"] = initial_capital * np.cumprod(1 + equity["config_return"])
+
+        metrics = BatchPerformanceAnalyzer.compute(
+            np.vstack([equity["portfolio_return"], equity["config_return"]]),
+            periods_per_year,
+            dates=equity["next_date"],
+        ).metrics
+        metrics.index = [
+            "walk-forward",
+            "config ({lookback}-{skip}, top {top_n}, {weighting})".format(**self.baseline, weighting=self.weighting),
+        ]
+
+        return WalkForwardResult(equity=equity, windows=windows_table, metrics=metrics)
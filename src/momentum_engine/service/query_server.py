@@ -0,0 +1,263 @@
+import asyncio
+import json
+import time
+from typing import Callable
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from momentum_engine.service.ranked_state import RankedState
+
+
+# The service has no authentication: it only ever listens on loopback.
+HOST = "127.0.0.1"
+
+# No route reads a request body; larger ones are refused, not buffered.
+MAX_BODY = 64 * 1024
+
+REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+class QueryServer:
+    """
+    Minimal asyncio HTTP/1.1 JSON service over a ``RankedState``.
+
+    Routes (GET unless noted):
+
+    - ``/health``: state summary and refresh status (``refreshes`` counts
+      completed refreshes, the initial build included).
+    - ``/rank/<ticker>?signal=``: rank and percentile in each universe.
+    - ``/top/<universe>?n=&signal=``: the ``n`` highest ranked names.
+    - ``/snapshot/<universe>?limit=``: ``momentum snapshot`` rows.
+    - ``/signals``: registered signal names.
+    - ``/signals/<ticker>?names=&start=``: month-end signal history.
+    - ``POST /refresh``: rebuild the state now.
+
+    Queries are answered on the event loop from the current state, which
+    is immutable. ``build_state`` runs in a worker thread every
+    ``refresh_interval`` seconds (or on ``POST /refresh``) and the new state
+    replaces the old one only when complete, so readers never wait for a
+    refresh and never see a partial one. A failed refresh keeps the
+    previous state and is reported by ``/health``. Connections are
+    kept alive between requests. A malformed request gets a 400 (413 for a
+    body over ``MAX_BODY``) and its connection is closed.
+    """
+
+    def __init__(
+        self,
+        build_state: Callable[[], RankedState],
+        port: int = 8765,
+        refresh_interval: float | None = 3600,
+        log: Callable[[str], None] = print,
+    ):
+        self.build_state = build_state
+        self.port = port
+        self.refresh_interval = refresh_interval
+        self.log = log
+
+        self.state: RankedState | None = None
+        self.refreshing = False
+        self.last_error: str | None = None
+        self.requests = 0
+        self.refreshes = 0
+
+        self._tasks: set[asyncio.Task] = set()
+        self._server: asyncio.Server | None = None
+
+    async def refresh(self) -> bool:
+        """
+        Build a new state off the event loop and swap it in. Returns False
+        when a refresh was already running or the build failed.
+        """
+        if self.refreshing:
+            return False
+
+        self.refreshing = True
+        start = time.perf_counter()
+        try:
+            state = await asyncio.to_thread(self.build_state)
+        except Exception as error:
+            self.last_error = f"{type(error).__name__}: {error}"
+            self.log(f"Refresh failed: {self.last_error}")
+            return False
+        finally:
+            self.refreshing = False
+
+        self.state = state
+        self.last_error = None
+        self.refreshes += 1
+        self.log(
+            f"State refreshed in {time.perf_counter() - start:.2f}s: "
+            f"{len(state.columns)} tickers, month-end {state.as_of.date()}"
+        )
+        return True
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def start(self) -> None:
+        if self.state is None and not await self.refresh():
+            raise RuntimeError(f"Could not build the initial state: {self.last_error}")
+
+        self._server = await asyncio.start_server(self._handle, HOST, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+        if self.refresh_interval:
+            self._spawn(self._refresh_loop())
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # -------------------------
+    # Routing
+    # -------------------------
+
+    @staticmethod
+    def _int(query: dict, name: str, default: int | None) -> int | None:
+        if name not in query:
+            return default
+        try:
+            return int(query[name][-1])
+        except ValueError:
+            raise ValueError(f"{name} must be an integer") from None
+
+    def dispatch(self, method: str, target: str) -> tuple[int, dict]:
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = parse_qs(url.query)
+        arg = lambda name, default=None: query.get(name, [default])[-1]
+
+        if parts == ["refresh"]:
+            if method != "POST":
+                return 405, {"error": "Use POST /refresh"}
+            self._spawn(self.refresh())
+            return 202, {"refreshing": True}
+
+        if method != "GET":
+            return 405, {"error": f"{method} not allowed"}
+
+        if parts == ["health"]:
+            return 200, {
+                "status": "ok" if self.state is not None else "starting",
+                "refreshing": self.refreshing,
+                "last_error": self.last_error,
+                "requests": self.requests,
+                "refreshes": self.refreshes,
+                **(self.state.summary() if self.state is not None else {}),
+            }
+
+        state = self.state
+        if state is None:
+            return 503, {"error": "State not loaded yet"}
+
+        route = parts[0] if len(parts) in (1, 2) else None
+        name = parts[1] if len(parts) == 2 else None
+
+        try:
+            if route == "rank" and name:
+                return 200, state.rank(name, arg("signal", state.DEFAULT_SIGNAL))
+            if route == "top" and name:
+                return 200, state.top(name, self._int(query, "n", 20), arg("signal", state.DEFAULT_SIGNAL))
+            if route == "snapshot" and name:
+                return 200, state.snapshot(name, self._int(query, "limit", None))
+            if route == "signals" and name is None:
+                return 200, {"signals": state.summary()["signals"]}
+            if route == "signals":
+                names = arg("names")
+                signals = [signal for signal in names.split(",") if signal] if names else None
+                return 200, state.history(name, signals, arg("start"))
+        except KeyError as error:
+            return 404, {"error": error.args[0]}
+        except ValueError as error:
+            return 400, {"error": str(error)}
+
+        return 404, {"error": f"No route for {url.path}"}
+
+    # -------------------------
+    # HTTP
+    # -------------------------
+
+    @staticmethod
+    def _response(status: int, payload: dict, keep_alive: bool) -> bytes:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ")
+                except ValueError:
+                    writer.write(self._response(400, {"error": "Malformed request line"}, False))
+                    break
+
+                headers = {
+                    name.strip().lower(): value.strip()
+                    for name, _, value in (line.partition(":") for line in header_lines)
+                }
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    writer.write(self._response(400, {"error": "Invalid Content-Length"}, False))
+                    break
+                if length > MAX_BODY:
+                    writer.write(self._response(413, {"error": f"Request body over {MAX_BODY} bytes"}, False))
+                    break
+
+                if length:
+                    try:
+                        await reader.readexactly(length)
+                    except asyncio.IncompleteReadError:
+                        # Client went away mid-body.
+                        break
+
+                self.requests += 1
+                status, payload = self.dispatch(method, target)
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(self._response(status, payload, keep_alive))
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
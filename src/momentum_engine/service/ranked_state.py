@@ -0,0 +1,200 @@
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.ranking.panel_ranker import PanelRanker
+from momentum_engine.research.snapshot import TrailingReturnView
+from momentum_engine.signals.registry import SignalContext, SignalRegistry
+from momentum_engine.universe.csv_universe import CSVUniverse
+
+
+def _json_values(values: np.ndarray) -> list:
+    # JSON has no NaN: missing values become null.
+    return [None if value != value else value for value in np.asarray(values, dtype=float).tolist()]
+
+
+class RankedState:
+    """
+    Everything the query service answers from, built once per refresh.
+
+    Holds the month-end panel of the union of the universes, every
+    registered signal over it (one shared ``SignalContext``), the ranking
+    of each universe by each signal on the latest month-end, and the
+    snapshot table of each universe. Per-universe rankings and snapshot
+    rows are stored as JSON-ready lists, so a query is a lookup and a
+    slice. A state is never modified after ``build``; a refresh builds a
+    new one and the service swaps the reference.
+    """
+
+    DEFAULT_SIGNAL = "mom_12_1"
+
+    def __init__(
+        self,
+        universes: dict[str, list[str]],
+        monthly: pd.DataFrame,
+        context: SignalContext,
+        rankings: dict[tuple[str, str], list[dict]],
+        snapshots: dict[str, list[dict]],
+    ):
+        self.universes = universes
+        self.monthly = monthly
+        self.context = context
+        self.rankings = rankings
+        self.snapshots = snapshots
+        self.as_of = monthly.index[-1]
+        self.built_at = datetime.now()
+
+        self.columns = {ticker: i for i, ticker in enumerate(monthly.columns)}
+        self.dates = monthly.index.strftime("%Y-%m-%d").tolist()
+        self.positions = {
+            key: {row["ticker"]: row for row in rows}
+            for key, rows in rankings.items()
+        }
+
+    @staticmethod
+    def load_universes(universe_files: list[str]) -> dict[str, list[str]]:
+        return {
+            Path(universe_file).stem: CSVUniverse(universe_file).get_tickers()
+            for universe_file in universe_files
+        }
+
+    @classmethod
+    def build(
+        cls,
+        universes: dict[str, list[str]],
+        session: PriceSession,
+        start_date: str = "2010-01-01",
+    ) -> "RankedState":
+        tickers = list(dict.fromkeys(t for members in universes.values() for t in members))
+        monthly = session.monthly(tickers, start_date=start_date)
+
+        context = SignalContext(monthly)
+        view = TrailingReturnView.from_monthly(monthly)
+
+        rankings = {}
+        snapshots = {}
+
+        for universe, members in universes.items():
+            columns = monthly.columns.get_indexer(pd.Index(members).unique())
+            columns = columns[columns >= 0]
+            names = monthly.columns[columns]
+
+            for signal in SignalRegistry.names():
+                latest = context.signal(signal)[-1, columns]
+                ranking = PanelRanker.rank(latest)
+                ranks, percentiles = ranking.ranks[0], ranking.percentiles[0]
+
+                order = np.argsort(np.where(np.isnan(ranks), np.inf, ranks), kind="stable")
+                order = order[~np.isnan(ranks[order])]
+
+                rankings[universe, signal] = [
+                    {
+                        "rank": int(ranks[i]),
+                        "ticker": names[i],
+                        "value": float(latest[i]),
+                        "percentile": float(percentiles[i]),
+                    }
+                    for i in order
+                ]
+
+            table = view.frame(members)
+            snapshots[universe] = [
+                dict(zip(table.columns, [row[0], *_json_values(row[1:])]))
+                for row in table.itertuples(index=False)
+            ]
+
+        return cls(universes, monthly, context, rankings, snapshots)
+
+    def _check_signal(self, signal: str) -> str:
+        SignalRegistry.get(signal)
+        return signal
+
+    def _check_universe(self, universe: str) -> str:
+        if universe not in self.universes:
+            raise KeyError(f"Unknown universe: {universe} (available: {', '.join(self.universes)})")
+        return universe
+
+    def summary(self) -> dict:
+        return {
+            "as_of": self.as_of.strftime("%Y-%m-%d"),
+            "built_at": self.built_at.isoformat(timespec="seconds"),
+            "tickers": len(self.columns),
+            "months": len(self.monthly),
+            "universes": {name: len(members) for name, members in self.universes.items()},
+            "signals": SignalRegistry.names(),
+        }
+
+    def rank(self, ticker: str, signal: str = DEFAULT_SIGNAL) -> dict:
+        """
+        Rank and percentile of ``ticker`` in every universe it belongs to.
+        """
+        self._check_signal(signal)
+        if ticker not in self.columns:
+            raise KeyError(f"Unknown ticker: {ticker}")
+
+        ranks = {}
+        for universe in self.universes:
+            rows = self.rankings[universe, signal]
+            row = self.positions[universe, signal].get(ticker)
+            if row is not None:
+                ranks[universe] = {"rank": row["rank"], "percentile": row["percentile"], "ranked": len(rows)}
+
+        value = self.context.signal(signal)[-1, self.columns[ticker]]
+        return {
+            "ticker": ticker,
+            "signal": signal,
+            "as_of": self.as_of.strftime("%Y-%m-%d"),
+            "value": _json_values([value])[0],
+            "universes": ranks,
+        }
+
+    def top(self, universe: str, n: int = 20, signal: str = DEFAULT_SIGNAL) -> dict:
+        self._check_universe(universe)
+        self._check_signal(signal)
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        rows = self.rankings[universe, signal]
+        return {
+            "universe": universe,
+            "signal": signal,
+            "as_of": self.as_of.strftime("%Y-%m-%d"),
+            "ranked": len(rows),
+            "rows": rows[:n],
+        }
+
+    def snapshot(self, universe: str, limit: int | None = None) -> dict:
+        """
+        The ``momentum snapshot`` table of ``universe`` (sorted by MOM_12_1).
+        """
+        self._check_universe(universe)
+        rows = self.snapshots[universe]
+        return {
+            "universe": universe,
+            "as_of": self.as_of.strftime("%Y-%m-%d"),
+            "rows": rows[:limit] if limit else rows,
+        }
+
+    def history(self, ticker: str, signals: list[str] | None = None, start: str | None = None) -> dict:
+        """
+        Month-end history of ``signals`` (all registered by default) for
+        ``ticker``, optionally from ``start``.
+        """
+        if ticker not in self.columns:
+            raise KeyError(f"Unknown ticker: {ticker}")
+        signals = [self._check_signal(signal) for signal in signals or SignalRegistry.names()]
+
+        first = self.monthly.index.searchsorted(pd.Timestamp(start)) if start else 0
+        column = self.columns[ticker]
+
+        return {
+            "ticker": ticker,
+            "dates": self.dates[first:],
+            "signals": {
+                signal: _json_values(self.context.signal(signal)[first:, column])
+                for signal in signals
+            },
+        }
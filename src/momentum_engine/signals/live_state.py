@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from momentum_engine.core.ring_buffer import MonthEndBuffer
+from momentum_engine.ranking.cross_sectional_ranker import CrossSectionalRanker
+
+
+class LiveSignalState(MonthEndBuffer):
+    """
+    Rolling month-end state for incremental live momentum.
+
+    Keeps only the last ``lookback + skip + 1`` month-end prices per ticker
+    in a ``MonthEndBuffer``, plus the current signal and ranking. Appending
+    a new month-end bar updates both in O(universe) without touching
+    history.
+
+    The signal after appending month ``t`` equals
+    ``Momentum12_1(lookback, skip).compute(monthly.loc[:t])``.
+    """
+
+    PARAMETERS = ("lookback", "skip")
+
+    def __init__(self, tickers: list[str], lookback: int = 12, skip: int = 1):
+        super().__init__(tickers, lookback + skip + 1)
+        self.lookback = lookback
+        self.skip = skip
+
+        self.signal = pd.Series(dtype=float)
+        self.ranked = pd.Series(dtype=float)
+
+    @classmethod
+    def from_monthly(cls, monthly: pd.DataFrame, lookback: int = 12, skip: int = 1) -> "LiveSignalState":
+        state = cls(monthly.columns.tolist(), lookback, skip)
+        state.reset(monthly)
+        return state
+
+    def reset(self, monthly: pd.DataFrame) -> None:
+        """
+        Refill the buffer from the last rows of ``monthly``, e.g. after the
+        stored history was rescaled.
+        """
+        self.clear()
+        for date, row in monthly.iloc[-self.size:].iterrows():
+            self.push(date, row)
+        self._refresh()
+
+    def append(self, date, prices: pd.Series) -> pd.Series:
+        """
+        Add the month-end bar for ``date`` and return the updated ranking.
+
+        A bar for the same month as the latest one replaces it.
+        """
+        self.push(date, prices)
+        self._refresh()
+        return self.ranked
+
+    def _refresh(self) -> None:
+        if self.count < self.size:
+            momentum = np.full(len(self.tickers), np.nan)
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                momentum = self.row(self.skip) / self.row(self.lookback + self.skip) - 1
+
+        self.signal = pd.Series(momentum, index=self.tickers).dropna()
+        self.ranked = CrossSectionalRanker.rank(self.signal)
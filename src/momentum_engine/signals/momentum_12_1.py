@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from momentum_engine.data.price_panel import PricePanel
+
 
 class Momentum12_1:
     """
@@ -11,14 +14,32 @@ class Momentum12_1:
         self.lookback = lookback
         self.skip = skip
 
-    def compute(self, monthly_prices: pd.DataFrame) -> pd.Series:
+    def compute(self, monthly_prices: pd.DataFrame | PricePanel) -> pd.Series:
         if len(monthly_prices) < self.lookback + self.skip:
             raise ValueError("Not enough data to compute momentum.")
 
+        if isinstance(monthly_prices, PricePanel):
+            return self._compute_panel(monthly_prices)
+
         momentum = (
             monthly_prices.shift(self.skip)
             / monthly_prices.shift(self.lookback + self.skip)
             - 1
         )
 
-        return momentum.iloc[-1].dropna()
\ No newline at end of file
+        return momentum.iloc[-1].dropna()
+
+    def _compute_panel(self, panel: PricePanel) -> pd.Series:
+        # Only the latest row is needed, so read the two rows directly
+        # instead of shifting the whole panel.
+        last = len(panel) - 1
+        recent = last - self.skip
+        base = last - self.lookback - self.skip
+
+        if base < 0:
+            momentum = np.full(panel.shape[1], np.nan)
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                momentum = panel.values[recent] / panel.values[base] - 1
+
+        return pd.Series(momentum, index=panel.tickers).dropna()
@@ -0,0 +1,249 @@
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.data.price_panel import PricePanel
+
+
+MONTHS_PER_YEAR = 12
+
+
+class SignalContext:
+    """
+    Month-end price panel plus the intermediates signals share.
+
+    Shifted rows, momentum ratios, log returns, their running sums, rolling
+    maxima and cross-sectional z-scores are computed on first use and
+    memoised, so evaluating several signals over one context computes each
+    piece once. All results are dates x tickers arrays aligned with the
+    panel; a value is NaN until its full window of history is available.
+    """
+
+    def __init__(self, monthly: pd.DataFrame | PricePanel):
+        if isinstance(monthly, PricePanel):
+            self.values = np.asarray(monthly.values, dtype=float)
+            self.dates, self.tickers = monthly.dates, monthly.tickers
+        else:
+            self.values = monthly.to_numpy(dtype=float)
+            self.dates, self.tickers = monthly.index, monthly.columns
+
+        self._memo: dict[tuple, np.ndarray] = {}
+
+    def _cached(self, key: tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def frame(self, values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=self.dates, columns=self.tickers)
+
+    def shifted(self, periods: int) -> np.ndarray:
+        def compute():
+            shifted = np.full_like(self.values, np.nan)
+            if periods == 0:
+                shifted[:] = self.values
+            elif periods < len(self.values):
+                shifted[periods:] = self.values[:-periods]
+            return shifted
+
+        return self._cached(("shifted", periods), compute)
+
+    def momentum(self, lookback: int, skip: int) -> np.ndarray:
+        """
+        ``Price(t-skip) / Price(t-lookback-skip) - 1``, as in ``Momentum12_1``.
+        """
+        def compute():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return self.shifted(skip) / self.shifted(lookback + skip) - 1
+
+        return self._cached(("momentum", lookback, skip), compute)
+
+    def log_returns(self) -> np.ndarray:
+        def compute():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns = np.log(self.values / self.shifted(1))
+            returns[~np.isfinite(returns)] = np.nan
+            return returns
+
+        return self._cached(("log_returns",), compute)
+
+    def _running_sums(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Running sums (with a leading zero row) of log returns, their
+        # squares and missing counts: any trailing window is two lookups.
+        def compute():
+            returns = self.log_returns()
+            missing = np.isnan(returns)
+            filled = np.where(missing, 0.0, returns)
+
+            sums = np.empty((3, len(returns) + 1, returns.shape[1]))
+            sums[:, 0] = 0.0
+            np.cumsum(filled, axis=0, out=sums[0, 1:])
+            np.cumsum(np.square(filled, out=filled), axis=0, out=sums[1, 1:])
+            np.cumsum(missing, axis=0, out=sums[2, 1:])
+            return sums
+
+        sums = self._cached(("running_sums",), compute)
+        return sums[0], sums[1], sums[2]
+
+    def rolling_vol(self, window: int) -> np.ndarray:
+        """
+        Annualised volatility of the ``window`` monthly log returns ending
+        at each row.
+        """
+        def compute():
+            total, squares, missing = self._running_sums()
+            n_rows = len(self.values)
+
+            vol = np.full_like(self.values, np.nan)
+            if window < 2 or window >= n_rows:
+                return vol
+
+            # Window ending at row t covers returns t-window+1..t, i.e. running
+            # sum rows t+1 and t+1-window.
+            end, start = slice(window + 1, None), slice(1, n_rows + 1 - window)
+            s1 = total[end] - total[start]
+            variance = squares[end] - squares[start] - s1 * s1 / window
+            np.maximum(variance, 0.0, out=variance)
+
+            vol[window:] = np.sqrt(variance * (MONTHS_PER_YEAR / (window - 1)))
+            vol[window:][missing[end] != missing[start]] = np.nan
+            return vol
+
+        return self._cached(("rolling_vol", window), compute)
+
+    def rolling_max(self, window: int) -> np.ndarray:
+        """
+        Highest month-end price over the ``window`` rows ending at each row.
+        """
+        def compute():
+            result = np.full_like(self.values, np.nan)
+            if window <= len(self.values):
+                windows = np.lib.stride_tricks.sliding_window_view(self.values, window, axis=0)
+                result[window - 1:] = windows.max(axis=-1)
+            return result
+
+        return self._cached(("rolling_max", window), compute)
+
+    def signal(self, name: str) -> np.ndarray:
+        return self._cached(("signal", name), lambda: SignalRegistry.get(name)(self))
+
+    def zscore(self, name: str) -> np.ndarray:
+        """
+        Cross-sectional z-score of a signal on each row (NaNs ignored).
+        """
+        def compute():
+            values = self.signal(name)
+            finite = np.isfinite(values)
+            count = finite.sum(axis=1, keepdims=True)
+            filled = np.where(finite, values, 0.0)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = filled.sum(axis=1, keepdims=True) / count
+                filled -= mean
+                filled[~finite] = 0.0
+                std = np.sqrt(np.einsum("ij,ij->i", filled, filled)[:, None] / count)
+                z = filled / std
+
+            z[~finite | ~np.isfinite(z)] = np.nan
+            return z
+
+        return self._cached(("zscore", name), compute)
+
+
+class SignalRegistry:
+    """
+    Named cross-sectional signals evaluated over a shared ``SignalContext``.
+
+    Each signal is a function of the context returning a dates x tickers
+    array; signals built from the same intermediates (or from other
+    signals, like ``composite``) reuse them instead of recomputing.
+    """
+
+    _signals: dict[str, Callable[[SignalContext], np.ndarray]] = {}
+
+    # Components of the composite z-score.
+    COMPOSITE = ("mom_12_1", "mom_6_1", "vol_adj_12_1", "high_52w")
+
+    @classmethod
+    def register(cls, name: str):
+        def decorator(function: Callable[[SignalContext], np.ndarray]):
+            cls._signals[name] = function
+            return function
+        return decorator
+
+    @classmethod
+    def names(cls) -> list[str]:
+        return list(cls._signals)
+
+    @classmethod
+    def get(cls, name: str) -> Callable[[SignalContext], np.ndarray]:
+        if name not in cls._signals:
+            raise ValueError(f"Unknown signal: {name} (available: {', '.join(cls._signals)})")
+        return cls._signals[name]
+
+    @classmethod
+    def compute(
+        cls,
+        monthly: pd.DataFrame | PricePanel | SignalContext,
+        names: list[str] | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Full history of each requested signal (all registered by default).
+        """
+        context = monthly if isinstance(monthly, SignalContext) else SignalContext(monthly)
+        return {name: context.frame(context.signal(name)) for name in names or cls.names()}
+
+    @classmethod
+    def latest(
+        cls,
+        monthly: pd.DataFrame | PricePanel | SignalContext,
+        names: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Tickers x signals table for the last row of the panel.
+        """
+        context = monthly if isinstance(monthly, SignalContext) else SignalContext(monthly)
+        names = names or cls.names()
+        return pd.DataFrame(
+            {name: context.signal(name)[-1] for name in names},
+            index=context.tickers,
+        )
+
+
+@SignalRegistry.register("mom_12_1")
+def momentum_12_1(context: SignalContext) -> np.ndarray:
+    return context.momentum(12, 1)
+
+
+@SignalRegistry.register("mom_6_1")
+def momentum_6_1(context: SignalContext) -> np.ndarray:
+    return context.momentum(6, 1)
+
+
+@SignalRegistry.register("vol_adj_12_1")
+def volatility_adjusted_momentum(context: SignalContext) -> np.ndarray:
+    # 12-1 momentum per unit of annualised volatility of the 12 monthly
+    # returns it spans (the window ending one month back).
+    vol = np.full_like(context.values, np.nan)
+    vol[1:] = context.rolling_vol(12)[:-1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        signal = context.momentum(12, 1) / vol
+    signal[~np.isfinite(signal)] = np.nan
+    return signal
+
+
+@SignalRegistry.register("high_52w")
+def high_52w_proximity(context: SignalContext) -> np.ndarray:
+    # Month-end close relative to the highest of the last 12 month-end
+    # closes (a month-end approximation of the 52-week high).
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return context.values / context.rolling_max(12)
+
+
+@SignalRegistry.register("composite")
+def composite_zscore(context: SignalContext) -> np.ndarray:
+    # Equal-weight mean of the components' cross-sectional z-scores;
+    # NaN where any component is missing.
+    return np.mean([context.zscore(name) for name in SignalRegistry.COMPOSITE], axis=0)
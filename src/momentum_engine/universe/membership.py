@@ -0,0 +1,105 @@
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from momentum_engine.universe.csv_universe import CSVUniverse
+
+
+class MembershipIndex:
+    """
+    Point-in-time index membership built from dated constituent files.
+
+    Expects a directory of universe CSVs whose names start with the date the
+    list became effective, e.g. ``2015-03-31_nifty100.csv``. Each file is
+    read with ``CSVUniverse``. A ticker is a member from the first file that
+    lists it until the first later file that does not (half-open interval).
+    There are no members before the earliest file.
+    """
+
+    DATE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+
+    def __init__(self, tickers: list[str], codes: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+        self.tickers = pd.Index(tickers)
+        self.codes = codes
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def from_directory(cls, directory: str) -> "MembershipIndex":
+        path = Path(directory)
+        if not path.is_dir():
+            raise FileNotFoundError(f"Membership directory not found: {path}")
+
+        snapshots = []
+        for file in sorted(path.glob("*.csv")):
+            match = cls.DATE_PATTERN.match(file.name)
+            if match:
+                snapshots.append((pd.Timestamp(match.group(1)), CSVUniverse(str(file)).get_tickers()))
+
+        if not snapshots:
+            raise ValueError(f"No dated constituent files (YYYY-MM-DD*.csv) in {path}")
+
+        snapshots.sort(key=lambda snapshot: snapshot[0])
+        return cls.from_snapshots(snapshots)
+
+    @classmethod
+    def from_snapshots(cls, snapshots: list[tuple[pd.Timestamp, list[str]]]) -> "MembershipIndex":
+        tickers: dict[str, int] = {}
+        open_since: dict[str, pd.Timestamp] = {}
+        intervals: list[tuple[int, pd.Timestamp, pd.Timestamp]] = []
+
+        for date, members in snapshots:
+            members = set(members)
+
+            for ticker in [t for t in open_since if t not in members]:
+                intervals.append((tickers[ticker], open_since.pop(ticker), date))
+
+            for ticker in members:
+                tickers.setdefault(ticker, len(tickers))
+                open_since.setdefault(ticker, date)
+
+        for ticker, start in open_since.items():
+            intervals.append((tickers[ticker], start, pd.Timestamp.max))
+
+        codes = np.array([code for code, _, _ in intervals], dtype=np.intp)
+        starts = np.array([start for _, start, _ in intervals], dtype="datetime64[ns]")
+        ends = np.array([end for _, _, end in intervals], dtype="datetime64[ns]")
+
+        return cls(list(tickers), codes, starts, ends)
+
+    def ever_members(self, start, end) -> list[str]:
+        """
+        Tickers that were members at any point in ``[start, end]``.
+        """
+        start = np.datetime64(pd.Timestamp(start), "ns")
+        end = np.datetime64(pd.Timestamp(end), "ns")
+
+        overlapping = (self.starts <= end) & (self.ends > start)
+        codes = np.unique(self.codes[overlapping])
+        return self.tickers[codes].tolist()
+
+    def members(self, date) -> list[str]:
+        return self.ever_members(date, date)
+
+    def mask(self, dates, tickers) -> np.ndarray:
+        """
+        Boolean dates x tickers matrix, True where the ticker was a member.
+
+        Built with one ``searchsorted`` per interval bound and a cumulative
+        sum, so cost is independent of the number of rebalance dates.
+        """
+        dates = pd.DatetimeIndex(dates).values
+        columns = pd.Index(tickers).get_indexer(self.tickers)[self.codes]
+        known = columns >= 0
+
+        lo = np.searchsorted(dates, self.starts[known], side="left")
+        hi = np.searchsorted(dates, self.ends[known], side="left")
+        columns = columns[known]
+
+        counts = np.zeros((len(dates) + 1, len(tickers)), dtype=np.int32)
+        np.add.at(counts, (lo, columns), 1)
+        np.add.at(counts, (hi, columns), -1)
+
+        return np.cumsum(counts, axis=0)[:-1] > 0
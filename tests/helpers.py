@@ -0,0 +1,56 @@
+import pandas as pd
+import yaml
+
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+
+
+class AdjustedSource:
+    """
+    Synthetic source that back-adjusts ``ticker`` by ``factor`` before
+    ``ex_date``, as Yahoo does after a split or dividend.
+    """
+
+    def __init__(self, end_date: str, ticker: str | None = None, ex_date: str | None = None, factor: float = 1.0):
+        self.source = SyntheticPriceFetcher(end_date=end_date)
+        self.ticker = ticker
+        self.ex_date = ex_date
+        self.factor = factor
+        self.calls = self.source.calls
+
+    def fetch(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        prices = self.source.fetch(tickers, start_date)
+        if self.ticker in prices.columns:
+            prices.loc[prices.index < self.ex_date, self.ticker] *= self.factor
+        return prices
+
+
+def expire(store) -> None:
+    # Pretend the last sync happened on an earlier day.
+    for entry in store._manifest.values():
+        entry["synced"] = "2000-01-01"
+
+
+def write_universe(path, tickers: list[str]) -> str:
+    pd.DataFrame({"ticker": tickers}).to_csv(path, index=False)
+    return str(path)
+
+
+def write_config(
+    workdir,
+    universe: str,
+    start_date: str = "2016-01-01",
+    end_date: str = "2024-12-31",
+    lookback: int = 12,
+    skip: int = 1,
+    **portfolio,
+) -> str:
+    config = {
+        "backtest": {"start_date": start_date, "end_date": end_date, "initial_capital": 1_000_000},
+        "universe": {"name": "synthetic", "file": universe},
+        "momentum": {"lookback_months": lookback, "skip_recent_months": skip},
+        "portfolio": {"top_n": 5, "weighting": "equal", **portfolio},
+        "output": {"directory": str(workdir / "output")},
+    }
+    path = workdir / "research.yaml"
+    path.write_text(yaml.safe_dump(config))
+    return str(path)
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.batch_performance import BatchPerformanceAnalyzer
+from momentum_engine.research.performance import PerformanceAnalyzer
+from momentum_engine.research.sweep import ParameterSweep
+
+from helpers import write_config, write_universe
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:02d}.NS" for i in range(15)]
+SHARED = ["CAGR", "Annualized Volatility", "Sharpe Ratio", "Max Drawdown"]
+
+
+def results_frame(returns: list[float], initial_capital: float = 100.0) -> pd.DataFrame:
+    dates = pd.date_range("2020-03-31", periods=len(returns) + 1, freq="QE")
+    returns = np.asarray(returns, dtype=float)
+    return pd.DataFrame({
+        "rebalance_date": dates[:-1],
+        "next_date": dates[1:],
+        "portfolio_return": returns,
+        "capital": initial_capital * np.cumprod(1 + returns),
+    })
+
+
+def assert_matches_performance_analyzer(row: pd.Series, results: pd.DataFrame, periods_per_year: int = 4):
+    expected = PerformanceAnalyzer.compute_metrics(results, periods_per_year)
+    for name in SHARED:
+        np.testing.assert_allclose(row[name], expected[name], rtol=1e-12, err_msg=name)
+
+
+@pytest.mark.parametrize("returns", [
+    [-0.2, 0.1, 0.05, -0.03],
+    [0.04, -0.1, 0.02, 0.03, -0.05, 0.08, 0.01],
+    [0.1, -0.02, np.nan, 0.05, 0.03],
+])
+def test_metrics_match_performance_analyzer(returns):
+    results = results_frame(returns)
+    row = BatchPerformanceAnalyzer.compute(results["portfolio_return"].to_numpy(), dates=results["next_date"]).metrics.iloc[0]
+    assert_matches_performance_analyzer(row, results)
+
+
+def test_first_period_loss_is_not_a_drawdown():
+    row = BatchPerformanceAnalyzer.compute([-0.2, 0.1, 0.05, -0.03]).metrics.iloc[0]
+    assert row["Max Drawdown"] == pytest.approx(-0.03)
+
+
+def test_leading_padding_is_skipped():
+    # A strategy that starts two periods late scores as if it had no padding.
+    returns = [0.04, -0.1, 0.02, 0.03, -0.05]
+    dates = pd.date_range("2020-03-31", periods=7, freq="QE")
+    metrics = BatchPerformanceAnalyzer.compute(
+        np.array([[np.nan, np.nan, *returns], [0.01, 0.02, *returns]]), dates=dates
+    ).metrics
+
+    unpadded = BatchPerformanceAnalyzer.compute(returns, dates=dates[2:]).metrics.iloc[0]
+    pd.testing.assert_series_equal(metrics.iloc[0], unpadded, check_names=False)
+    assert not metrics.iloc[1].equals(unpadded)
+
+
+def test_sweep_row_matches_backtest(tmp_path):
+    universe = write_universe(tmp_path / "universe.csv", TICKERS)
+    config = write_config(tmp_path, universe)
+
+    def backtester() -> Backtester:
+        return Backtester(config, session=PriceSession(SyntheticPriceFetcher(end_date=END_DATE)))
+
+    results = backtester().run_vectorized()
+    sweep = ParameterSweep(backtester(), [6, 12], [1], [5], ["quarterly"]).run(workers=1)
+
+    row = sweep.set_index(["lookback", "skip", "top_n"]).loc[(12, 1, 5)]
+    assert row["periods"] == len(results)
+    assert_matches_performance_analyzer(row, results)
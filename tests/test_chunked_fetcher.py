@@ -0,0 +1,86 @@
+import pandas as pd
+
+from momentum_engine.cli.main import echo_download_failures
+from momentum_engine.data.chunked_fetcher import ChunkedPriceFetcher
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.price_store import PriceStore, StoredPriceFetcher
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+
+
+END_DATE = "2024-06-28"
+TICKERS = ["AAA.NS", "BBB.NS", "CCC.NS", "DDD.NS", "EEE.NS"]
+
+
+def make_fetcher(source, sleeps, **kwargs):
+    options = {"chunk_size": 2, "max_workers": 2, "requests_per_second": 0, "backoff": 0.5}
+    options.update(kwargs)
+    return ChunkedPriceFetcher(download=source.fetch, sleep=sleeps.append, **options)
+
+
+def test_transient_errors_are_retried_with_exponential_backoff():
+    source = SyntheticPriceFetcher(end_date=END_DATE, transient_errors=2)
+    sleeps = []
+    fetcher = make_fetcher(source, sleeps, chunk_size=len(TICKERS), max_workers=1)
+
+    prices = fetcher.fetch(TICKERS, "2024-01-01")
+
+    expected = SyntheticPriceFetcher(end_date=END_DATE).fetch(TICKERS, "2024-01-01")
+    pd.testing.assert_frame_equal(prices, expected)
+    assert sleeps == [0.5, 1.0]
+    assert len(source.calls) == 3
+    assert fetcher.failures == {}
+
+
+def test_failing_ticker_is_isolated_from_its_chunk():
+    source = SyntheticPriceFetcher(end_date=END_DATE, failing={"BBB.NS"})
+    fetcher = make_fetcher(source, [], retries=1)
+
+    prices = fetcher.fetch(TICKERS, "2024-01-01")
+
+    assert list(prices.columns) == ["AAA.NS", "CCC.NS", "DDD.NS", "EEE.NS"]
+    assert not prices.isna().any().any()
+    assert list(fetcher.failures) == ["BBB.NS"]
+    assert fetcher.failures["BBB.NS"].startswith("ValueError")
+
+    # Chunks without the bad ticker were requested once; its own chunk was
+    # retried, then split into single-ticker requests.
+    requested = [tickers for tickers, _ in source.calls]
+    assert requested.count(["CCC.NS", "DDD.NS"]) == 1
+    assert requested.count(["AAA.NS", "BBB.NS"]) == 2
+    assert ["AAA.NS"] in requested and ["BBB.NS"] in requested
+
+
+def test_failures_accumulate_across_calls_until_cleared():
+    source = SyntheticPriceFetcher(end_date=END_DATE, failing={"BBB.NS"})
+    fetcher = make_fetcher(source, [], retries=0)
+
+    fetcher.fetch(["BBB.NS"], "2024-01-01")
+    fetcher.fetch(["AAA.NS"], "2024-03-01")
+    assert list(fetcher.failures) == ["BBB.NS"]
+
+    fetcher.clear_failures()
+    assert fetcher.failures == {}
+
+
+def test_failures_from_every_sync_group_are_reported(tmp_path, capsys):
+    source = SyntheticPriceFetcher(end_date=END_DATE, failing={"BBB.NS"})
+    downloader = make_fetcher(source, [], retries=0)
+    store = PriceStore(str(tmp_path / "prices"))
+
+    # AAA is already stored, so the next sync requests it from a later
+    # start date than BBB: two groups, two downloader calls.
+    StoredPriceFetcher(store, source=downloader.fetch).sync(["AAA.NS"], "2024-01-01")
+    store._manifest["AAA.NS"]["synced"] = "2000-01-01"
+    downloader.clear_failures()
+    source.calls.clear()
+
+    session = PriceSession(StoredPriceFetcher(store, source=downloader.fetch))
+    session.downloader = downloader
+    session.daily(["BBB.NS", "AAA.NS"], "2024-01-01")
+
+    assert len({start for _, start in source.calls}) == 2
+    echo_download_failures(session)
+    output = capsys.readouterr().out
+    assert "Download failures (1):" in output
+    assert "BBB.NS: ValueError" in output
+    assert downloader.failures == {}
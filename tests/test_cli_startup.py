@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+# Dependencies the CLI module must leave to the commands that use them.
+HEAVY_MODULES = ["pandas", "numpy", "yfinance", "plotly", "scipy"]
+
+
+def loaded_modules(code: str) -> list[str]:
+    probe = f"""
+import json, sys
+{code}
+print(json.dumps(sorted({{name.split(".")[0] for name in sys.modules}} & set({HEAVY_MODULES!r}))))
+"""
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_cli_import_is_light():
+    assert loaded_modules("import momentum_engine.cli.main") == []
+
+
+@pytest.mark.parametrize("args", [["version"], ["--help"], ["backtest", "--help"]])
+def test_light_commands_are_light(args):
+    code = f"""
+from momentum_engine.cli.main import cli
+try:
+    cli({args!r}, standalone_mode=False)
+except SystemExit:
+    pass
+"""
+    assert loaded_modules(code) == []
@@ -0,0 +1,94 @@
+import base64
+import json
+import re
+import time
+
+import numpy as np
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.decision.diagnostics import MomentumDiagnostics
+from momentum_engine.ranking.cross_sectional_ranker import CrossSectionalRanker
+from momentum_engine.signals.momentum_12_1 import Momentum12_1
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:03d}.NS" for i in range(100)]
+
+
+@pytest.fixture(scope="module")
+def session():
+    session = PriceSession(SyntheticPriceFetcher(end_date=END_DATE))
+    session.monthly(TICKERS, start_date="2010-01-01")
+    return session
+
+
+def report(session, tmp_path, tickers, **kwargs) -> tuple[MomentumDiagnostics, str]:
+    ranked = CrossSectionalRanker.rank(Momentum12_1().compute(session.monthly(TICKERS, start_date="2010-01-01")))
+    diagnostics = MomentumDiagnostics(tickers, ranked, str(tmp_path), session=session, plotlyjs="cdn", **kwargs)
+    with open(diagnostics.generate(), encoding="utf-8") as f:
+        return diagnostics, f.read()
+
+
+def decode_block(html: str) -> dict:
+    block = json.loads(re.search(r'<script id="series-data" type="application/json">(.*?)</script>', html).group(1))
+    tickers = block["tickers"]
+    days = np.frombuffer(base64.b64decode(block["dates"]), dtype="<i4")
+
+    def columns(name):
+        values = np.frombuffer(base64.b64decode(block[name]), dtype="<f4")
+        return values.reshape(len(tickers), len(days)).T
+
+    return {
+        "tickers": tickers,
+        "dates": days.astype("datetime64[D]"),
+        "prices": columns("prices"),
+        "momentum": columns("momentum"),
+    }
+
+
+def test_full_is_the_default_mode():
+    assert MomentumDiagnostics(["SYN000.NS"], None, "unused").mode == "full"
+
+
+def test_compact_block_decodes_to_the_monthly_series(session, tmp_path):
+    selected = TICKERS[:8]
+    diagnostics, html = report(session, tmp_path, selected, mode="compact")
+    block = decode_block(html)
+
+    monthly = session.monthly(selected, start_date="2010-01-01")
+    momentum = diagnostics._compute_full_momentum_series(monthly)
+    tickers = block["tickers"]
+
+    assert sorted(tickers) == sorted(selected)
+    np.testing.assert_array_equal(block["dates"], monthly.index.values.astype("datetime64[D]"))
+    np.testing.assert_array_equal(block["prices"], monthly[tickers].to_numpy(dtype=np.float32))
+    np.testing.assert_array_equal(block["momentum"], momentum[tickers].to_numpy(dtype=np.float32))
+
+
+def test_decimation_keeps_the_latest_bar(session, tmp_path):
+    selected = TICKERS[:3]
+    diagnostics, html = report(session, tmp_path, selected, mode="compact", max_points=50)
+    block = decode_block(html)
+
+    monthly = session.monthly(selected, start_date="2010-01-01")
+    assert len(block["dates"]) <= 51
+    assert block["dates"][-1] == monthly.index[-1].to_datetime64().astype("datetime64[D]")
+    np.testing.assert_array_equal(
+        block["prices"][-1], monthly[block["tickers"]].iloc[-1].to_numpy(dtype=np.float32)
+    )
+
+    for n_rows in (1, 49, 50, 51, 99, 100, 101, 1000):
+        keep = MomentumDiagnostics._decimate(n_rows, 50)
+        assert keep[0] == 0 and keep[-1] == n_rows - 1
+        assert (np.diff(keep) > 0).all()
+        assert len(keep) <= 51
+
+
+def test_compact_build_for_100_tickers_is_under_a_second(session, tmp_path):
+    report(session, tmp_path, TICKERS, mode="compact")
+
+    start = time.perf_counter()
+    report(session, tmp_path, TICKERS, mode="compact")
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.price_store import PriceStore, StoredPriceFetcher
+from momentum_engine.engine import LiveMomentumEngine
+from momentum_engine.signals.live_state import LiveSignalState
+from momentum_engine.signals.momentum_12_1 import Momentum12_1
+from momentum_engine.universe.nifty100 import Nifty100Universe
+
+from helpers import AdjustedSource, expire
+
+
+TICKERS = ["AAA.NS", "BBB.NS", "CCC.NS", "DDD.NS"]
+SEEDED = "2024-04-15"
+UPDATED = "2024-07-15"
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    monkeypatch.setattr(Nifty100Universe, "get_tickers", staticmethod(lambda: list(TICKERS)))
+
+    path = tmp_path / "live.yaml"
+    path.write_text(yaml.safe_dump({
+        "universe": {"name": "nifty100"},
+        "data": {"start_date": "2020-01-01"},
+        "momentum": {"lookback_months": 12, "skip_recent_months": 1},
+        "portfolio": {"top_n": 2, "weighting": "equal"},
+        "output": {"directory": str(tmp_path / "output")},
+    }))
+    return str(path)
+
+
+def engine(config, store, source) -> LiveMomentumEngine:
+    return LiveMomentumEngine(config, session=PriceSession(StoredPriceFetcher(store, source=source.fetch)))
+
+
+def test_save_writes_exactly_the_given_path(tmp_path):
+    monthly = pd.DataFrame(
+        np.arange(1.0, 61.0).reshape(15, 4),
+        index=pd.date_range("2023-01-31", periods=15, freq="ME"),
+        columns=TICKERS,
+    )
+    state = LiveSignalState.from_monthly(monthly)
+
+    path = tmp_path / "live_state"
+    state.save(str(path))
+    assert path.exists() and not (tmp_path / "live_state.npz").exists()
+
+    loaded = LiveSignalState.load(str(path))
+    assert loaded.last_date == state.last_date
+    pd.testing.assert_series_equal(loaded.ranked, state.ranked)
+
+
+@pytest.mark.parametrize("factor", [1.0, 0.5])
+def test_update_matches_seed_after_rebase(tmp_path, config, factor):
+    store = PriceStore(str(tmp_path / "prices"))
+    state = engine(config, store, AdjustedSource(SEEDED)).seed_state(pd.Timestamp(SEEDED))
+    assert state.rebased == [0, 0, 0, 0]
+
+    # AAA splits 2:1 (factor 0.5) after the state was seeded.
+    expire(store)
+    source = AdjustedSource(UPDATED, ticker="AAA.NS", ex_date="2024-06-10", factor=factor)
+    paths = engine(config, store, source).update_state(state, pd.Timestamp(UPDATED))
+
+    assert len(paths) == 3
+    assert state.rebased == store.rebased(TICKERS)
+
+    monthly = PriceSession(source).monthly(TICKERS, "2020-01-01").loc[:"2024-06-30"]
+    expected = Momentum12_1().compute(monthly)
+    pd.testing.assert_series_equal(state.signal, expected, check_names=False, rtol=1e-12)
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_panel import PricePanel
+from momentum_engine.ranking.cross_sectional_ranker import CrossSectionalRanker
+from momentum_engine.ranking.panel_ranker import PanelRanker
+
+
+def reference_ranks(values: np.ndarray) -> np.ndarray:
+    # Full stable sort of each row: highest first, earlier column on ties.
+    ranks = np.full(values.shape, np.nan)
+    for i, row in enumerate(values):
+        order = sorted(np.flatnonzero(~np.isnan(row)), key=lambda j: (-row[j], j))
+        ranks[i, order] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def random_signals(seed: int, shape=(200, 30)) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    # Few distinct values, so ties are common.
+    values = rng.integers(-5, 6, shape).astype(float)
+    values[rng.random(shape) < 0.3] = np.nan
+    values[rng.random(shape) < 0.02] = np.inf
+    values[rng.random(shape) < 0.02] = -np.inf
+    values[:5] = np.nan
+    values[5:10, 3:] = np.nan
+    return values
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rank_matches_a_full_stable_sort(seed):
+    values = random_signals(seed)
+    ranking = PanelRanker.rank(values, top_n=7)
+    expected = reference_ranks(values)
+
+    np.testing.assert_array_equal(ranking.ranks, expected)
+    np.testing.assert_array_equal(ranking.top_n, expected <= 7)
+
+    n_valid = (~np.isnan(values)).sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.testing.assert_allclose(ranking.percentiles, (n_valid - expected + 1) / n_valid)
+
+
+@pytest.mark.parametrize("top_n", [0, 1, 3, 7, 29, 30, 45])
+@pytest.mark.parametrize("seed", range(3))
+def test_top_n_mask_matches_a_full_stable_sort(seed, top_n):
+    values = random_signals(seed)
+    np.testing.assert_array_equal(PanelRanker.top_n_mask(values, top_n), reference_ranks(values) <= top_n)
+
+
+def test_ties_go_to_the_earlier_column():
+    values = np.array([[1.0, 2.0, 2.0, 2.0, 0.5]])
+
+    np.testing.assert_array_equal(PanelRanker.top_n_mask(values, 2), [[False, True, True, False, False]])
+    np.testing.assert_array_equal(PanelRanker.rank(values).ranks, [[4.0, 1.0, 2.0, 3.0, 5.0]])
+
+
+def test_all_nan_rows_select_nothing():
+    values = np.full((2, 4), np.nan)
+    ranking = PanelRanker.rank(values, top_n=2)
+
+    assert not PanelRanker.top_n_mask(values, 2).any()
+    assert np.isnan(ranking.ranks).all() and np.isnan(ranking.percentiles).all()
+    assert not ranking.top_n.any()
+
+
+def test_rows_with_fewer_valid_than_top_n_select_all_valid():
+    values = np.array([
+        [np.nan, 1.0, np.nan, 3.0, np.nan],
+        [np.nan, np.nan, -2.0, np.nan, np.nan],
+    ])
+    valid = ~np.isnan(values)
+
+    np.testing.assert_array_equal(PanelRanker.top_n_mask(values, 3), valid)
+    ranking = PanelRanker.rank(values, top_n=3)
+    np.testing.assert_array_equal(ranking.top_n, valid)
+    np.testing.assert_array_equal(ranking.ranks[0], [np.nan, 2.0, np.nan, 1.0, np.nan])
+    np.testing.assert_array_equal(ranking.percentiles[1], [np.nan, np.nan, 1.0, np.nan, np.nan])
+
+
+def test_inputs_and_cross_sectional_ranker_agree():
+    values = random_signals(0)
+    dates = pd.date_range("2000-01-31", periods=len(values), freq="ME")
+    tickers = [f"SYN{i:02d}.NS" for i in range(values.shape[1])]
+    frame = pd.DataFrame(values, index=dates, columns=tickers)
+
+    expected = PanelRanker.rank(values).ranks
+    np.testing.assert_array_equal(PanelRanker.rank(frame).ranks, expected)
+    np.testing.assert_array_equal(PanelRanker.rank(PricePanel.from_frame(frame)).ranks, expected)
+
+    # A single row (Series) ranks as a 1 x tickers matrix.
+    row = frame.iloc[-1]
+    ranks = pd.Series(PanelRanker.rank(row).ranks[0], index=tickers).dropna()
+    assert list(CrossSectionalRanker.rank(row.dropna()).index) == list(ranks.sort_values().index)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_panel import PricePanel
+
+
+TICKERS = [f"SYN{i:02d}.NS" for i in range(6)]
+
+
+@pytest.fixture
+def panel():
+    dates = pd.date_range("2020-01-31", periods=24, freq="ME")
+    values = np.arange(len(dates) * len(TICKERS), dtype=float).reshape(len(dates), len(TICKERS))
+    return PricePanel(values, dates, TICKERS)
+
+
+def assert_view(result: PricePanel | np.ndarray, panel: PricePanel) -> None:
+    values = result.values if isinstance(result, PricePanel) else result
+    assert np.shares_memory(values, panel.values)
+    if isinstance(result, PricePanel):
+        assert result.is_view
+
+
+def test_window_is_a_view(panel):
+    window = panel.window("2020-06-30", "2021-03-31")
+
+    assert_view(window, panel)
+    assert window.dates[0] == pd.Timestamp("2020-06-30")
+    assert window.dates[-1] == pd.Timestamp("2021-03-31")
+    np.testing.assert_array_equal(window.values, panel.values[5:15])
+
+    # Open bounds.
+    assert len(panel.window(end="2020-03-31")) == 3
+    assert len(panel.window(start="2021-11-30")) == 2
+
+
+def test_rows_and_column_are_views(panel):
+    rows = panel.rows(3, 9)
+    assert_view(rows, panel)
+    np.testing.assert_array_equal(rows.values, panel.values[3:9])
+
+    column = panel.column(TICKERS[2])
+    assert_view(column, panel)
+    np.testing.assert_array_equal(column, panel.values[:, 2])
+
+
+def test_contiguous_columns_are_a_view(panel):
+    selected = panel.columns(TICKERS[1:4])
+
+    assert_view(selected, panel)
+    assert selected.tickers.tolist() == TICKERS[1:4]
+    np.testing.assert_array_equal(selected.values, panel.values[:, 1:4])
+
+
+def test_scattered_columns_are_a_copy(panel):
+    selected = panel.columns([TICKERS[4], TICKERS[0]])
+
+    assert not np.shares_memory(selected.values, panel.values)
+    np.testing.assert_array_equal(selected.values, panel.values[:, [4, 0]])
+
+
+def test_load_is_memory_mapped(tmp_path, panel):
+    panel.save(str(tmp_path / "panel"))
+    loaded = PricePanel.load(str(tmp_path / "panel"))
+
+    assert isinstance(loaded.values, np.memmap)
+    np.testing.assert_array_equal(loaded.values, panel.values)
+    assert loaded.dates.equals(panel.dates)
+    assert loaded.tickers.equals(panel.tickers)
+
+    # Views of a loaded panel stay on the mapping.
+    assert isinstance(loaded.window("2021-01-31").values, np.memmap)
+
+    in_memory = PricePanel.load(str(tmp_path / "panel"), mmap=False)
+    assert not isinstance(in_memory.values, np.memmap)
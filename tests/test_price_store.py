@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_store import PriceStore, StoredPriceFetcher
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+
+from helpers import AdjustedSource, expire
+
+
+TICKERS = ["AAA.NS", "BBB.NS", "CCC.NS"]
+START = "2023-01-02"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PriceStore(str(tmp_path / "prices"))
+    StoredPriceFetcher(store, source=SyntheticPriceFetcher(end_date="2024-03-29").fetch).sync(TICKERS, START)
+    return store
+
+
+def test_incremental_sync_matches_full_fetch(store):
+    stored_dates = store.load("AAA.NS")["date"]
+    expire(store)
+
+    source = SyntheticPriceFetcher(end_date="2024-06-28")
+    StoredPriceFetcher(store, source=source.fetch).sync(TICKERS, START)
+
+    # Only the overlap bars and the new days were requested.
+    assert source.calls == [(TICKERS, str(stored_dates[-StoredPriceFetcher.OVERLAP_BARS]))]
+    assert store.rebased(TICKERS) == [0, 0, 0]
+
+    expected = SyntheticPriceFetcher(end_date="2024-06-28").fetch(TICKERS, START)
+    pd.testing.assert_frame_equal(store.read(TICKERS, START), expected, check_freq=False, check_names=False)
+
+
+def test_synced_today_is_not_requested_again(store):
+    source = SyntheticPriceFetcher(end_date="2024-06-28")
+    StoredPriceFetcher(store, source=source.fetch).sync(TICKERS, START)
+    assert source.calls == []
+
+
+def test_earlier_start_refetches_from_that_start(store):
+    source = SyntheticPriceFetcher(end_date="2024-03-29")
+    StoredPriceFetcher(store, source=source.fetch).sync(["AAA.NS"], "2022-06-01")
+
+    assert source.calls == [(["AAA.NS"], "2022-06-01")]
+    assert store.entry("AAA.NS")["covered_from"] == "2022-06-01"
+    assert store.rebased(TICKERS) == [1, 0, 0]
+    expected = SyntheticPriceFetcher(end_date="2024-03-29").fetch(["AAA.NS"], "2022-06-01")
+    pd.testing.assert_frame_equal(store.read(["AAA.NS"], "2022-06-01"), expected, check_freq=False, check_names=False)
+
+
+@pytest.mark.parametrize("factor", [0.5, 0.98])  # 2:1 split, 2% dividend
+def test_back_adjustment_rescales_stored_history(store, factor):
+    expire(store)
+    version = store.version(TICKERS)
+    untouched = np.array(store.load("BBB.NS"))
+
+    source = AdjustedSource("2024-06-28", ticker="AAA.NS", ex_date="2024-05-15", factor=factor)
+    StoredPriceFetcher(store, source=source.fetch).sync(TICKERS, START)
+
+    expected = AdjustedSource("2024-06-28", ticker="AAA.NS", ex_date="2024-05-15", factor=factor)
+    expected = expected.fetch(TICKERS, START)
+    pd.testing.assert_frame_equal(store.read(TICKERS, START), expected, check_freq=False, check_names=False, rtol=1e-12)
+
+    # Other tickers keep their stored bars, and the version changes.
+    np.testing.assert_array_equal(np.array(store.load("BBB.NS"))[: len(untouched)], untouched)
+    assert store.version(TICKERS) != version
+    assert store.rebased(TICKERS) == [1, 0, 0]
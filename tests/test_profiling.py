@@ -0,0 +1,74 @@
+import json
+import threading
+import time
+
+import pytest
+
+from momentum_engine.core import profiling
+from momentum_engine.core.profiling import StageProfiler
+
+
+class FakeResource:
+    RUSAGE_SELF = 0
+
+    class usage:
+        ru_maxrss = 100 * 1024 * 1024
+
+    @classmethod
+    def getrusage(cls, who):
+        return cls.usage
+
+
+@pytest.mark.parametrize("platform, expected", [("linux", 100 * 1024), ("darwin", 100.0)])
+def test_peak_rss_units(monkeypatch, platform, expected):
+    monkeypatch.setattr(profiling, "resource", FakeResource)
+    monkeypatch.setattr(profiling.sys, "platform", platform)
+    assert StageProfiler.peak_rss_mb() == expected
+
+
+def test_stages_without_resource_module(tmp_path, monkeypatch):
+    # As on Windows, where ``resource`` does not exist.
+    monkeypatch.setattr(profiling, "resource", None)
+
+    profiler = StageProfiler()
+    with profiler.stage("load", tickers=3):
+        pass
+
+    json_path, _ = profiler.save(str(tmp_path / "profile"))
+    with open(json_path) as f:
+        (record,) = json.load(f)["stages"]
+
+    assert record["stage"] == "load"
+    assert record["process_peak_rss_mb"] is None
+    assert record["tickers"] == 3
+
+
+def busy(seconds: float) -> None:
+    start = time.thread_time()
+    while time.thread_time() - start < seconds:
+        pass
+
+
+def test_thread_cpu_is_per_stage_and_process_cpu_is_not(tmp_path):
+    profiler = StageProfiler()
+
+    def worker():
+        with profiler.stage("worker"):
+            busy(0.2)
+
+    # The main thread's stage idles while another stage burns CPU.
+    with profiler.stage("waiting"):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    records = {record["stage"]: record for record in profiler.records}
+    assert records["worker"]["thread_cpu_s"] >= 0.2
+    assert records["waiting"]["thread_cpu_s"] < 0.1
+    assert records["waiting"]["process_cpu_s"] >= 0.2
+
+    _, trace_path = profiler.save(str(tmp_path / "profile"))
+    with open(trace_path) as f:
+        args = json.load(f)["traceEvents"][0]["args"]
+    assert {"thread_cpu_s", "process_cpu_s", "process_peak_rss_mb"} <= set(args)
+    assert "cpu_s" not in args and "peak_rss_mb" not in args
@@ -0,0 +1,231 @@
+import asyncio
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.ranking.panel_ranker import PanelRanker
+from momentum_engine.research.snapshot import TrailingReturnView
+from momentum_engine.service.query_server import MAX_BODY, QueryServer
+from momentum_engine.service.ranked_state import RankedState
+from momentum_engine.signals.momentum_12_1 import Momentum12_1
+from momentum_engine.signals.registry import SignalRegistry
+
+
+TICKERS = [f"SYN{i:02d}.NS" for i in range(10)]
+
+
+def build(tickers: list[str] = TICKERS) -> RankedState:
+    session = PriceSession(SyntheticPriceFetcher(end_date="2024-12-31"))
+    return RankedState.build({"synthetic": tickers}, session, start_date="2018-01-01")
+
+
+@pytest.fixture(scope="module")
+def state():
+    return build()
+
+
+async def exchange(port: int, raw: bytes, half_close: bool) -> int | None:
+    """
+    Send ``raw`` and read until the server closes the connection. Returns
+    the status of the first response (None when there was none).
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    if half_close:
+        writer.write_eof()
+
+    data = await asyncio.wait_for(reader.read(), timeout=5)
+    writer.close()
+    return int(data.split(b" ", 2)[1]) if data else None
+
+
+async def request(port: int, method: str, path: str) -> tuple[int, dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+
+    data = await asyncio.wait_for(reader.read(), timeout=5)
+    writer.close()
+    head, _, body = data.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), json.loads(body)
+
+
+def query(state, *requests: tuple[str, str]) -> list[tuple[int, dict]]:
+    """
+    ``(method, path)`` requests against one server, in order.
+    """
+    async def main():
+        server = QueryServer(lambda: state, port=0, refresh_interval=None, log=lambda message: None)
+        await server.start()
+        try:
+            return [await request(server.port, method, path) for method, path in requests]
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def get(state, path: str) -> dict:
+    [(status, payload)] = query(state, ("GET", path))
+    assert status == 200, payload
+    return payload
+
+
+def test_top_follows_panel_ranker(state):
+    latest = Momentum12_1(12, 1).compute(state.monthly)[TICKERS]
+    ranks = PanelRanker.rank(latest.to_numpy()).ranks[0]
+    expected = [TICKERS[i] for i in np.argsort(ranks) if not np.isnan(ranks[i])]
+
+    payload = get(state, "/top/synthetic?n=100")
+    assert [row["ticker"] for row in payload["rows"]] == expected
+    assert [row["rank"] for row in payload["rows"]] == list(range(1, len(expected) + 1))
+    np.testing.assert_allclose([row["value"] for row in payload["rows"]], latest[expected], rtol=1e-12)
+
+    assert get(state, "/top/synthetic?n=3")["rows"] == payload["rows"][:3]
+
+
+def test_rank_matches_top(state):
+    rows = get(state, "/top/synthetic?n=100&signal=mom_6_1")["rows"]
+    for row in rows[:3]:
+        payload = get(state, f"/rank/{row['ticker']}?signal=mom_6_1")
+        assert payload["universes"]["synthetic"] == {
+            "rank": row["rank"], "percentile": row["percentile"], "ranked": len(rows),
+        }
+        assert payload["value"] == row["value"]
+
+
+def test_snapshot_is_the_trailing_return_table(state):
+    table = TrailingReturnView.from_monthly(state.monthly).frame(TICKERS)
+    rows = get(state, "/snapshot/synthetic")["rows"]
+
+    assert [row["Ticker"] for row in rows] == table["Ticker"].tolist()
+    for column in table.columns.drop("Ticker"):
+        actual = np.array([np.nan if row[column] is None else row[column] for row in rows])
+        np.testing.assert_allclose(actual, table[column].to_numpy(dtype=float), rtol=1e-12)
+
+    assert len(get(state, "/snapshot/synthetic?limit=4")["rows"]) == 4
+
+
+def test_signal_routes(state):
+    assert get(state, "/signals")["signals"] == SignalRegistry.names()
+
+    payload = get(state, f"/signals/{TICKERS[2]}?names=mom_12_1,high_52w&start=2023-01-01")
+    expected = SignalRegistry.compute(state.monthly, ["mom_12_1", "high_52w"])
+    dates = state.monthly.index[state.monthly.index >= "2023-01-01"]
+
+    assert payload["dates"] == dates.strftime("%Y-%m-%d").tolist()
+    for name, frame in expected.items():
+        np.testing.assert_allclose(payload["signals"][name], frame.loc[dates, TICKERS[2]], rtol=1e-12)
+
+
+@pytest.mark.parametrize("method, path, status", [
+    ("GET", "/top/nifty", 404),
+    ("GET", "/rank/NOPE.NS", 404),
+    ("GET", "/signals/NOPE.NS", 404),
+    ("GET", "/snapshot", 404),
+    ("GET", "/nowhere", 404),
+    ("GET", "/top/synthetic?n=abc", 400),
+    ("GET", "/top/synthetic?n=0", 400),
+    ("GET", "/top/synthetic?signal=nope", 400),
+    ("GET", "/refresh", 405),
+    ("POST", "/top/synthetic", 405),
+])
+def test_error_statuses(state, method, path, status):
+    [(actual, payload)] = query(state, (method, path))
+    assert actual == status
+    assert "error" in payload
+
+
+def test_readers_are_answered_during_a_refresh(state):
+    release = threading.Event()
+    builds = []
+
+    def build_state() -> RankedState:
+        builds.append(None)
+        if len(builds) == 1:
+            return state
+        # Later builds wait for the test, then fail once, then succeed.
+        release.wait(timeout=10)
+        if len(builds) == 2:
+            raise RuntimeError("source down")
+        return build(TICKERS[:4])
+
+    async def main():
+        server = QueryServer(build_state, port=0, refresh_interval=None, log=lambda message: None)
+        await server.start()
+        port = server.port
+        try:
+            assert (await request(port, "POST", "/refresh"))[0] == 202
+            await asyncio.sleep(0.05)
+
+            # The build is blocked; readers still get the old state.
+            status, health = await request(port, "GET", "/health")
+            assert (status, health["refreshing"], health["tickers"]) == (200, True, len(TICKERS))
+            status, top = await request(port, "GET", "/top/synthetic?n=100")
+            assert (status, len(top["rows"])) == (200, len(TICKERS))
+
+            # A failed refresh keeps the old state and reports the error.
+            release.set()
+            while server.refreshing:
+                await asyncio.sleep(0.01)
+            health = (await request(port, "GET", "/health"))[1]
+            assert health["tickers"] == len(TICKERS)
+            assert health["refreshes"] == 1
+            assert health["last_error"] == "RuntimeError: source down"
+
+            # The next one swaps the new state in and clears the error.
+            assert await server.refresh()
+            health = (await request(port, "GET", "/health"))[1]
+            assert (health["tickers"], health["refreshes"], health["last_error"]) == (4, 2, None)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def serve(state, raw: bytes, half_close: bool = False) -> tuple[int | None, list[dict]]:
+    """
+    Status of ``raw`` on a fresh server, and anything the server let escape
+    to the event loop's exception handler.
+    """
+    errors = []
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        server = QueryServer(lambda: state, port=0, refresh_interval=None, log=lambda message: None)
+        await server.start()
+        try:
+            status = await exchange(server.port, raw, half_close)
+            await asyncio.sleep(0.05)
+            return status
+        finally:
+            await server.close()
+
+    return asyncio.run(main()), errors
+
+
+def test_request_with_body(state):
+    raw = b"GET /top/synthetic?n=3 HTTP/1.1\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{}"
+    assert serve(state, raw) == (200, [])
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", "1e3"])
+def test_bad_content_length_is_rejected(state, length):
+    raw = f"GET /health HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode()
+    assert serve(state, raw) == (400, [])
+
+
+def test_oversized_body_is_refused_unread(state):
+    raw = f"GET /health HTTP/1.1\r\nContent-Length: {MAX_BODY + 1}\r\n\r\n".encode()
+    assert serve(state, raw) == (413, [])
+
+
+def test_truncated_body_closes_quietly(state):
+    # The client half-closes after 2 of the 10 announced bytes.
+    raw = b"GET /health HTTP/1.1\r\nContent-Length: 10\r\n\r\nab"
+    assert serve(state, raw, half_close=True) == (None, [])
@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.resampler import CalendarResampler, MonthlyResampler
+
+
+@pytest.fixture(scope="module")
+def prices():
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2019-01-01", "2021-12-31")
+    # A month with no trading days, and a few scattered missing sessions.
+    dates = dates[(dates < "2020-08-01") | (dates > "2020-08-31")]
+    dates = dates.delete(rng.choice(len(dates), 40, replace=False))
+
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (len(dates), 4)), axis=0))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    frame = pd.DataFrame(values, index=dates, columns=["AAA", "BBB", "CCC", "DDD"])
+
+    # A ticker that lists late and one with a month of no prices.
+    frame.loc[:"2019-05-15", "CCC"] = np.nan
+    frame.loc["2021-03-01":"2021-03-31", "DDD"] = np.nan
+    return frame
+
+
+def pandas_resample(prices: pd.DataFrame, frequency: str, how: str) -> pd.DataFrame:
+    """
+    ``resample(...).<how>()`` over non-empty periods, relabelled with the
+    last trading date of each period.
+    """
+    rule = CalendarResampler.FREQUENCIES[frequency]
+    result = getattr(prices.resample(rule), how)()
+    last_date = pd.Series(prices.index, index=prices.index).resample(rule).last().dropna()
+    result = result.loc[last_date.index]
+    result.index = pd.DatetimeIndex(last_date.to_numpy())
+    return result
+
+
+@pytest.mark.parametrize("frequency", ["weekly", "monthly", "quarterly"])
+@pytest.mark.parametrize("how", ["last", "first"])
+def test_last_and_first_match_pandas(prices, frequency, how):
+    actual = getattr(CalendarResampler, how)(prices, frequency)
+    pd.testing.assert_frame_equal(actual, pandas_resample(prices, frequency, how), check_freq=False)
+
+
+@pytest.mark.parametrize("frequency", ["weekly", "monthly", "quarterly"])
+def test_ohlc_matches_pandas(prices, frequency):
+    bars = CalendarResampler.ohlc(prices, frequency)
+    for field, how in (("open", "first"), ("high", "max"), ("low", "min"), ("close", "last")):
+        pd.testing.assert_frame_equal(bars[field], pandas_resample(prices, frequency, how), check_freq=False)
+
+
+def test_monthly_resampler_is_calendar_last(prices):
+    expected = pandas_resample(prices, "monthly", "last")
+    pd.testing.assert_frame_equal(MonthlyResampler.to_monthly(prices), expected, check_freq=False)
+
+
+def test_boundary_cache_is_thread_safe():
+    # Many more calendars than cache slots, resolved concurrently.
+    calendars = [pd.bdate_range("2015-01-01", periods=200 + k) for k in range(3 * CalendarResampler.CACHE_SIZE)]
+    expected = [CalendarResampler.period_ends(index, "monthly").copy() for index in calendars]
+
+    def resolve(k: int) -> np.ndarray:
+        return CalendarResampler.period_ends(calendars[k % len(calendars)], "monthly")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(resolve, range(20 * len(calendars))))
+
+    for k, ends in enumerate(results):
+        np.testing.assert_array_equal(ends, expected[k % len(calendars)])
+    assert len(CalendarResampler._cache) <= CalendarResampler.CACHE_SIZE
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.batch_backtest import BatchBacktest
+from momentum_engine.research.robustness import RobustnessAnalyzer
+from momentum_engine.research.sweep import ParameterSweep
+
+from helpers import write_config, write_universe
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:02d}.NS" for i in range(15)]
+
+
+@pytest.fixture(params=["equal", "inverse_vol", "min_variance"])
+def config(request, tmp_path):
+    universe = write_universe(tmp_path / "universe.csv", TICKERS)
+    return write_config(tmp_path, universe, weighting=request.param, covariance_window=24)
+
+
+def backtester(config: str) -> Backtester:
+    return Backtester(config, session=PriceSession(SyntheticPriceFetcher(end_date=END_DATE)))
+
+
+def test_sweep_honours_weighting(config):
+    expected = backtester(config).run_vectorized()
+
+    sweep = ParameterSweep(backtester(config), [12], [1], [5], ["quarterly"])
+    rows, _ = sweep.period_returns(workers=1)
+
+    returns = rows[0]["returns"]
+    np.testing.assert_allclose(returns[~np.isnan(returns)], expected["portfolio_return"], rtol=1e-10)
+
+
+def test_batch_honours_weighting(config):
+    expected = backtester(config).run_vectorized()
+
+    batch = BatchBacktest([config], session=PriceSession(SyntheticPriceFetcher(end_date=END_DATE)))
+    _, consolidated = batch.run(workers=1)
+
+    pd.testing.assert_frame_equal(
+        consolidated.drop(columns=["config", "universe"]), expected, rtol=1e-10
+    )
+
+
+def test_robustness_rejects_other_weightings(config):
+    bt = backtester(config)
+    if bt.weighting == "equal":
+        RobustnessAnalyzer(bt)
+    else:
+        with pytest.raises(ValueError, match="equal weighting only"):
+            RobustnessAnalyzer(bt)
@@ -0,0 +1,116 @@
+import pandas as pd
+import pytest
+import yaml
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.price_store import PriceStore, StoredPriceFetcher
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.result_cache import ResultCache
+
+from helpers import write_config, write_universe
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:02d}.NS" for i in range(8)]
+UNRELATED = "SYN09.NS"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PriceStore(str(tmp_path / "prices"))
+    fetcher = StoredPriceFetcher(store, source=SyntheticPriceFetcher(end_date=END_DATE).fetch)
+    fetcher.sync([*TICKERS, UNRELATED], "2016-01-01")
+    return store
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / "cache"))
+
+
+def run(config: str, store: PriceStore, cache: ResultCache) -> bool:
+    """
+    Backtest through ``cache``; True when it was a hit.
+    """
+    session = PriceSession(StoredPriceFetcher(store, source=SyntheticPriceFetcher(end_date=END_DATE).fetch))
+    hits = cache.hits
+    Backtester(config, session=session).run_cached(cache, vectorized=True)
+    return cache.hits > hits
+
+
+def append_day(store: PriceStore, ticker: str) -> None:
+    # A new bar for ``ticker`` only, as a later daily sync would write.
+    last = store.last_date(ticker)
+    series = pd.Series([100.0], index=[last + pd.offsets.BDay()])
+    store.write(ticker, series, covered_from="2016-01-01")
+    store.commit()
+
+
+def test_repeat_run_hits(tmp_path, store, cache):
+    config = write_config(tmp_path, write_universe(tmp_path / "universe.csv", TICKERS))
+
+    assert not run(config, store, cache)
+    assert run(config, store, cache)
+
+
+def test_config_change_misses(tmp_path, store, cache):
+    universe = write_universe(tmp_path / "universe.csv", TICKERS)
+    run(write_config(tmp_path, universe), store, cache)
+
+    assert not run(write_config(tmp_path, universe, top_n=3), store, cache)
+    # Output settings are not part of the key.
+    config = yaml.safe_load(open(write_config(tmp_path, universe)))
+    config["output"]["directory"] = str(tmp_path / "elsewhere")
+    (tmp_path / "moved.yaml").write_text(yaml.safe_dump(config))
+    assert run(str(tmp_path / "moved.yaml"), store, cache)
+
+
+def test_universe_file_change_misses(tmp_path, store, cache):
+    universe = tmp_path / "universe.csv"
+    config = write_config(tmp_path, write_universe(universe, TICKERS))
+    run(config, store, cache)
+
+    # Same path and tickers, different bytes.
+    write_universe(universe, TICKERS[::-1])
+    assert not run(config, store, cache)
+
+
+def test_membership_change_misses(tmp_path, store, cache):
+    directory = tmp_path / "constituents"
+    directory.mkdir()
+    write_universe(directory / "2016-01-01_synthetic.csv", TICKERS[:6])
+    write_universe(directory / "2020-01-01_synthetic.csv", TICKERS[2:])
+    config = write_config(tmp_path, str(directory))
+
+    run(config, store, cache)
+    assert run(config, store, cache)
+
+    write_universe(directory / "2022-01-01_synthetic.csv", TICKERS[:5])
+    assert not run(config, store, cache)
+
+
+def test_store_writes_miss_only_for_member_tickers(tmp_path, store, cache):
+    config = write_config(tmp_path, write_universe(tmp_path / "universe.csv", TICKERS))
+    run(config, store, cache)
+
+    append_day(store, UNRELATED)
+    assert run(config, store, cache)
+
+    append_day(store, TICKERS[3])
+    assert not run(config, store, cache)
+
+
+def test_evict_drops_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"), max_bytes=10**9)
+    payload = {"data": b"x" * 10_000}
+    for key in ("a", "b", "c"):
+        cache.put(key, payload)
+
+    # Reading "a" makes "b" the least recently used.
+    assert cache.get("a") is not None
+    cache.max_bytes = cache.size() - 1
+    assert [path.stem for path in cache.evict()] == ["b"]
+
+    cache.max_bytes = 0
+    assert [path.stem for path in cache.evict()] == ["c", "a"]
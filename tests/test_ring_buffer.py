@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.core.ring_buffer import MonthEndBuffer
+from momentum_engine.research.snapshot import TrailingReturnView
+from momentum_engine.signals.live_state import LiveSignalState
+
+
+TICKERS = ["AAA.NS", "BBB.NS"]
+
+
+def bar(value: float) -> pd.Series:
+    return pd.Series([value, -value], index=TICKERS)
+
+
+def test_push_wraps_and_replaces_the_current_month():
+    buffer = MonthEndBuffer(TICKERS, 3)
+    for month, date in enumerate(pd.date_range("2024-01-31", periods=5, freq="ME")):
+        buffer.push(date, bar(month))
+
+    assert buffer.count == 5
+    assert buffer.last_date == pd.Timestamp("2024-05-31")
+    assert [buffer.row(k)[0] for k in range(3)] == [4.0, 3.0, 2.0]
+
+    # A later bar in the same month replaces the latest one.
+    buffer.push("2024-05-15", bar(9))
+    assert buffer.count == 5
+    assert buffer.row(0)[0] == 9.0
+    assert buffer.row(1)[0] == 3.0
+
+    with pytest.raises(ValueError, match="older"):
+        buffer.push("2024-03-31", bar(1))
+
+
+@pytest.mark.parametrize("cls", [LiveSignalState, TrailingReturnView])
+def test_save_keeps_the_exact_path_and_parameters(tmp_path, cls):
+    buffer = cls(TICKERS, lookback=6, skip=2)
+    for month, date in enumerate(pd.date_range("2024-01-31", periods=10, freq="ME")):
+        buffer.push(date, bar(month + 1))
+    buffer.rebased = [2, 0]
+
+    path = tmp_path / "nested" / "state.bin"
+    buffer.save(str(path))
+    assert path.exists()
+
+    loaded = cls.load(str(path))
+    assert type(loaded) is cls
+    assert (loaded.lookback, loaded.skip, loaded.size) == (6, 2, buffer.size)
+    assert loaded.count == buffer.count
+    assert loaded.rebased == [2, 0]
+    np.testing.assert_array_equal(loaded.prices, buffer.prices)
+    np.testing.assert_array_equal(loaded.dates, buffer.dates)
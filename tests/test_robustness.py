@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.performance import PerformanceAnalyzer
+from momentum_engine.research.robustness import RobustnessAnalyzer
+from momentum_engine.research.vectorized_backtester import VectorizedBacktest
+
+from helpers import write_config, write_universe
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:02d}.NS" for i in range(15)]
+PERIODS_PER_YEAR = {"monthly": 12, "quarterly": 4}
+
+
+@pytest.mark.parametrize("rebalance", ["quarterly", "monthly"])
+def test_historical_row_is_the_backtest(tmp_path, rebalance):
+    universe = write_universe(tmp_path / "universe.csv", TICKERS)
+    config = write_config(tmp_path, universe)
+
+    def backtester() -> Backtester:
+        return Backtester(config, session=PriceSession(SyntheticPriceFetcher(end_date=END_DATE)))
+
+    result = RobustnessAnalyzer(backtester(), n_paths=20, rebalance=rebalance, batch_size=10).run(workers=1)
+
+    bt = backtester()
+    monthly = bt.load_monthly()
+    results = VectorizedBacktest.run(
+        monthly, Backtester.rebalance_dates(monthly, rebalance), bt.lookback, bt.skip, bt.top_n, bt.initial_capital
+    )
+    if rebalance == "quarterly":
+        np.testing.assert_allclose(results["capital"], backtester().run_vectorized()["capital"], rtol=1e-12)
+
+    expected = PerformanceAnalyzer.compute_metrics(results, PERIODS_PER_YEAR[rebalance])
+    for name, value in expected.items():
+        assert result.historical[name] == pytest.approx(value, rel=1e-12), name
+
+    assert len(result.paths) == 20
+    assert (result.summary["historical"] == result.historical).all()
@@ -0,0 +1,92 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_panel import PricePanel
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.signals.momentum_12_1 import Momentum12_1
+from momentum_engine.signals.registry import SignalContext, SignalRegistry
+
+
+TICKERS = [f"SYN{i:02d}.NS" for i in range(10)]
+
+
+@pytest.fixture(scope="module")
+def monthly():
+    monthly = PriceSession(SyntheticPriceFetcher(end_date="2024-12-31")).monthly(TICKERS, "2015-01-01")
+    # A late listing and a month without a price.
+    monthly.loc[:"2017-06-30", TICKERS[0]] = np.nan
+    monthly.loc["2020-05-01":"2020-05-31", TICKERS[1]] = np.nan
+    return monthly
+
+
+@pytest.fixture(scope="module")
+def signals(monthly):
+    return SignalRegistry.compute(monthly)
+
+
+def test_mom_12_1_matches_momentum_12_1(monthly, signals):
+    for end in (monthly.index[13], monthly.index[40], monthly.index[-1]):
+        expected = Momentum12_1(12, 1).compute(monthly.loc[:end])
+        actual = signals["mom_12_1"].loc[end].dropna()
+        pd.testing.assert_series_equal(actual, expected, check_names=False, rtol=1e-12)
+
+
+def test_rolling_vol_matches_pandas(monthly):
+    context = SignalContext(monthly)
+    for window in (6, 12):
+        expected = np.log(monthly / monthly.shift(1)).rolling(window).std() * np.sqrt(12)
+        np.testing.assert_allclose(context.rolling_vol(window), expected.to_numpy(), rtol=1e-8, atol=1e-12)
+
+
+def test_vol_adjusted_momentum(monthly, signals):
+    vol = (np.log(monthly / monthly.shift(1)).rolling(12).std() * np.sqrt(12)).shift(1)
+    np.testing.assert_allclose(signals["vol_adj_12_1"], (signals["mom_12_1"] / vol).to_numpy(), rtol=1e-8)
+
+
+def test_high_52w_matches_rolling_max(monthly, signals):
+    expected = monthly / monthly.rolling(12).max()
+    np.testing.assert_allclose(signals["high_52w"], expected.to_numpy(), rtol=1e-12)
+
+
+def test_composite_is_mean_of_zscores(signals):
+    zscores = []
+    for name in SignalRegistry.COMPOSITE:
+        frame = signals[name]
+        zscores.append(frame.sub(frame.mean(axis=1), axis=0).div(frame.std(axis=1, ddof=0), axis=0))
+
+    # Mean over components, NaN where any is missing.
+    expected = sum(zscores) / len(zscores)
+    np.testing.assert_allclose(signals["composite"], expected.to_numpy(), rtol=1e-10, atol=1e-12)
+    assert signals["composite"].iloc[-1].notna().sum() > 5
+
+
+def test_panel_input_matches_frame(monthly, signals):
+    from_panel = SignalRegistry.compute(PricePanel.from_frame(monthly))
+    for name, frame in signals.items():
+        pd.testing.assert_frame_equal(from_panel[name], frame)
+
+
+def test_intermediates_are_computed_once(monkeypatch, monthly):
+    computed = Counter()
+    cached = SignalContext._cached
+
+    def counting(self, key, compute):
+        if key not in self._memo:
+            computed[key] += 1
+        return cached(self, key, compute)
+
+    monkeypatch.setattr(SignalContext, "_cached", counting)
+    context = SignalContext(monthly)
+    for name in SignalRegistry.names():
+        context.signal(name)
+    # A second pass is served from the memo.
+    SignalRegistry.compute(context)
+
+    assert computed[("running_sums",)] == 1
+    assert computed[("log_returns",)] == 1
+    assert computed[("momentum", 12, 1)] == 1
+    assert max(computed.values()) == 1
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.simulator import DailySimulator
+
+from helpers import write_config, write_universe
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:02d}.NS" for i in range(15)]
+
+
+class TrendSource:
+    """
+    ``AAA`` rises through March 2020 and then falls, ``BBB`` is flat until
+    then and rises after, ``CCC`` never moves: 1-month momentum holds AAA
+    at the end of February and BBB at the end of April.
+    """
+
+    TICKERS = ["AAA.NS", "BBB.NS", "CCC.NS"]
+
+    def fetch(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        dates = pd.bdate_range("2019-12-02", "2020-06-30")
+        turn = dates.searchsorted(pd.Timestamp("2020-04-01"))
+        days = np.arange(len(dates))
+
+        prices = pd.DataFrame({
+            "AAA.NS": np.where(days < turn, 100 * 1.002 ** days, 100 * 1.002 ** turn * 0.999 ** (days - turn)),
+            "BBB.NS": np.where(days < turn, 100.0, 100 * 1.003 ** (days - turn)),
+            "CCC.NS": 100.0,
+        }, index=dates)
+        return prices.loc[start_date:, tickers]
+
+
+@pytest.mark.parametrize("weighting", ["equal", "inverse_vol"])
+def test_zero_cost_nav_matches_backtest(tmp_path, weighting):
+    universe = write_universe(tmp_path / "universe.csv", TICKERS)
+    config = write_config(tmp_path, universe, weighting=weighting)
+
+    def backtester() -> Backtester:
+        return Backtester(config, session=PriceSession(SyntheticPriceFetcher(end_date=END_DATE)))
+
+    expected = backtester().run_vectorized()
+    result = DailySimulator(backtester(), cost_bps=0, slippage_bps=0).run()
+
+    # NAV at rebalance k + 1 is the backtest's capital after period k.
+    rebalances = result.rebalances
+    assert rebalances["rebalance_date"].iloc[:-1].tolist() == expected["rebalance_date"].tolist()
+    np.testing.assert_allclose(rebalances["nav"].iloc[1:], expected["capital"], rtol=1e-12)
+    assert (rebalances["cost"] == 0).all()
+
+
+def test_turnover_and_costs_on_custom_dates(tmp_path):
+    universe = write_universe(tmp_path / "universe.csv", TrendSource.TICKERS)
+    config = write_config(
+        tmp_path, universe, start_date="2019-12-01", end_date="2020-06-30", lookback=1, skip=0, top_n=1
+    )
+
+    bt = Backtester(config, session=PriceSession(TrendSource()))
+    # Both March dates snap to the end of February, the May date to April.
+    result = DailySimulator(
+        bt, rebalance=["2020-05-10", "2020-03-15", "2020-03-20"], cost_bps=10, slippage_bps=5
+    ).run()
+
+    rebalances = result.rebalances
+    assert rebalances["rebalance_date"].tolist() == [pd.Timestamp("2020-02-28"), pd.Timestamp("2020-04-30")]
+    assert rebalances["execution_date"].tolist() == rebalances["rebalance_date"].tolist()
+    assert result.weights.idxmax(axis=1).tolist() == ["AAA.NS", "BBB.NS"]
+
+    # Buy AAA from cash, then switch fully into BBB.
+    np.testing.assert_allclose(rebalances["turnover"], [1.0, 2.0])
+
+    prices = TrendSource().fetch(TrendSource.TICKERS, "2019-12-02")
+    first, second = rebalances["execution_date"]
+    rate = 15 / 1e4
+
+    capital = 1_000_000.0
+    first_cost = capital * 1.0 * rate
+    first_nav = capital - first_cost
+    before_second = first_nav * prices.at[second, "AAA.NS"] / prices.at[first, "AAA.NS"]
+    second_cost = before_second * 2.0 * rate
+    second_nav = before_second - second_cost
+
+    np.testing.assert_allclose(rebalances["cost"], [first_cost, second_cost], rtol=1e-12)
+    np.testing.assert_allclose(rebalances["nav"], [first_nav, second_nav], rtol=1e-12)
+
+    # Before the first execution NAV is cash; after the last it follows BBB.
+    nav = result.nav
+    assert (nav.loc[:first].iloc[:-1] == capital).all()
+    np.testing.assert_allclose(
+        nav.loc[second:], second_nav * prices.loc[second:, "BBB.NS"] / prices.at[second, "BBB.NS"], rtol=1e-12
+    )
@@ -0,0 +1,80 @@
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.price_store import PriceStore, StoredPriceFetcher
+from momentum_engine.research.snapshot import SnapshotAnalyzer, TrailingReturnView
+
+from helpers import AdjustedSource, expire
+
+
+TICKERS = ["AAA.NS", "BBB.NS", "CCC.NS", "DDD.NS"]
+FIRST_RUN = "2024-03-29"
+SECOND_RUN = "2024-06-28"
+
+
+@pytest.fixture
+def universe(tmp_path):
+    path = tmp_path / "synthetic.csv"
+    pd.DataFrame({"ticker": TICKERS}).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def rebuilds(monkeypatch):
+    # Counts full view builds; incremental updates only extend the view.
+    calls = []
+    from_monthly = TrailingReturnView.from_monthly.__func__
+
+    def counting(cls, monthly, *args, **kwargs):
+        calls.append(monthly.index[-1])
+        return from_monthly(cls, monthly, *args, **kwargs)
+
+    monkeypatch.setattr(TrailingReturnView, "from_monthly", classmethod(counting))
+    return calls
+
+
+def analyzer(universe, store, source, view_path) -> SnapshotAnalyzer:
+    session = PriceSession(StoredPriceFetcher(store, source=source.fetch))
+    return SnapshotAnalyzer(universe, session=session, view_path=view_path)
+
+
+def expected_table(source) -> pd.DataFrame:
+    monthly = PriceSession(source).monthly(TICKERS, SnapshotAnalyzer.HISTORY_START)
+    return TrailingReturnView.from_monthly(monthly).frame(TICKERS)
+
+
+@pytest.mark.parametrize("factor", [1.0, 0.5])
+def test_view_update_matches_full_build(tmp_path, universe, rebuilds, factor):
+    store = PriceStore(str(tmp_path / "prices"))
+    view_path = str(tmp_path / "view")
+
+    first = AdjustedSource(FIRST_RUN)
+    analyzer(universe, store, first, view_path).update_view(pd.Timestamp(FIRST_RUN))
+    assert len(rebuilds) == 1
+
+    # Next quarter; with factor 0.5 AAA splits 2:1 in between and the store
+    # rescales its history.
+    expire(store)
+    second = AdjustedSource(SECOND_RUN, ticker="AAA.NS", ex_date="2024-05-15", factor=factor)
+    view = analyzer(universe, store, second, view_path).update_view(pd.Timestamp(SECOND_RUN))
+
+    assert len(rebuilds) == (1 if factor == 1.0 else 2)
+    assert view.last_date == pd.Timestamp(SECOND_RUN)
+    pd.testing.assert_frame_equal(view.frame(TICKERS), expected_table(second), rtol=1e-12)
+
+    # The saved view carries the counts it was read at.
+    assert TrailingReturnView.load(view_path).rebased == store.rebased(view.tickers.tolist())
+
+
+def test_view_file_is_per_ticker_set(tmp_path, universe):
+    other = tmp_path / "other.csv"
+    pd.DataFrame({"ticker": TICKERS[:2]}).to_csv(other, index=False)
+
+    paths = {
+        SnapshotAnalyzer(universe).default_view_path(),
+        SnapshotAnalyzer(str(other)).default_view_path(),
+        SnapshotAnalyzer([universe, str(other)]).default_view_path(),
+    }
+    assert len(paths) == 3
+    assert SnapshotAnalyzer(universe).default_view_path() in paths
@@ -0,0 +1,93 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from momentum_engine.data.resampler import MonthlyResampler
+from momentum_engine.data.streaming_ingest import StreamingMonthlyIngest
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.data.yahoo_fetcher import NoPriceDataError
+
+
+END_DATE = "2025-12-31"
+START_DATE = "2006-01-01"
+TICKERS = [f"SYN{i:05d}.NS" for i in range(300)]
+MAX_BYTES = 4 * 1024**2
+
+
+def test_peak_memory_stays_within_budget(tmp_path):
+    fetcher = SyntheticPriceFetcher(end_date=END_DATE)
+    ingest = StreamingMonthlyIngest(fetcher, str(tmp_path / "panel"), max_bytes=MAX_BYTES)
+
+    # The whole daily panel would not fit: the budget forces several chunks.
+    full_daily_bytes = np.busday_count(START_DATE, END_DATE) * len(TICKERS) * 8
+    assert full_daily_bytes > 2 * MAX_BYTES
+
+    tracemalloc.start()
+    try:
+        panel = ingest.run(TICKERS, START_DATE, END_DATE)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert peak <= MAX_BYTES
+    assert len(fetcher.calls) > 1
+    assert panel.shape[1] == len(TICKERS)
+
+    sample = TICKERS[:20]
+    expected = MonthlyResampler.to_monthly(SyntheticPriceFetcher(end_date=END_DATE).fetch(sample, START_DATE))
+    actual = panel.columns(sample).to_frame()
+    assert expected.index.equals(actual.index)
+    np.testing.assert_array_equal(expected.to_numpy(), actual.to_numpy())
+
+
+def test_budget_too_small_for_one_ticker(tmp_path):
+    ingest = StreamingMonthlyIngest(SyntheticPriceFetcher(end_date=END_DATE), str(tmp_path), max_bytes=1024)
+
+    with pytest.raises(ValueError, match="too small"):
+        ingest.run(TICKERS[:5], START_DATE, END_DATE)
+
+
+class PartialFetcher(SyntheticPriceFetcher):
+    """
+    No prices for chunks containing an ``empty`` ticker; ``dropped``
+    tickers are left out of the result.
+    """
+
+    def __init__(self, empty=(), dropped=(), **kwargs):
+        super().__init__(**kwargs)
+        self.empty, self.dropped = set(empty), set(dropped)
+
+    def fetch(self, tickers, start_date):
+        if self.empty.intersection(tickers):
+            raise NoPriceDataError("No stored prices found for the requested tickers.")
+        prices = super().fetch(tickers, start_date)
+        return prices.drop(columns=list(self.dropped.intersection(tickers)))
+
+
+def chunked_ingest(fetcher, path, size=4) -> StreamingMonthlyIngest:
+    ingest = StreamingMonthlyIngest(fetcher, str(path))
+    ingest.chunk_size = lambda *args: size
+    return ingest
+
+
+def test_chunks_without_prices_are_reported(tmp_path):
+    tickers = TICKERS[:12]
+    fetcher = PartialFetcher(empty={tickers[5]}, dropped={tickers[9]}, end_date=END_DATE)
+    ingest = chunked_ingest(fetcher, tmp_path)
+
+    panel = ingest.run(tickers, "2020-01-01", END_DATE)
+
+    skipped = tickers[4:8]
+    assert list(panel.tickers) == [t for t in tickers if t not in skipped and t != tickers[9]]
+    assert set(ingest.failures) == set(skipped) | {tickers[9]}
+    assert all(ingest.failures[t].startswith("chunk skipped") for t in skipped)
+    assert ingest.failures[tickers[9]] == "no data"
+
+
+def test_other_fetch_errors_propagate(tmp_path):
+    fetcher = SyntheticPriceFetcher(end_date=END_DATE, failing={TICKERS[5]})
+    ingest = chunked_ingest(fetcher, tmp_path)
+
+    with pytest.raises(ValueError, match="synthetic failure"):
+        ingest.run(TICKERS[:12], "2020-01-01", END_DATE)
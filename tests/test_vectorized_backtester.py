@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.portfolio.weighting import WEIGHTINGS
+from momentum_engine.research.backtester import Backtester
+
+from helpers import write_config, write_universe
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:02d}.NS" for i in range(12)]
+
+
+class IrregularSource:
+    """
+    Synthetic prices with the irregularities the two engines must treat
+    alike:
+
+    - ``SYN00`` lists late and ``SYN01`` has a month without trades (NaN
+      month-ends);
+    - every ``TWINxx`` has the momentum of ``SYNxx`` but its own quarterly
+      returns. The paths differ only in quarter-end months, which the 12-1
+      signal never reads under quarterly rebalancing, so the twins tie with
+      their originals and the tie order decides which one is held.
+    """
+
+    def __init__(self, end_date: str = END_DATE):
+        self.source = SyntheticPriceFetcher(end_date=end_date)
+
+    def fetch(self, tickers: list[str], start_date: str) -> pd.DataFrame:
+        originals = [ticker.replace("TWIN", "SYN") for ticker in tickers]
+        prices = self.source.fetch(list(dict.fromkeys(originals)), start_date)[originals]
+        prices.columns = list(tickers)
+
+        # One factor per calendar month, applied to quarter-end months only.
+        months = prices.index.year * 12 + prices.index.month
+        quarter_end = prices.index.month % 3 == 0
+        for column, ticker in enumerate(tickers):
+            if ticker.startswith("TWIN"):
+                factors = np.random.default_rng(int(ticker[4:6])).uniform(0.8, 1.2, months.max() + 1)
+                prices.iloc[quarter_end, column] *= factors[months[quarter_end]]
+
+        if "SYN00.NS" in prices:
+            prices.loc[: "2018-06-30", "SYN00.NS"] = np.nan
+        if "SYN01.NS" in prices:
+            prices.loc["2019-02-01":"2019-02-28", "SYN01.NS"] = np.nan
+        return prices
+
+
+def assert_same_results(config_path: str) -> pd.DataFrame:
+    loop = Backtester(config_path, session=PriceSession(IrregularSource())).run()
+    vectorized = Backtester(config_path, session=PriceSession(IrregularSource())).run_vectorized()
+
+    assert len(loop) > 20
+    pd.testing.assert_frame_equal(loop, vectorized, rtol=1e-10)
+    return loop
+
+
+@pytest.mark.parametrize("weighting", WEIGHTINGS)
+def test_static_universe_with_missing_prices(tmp_path, weighting):
+    universe = write_universe(tmp_path / "universe.csv", TICKERS)
+    results = assert_same_results(write_config(tmp_path, universe, weighting=weighting))
+
+    # No held position is missing a price at either end of its period.
+    assert results["portfolio_return"].notna().all()
+
+
+def test_ties_are_broken_by_universe_order(tmp_path):
+    # Four pairs of tied names and top 3: the second pair is split at every
+    # rebalance, by whichever of the two comes first.
+    pairs = [f"{prefix}{i:02d}.NS" for i in range(4) for prefix in ("SYN", "TWIN")]
+    swapped = [f"{prefix}{i:02d}.NS" for i in range(4) for prefix in ("TWIN", "SYN")]
+
+    results = []
+    for name, tickers in (("pairs", pairs), ("swapped", swapped)):
+        workdir = tmp_path / name
+        workdir.mkdir()
+        universe = write_universe(workdir / "universe.csv", tickers)
+        results.append(assert_same_results(write_config(workdir, universe, top_n=3)))
+
+    # The tie order is what changes the result.
+    assert not np.allclose(results[0]["capital"], results[1]["capital"])
+
+
+def test_point_in_time_membership(tmp_path):
+    directory = tmp_path / "constituents"
+    directory.mkdir()
+    write_universe(directory / "2016-01-01_synthetic.csv", TICKERS[:8])
+    write_universe(directory / "2019-07-01_synthetic.csv", TICKERS[3:11])
+    write_universe(directory / "2022-01-01_synthetic.csv", [*TICKERS[:2], *TICKERS[6:]])
+
+    backtester = Backtester(write_config(tmp_path, str(directory)), session=PriceSession(IrregularSource()))
+    assert backtester.membership is not None
+
+    assert_same_results(write_config(tmp_path, str(directory)))
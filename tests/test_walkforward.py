@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from momentum_engine.data.price_session import PriceSession
+from momentum_engine.data.synthetic import SyntheticPriceFetcher
+from momentum_engine.research.backtester import Backtester
+from momentum_engine.research.walkforward import WalkForward
+
+from helpers import write_config, write_universe
+
+
+END_DATE = "2024-12-31"
+TICKERS = [f"SYN{i:02d}.NS" for i in range(15)]
+
+
+@pytest.mark.parametrize("weighting", ["equal", "inverse_vol"])
+def test_baseline_is_the_config_backtest(tmp_path, weighting):
+    universe = write_universe(tmp_path / "universe.csv", TICKERS)
+    config = write_config(tmp_path, universe, start_date="2012-01-01", weighting=weighting)
+
+    def backtester() -> Backtester:
+        return Backtester(config, session=PriceSession(SyntheticPriceFetcher(end_date=END_DATE)))
+
+    walk_forward = WalkForward(backtester(), [6, 12], [1], [3, 5], in_sample_months=36, out_of_sample_months=12)
+    result = walk_forward.run(workers=1)
+
+    assert result.metrics.index[1] == f"config (12-1, top 5, {weighting})"
+
+    # The baseline curve is the config's own backtest over the same periods.
+    expected = backtester().run_vectorized().set_index("rebalance_date")["portfolio_return"]
+    np.testing.assert_allclose(
+        result.equity["config_return"], expected.loc[result.equity["rebalance_date"]], rtol=1e-10
+    )
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_engine.portfolio.weighting import PortfolioWeighter, RollingCovariance
+
+
+def random_prices(n_months: int = 72, n_tickers: int = 8, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vols = np.linspace(0.03, 0.12, n_tickers)
+    returns = rng.normal(0.01, vols, (n_months, n_tickers)) + rng.normal(0, 0.03, (n_months, 1))
+    return 100 * np.exp(np.cumsum(returns, axis=0))
+
+
+def random_covariance(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(size=(n, 3)) * rng.uniform(0.5, 2.0, (n, 1))
+    return factors @ factors.T / 10 + np.diag(rng.uniform(0.01, 0.2, n))
+
+
+@pytest.mark.parametrize("missing", [False, True])
+def test_rolling_covariance_matches_dataframe_cov(missing):
+    values = random_prices()
+    if missing:
+        values[[10, 30, 31, 55], [1, 4, 4, 6]] = np.nan
+
+    window = 24
+    # Row t holds the return into month t.
+    log_returns = pd.DataFrame(np.vstack([np.full(values.shape[1], np.nan), np.log(values[1:] / values[:-1])]))
+
+    estimator = RollingCovariance(values, window)
+    selections = [[0, 1, 2, 3], [2, 3, 4, 5], [5, 6, 7, 1], [0, 1, 2, 3, 4, 5, 6, 7], [7, 3]]
+
+    # Forward steps of varying length, including a jump past a whole window.
+    for row, columns in zip([20, 23, 35, 66, 71], selections):
+        estimator.advance(row)
+        expected = log_returns.iloc[max(row - window + 1, 0):row + 1, columns].cov(min_periods=window // 2)
+        np.testing.assert_allclose(estimator.covariance(np.array(columns)), expected.to_numpy(), atol=1e-15)
+
+
+def test_min_variance_is_optimal():
+    rng = np.random.default_rng(1)
+    binding = 0
+    for seed in range(5):
+        cov = random_covariance(12, seed)
+        weights = PortfolioWeighter.min_variance(cov)
+
+        assert weights.min() >= 0
+        assert weights.sum() == pytest.approx(1.0)
+        binding += (weights == 0).any()
+
+        # KKT: equal marginal variance on held names, no lower on the rest.
+        gradient = cov @ weights
+        held = weights > 1e-12
+        level = gradient[held].mean()
+        np.testing.assert_allclose(gradient[held], level, rtol=1e-9)
+        assert (gradient[~held] >= level * (1 - 1e-9)).all()
+
+        # No random long-only portfolio does better.
+        candidates = rng.dirichlet(np.ones(len(cov)), 2000)
+        variances = np.einsum("ij,jk,ik->i", candidates, cov, candidates)
+        assert weights @ cov @ weights <= variances.min()
+
+    # The long-only constraint binds in some of these cases.
+    assert binding
+
+
+def test_min_variance_without_binding_constraints():
+    # Positive unconstrained solution: the closed form.
+    cov = np.diag([0.04, 0.09, 0.16]) + 0.005
+    expected = np.linalg.solve(cov, np.ones(3))
+    np.testing.assert_allclose(PortfolioWeighter.min_variance(cov), expected / expected.sum(), rtol=1e-12)
+
+
+def test_risk_parity_equalises_risk_contributions():
+    for seed in range(5):
+        cov = random_covariance(12, seed)
+        weights = PortfolioWeighter.risk_parity(cov)
+
+        assert (weights > 0).all()
+        assert weights.sum() == pytest.approx(1.0)
+        contributions = weights * (cov @ weights)
+        np.testing.assert_allclose(contributions, contributions.mean(), rtol=1e-8)
+
+
+def test_inverse_vol():
+    cov = np.array([[0.04, 0.01], [0.01, 0.16]])
+    np.testing.assert_allclose(PortfolioWeighter.inverse_vol(cov), [2 / 3, 1 / 3])
+
+
+class FixedCovariance:
+    # Estimator stand-in returning a given matrix.
+    def __init__(self, cov: np.ndarray):
+        self.cov = cov
+
+    def advance(self, row: int) -> None:
+        pass
+
+    def covariance(self, columns: np.ndarray) -> np.ndarray:
+        return self.cov
+
+
+def test_indefinite_covariance_is_clipped():
+    # Pairwise-complete correlations no single sample could produce.
+    cov = np.array([[1.0, 0.95, -0.95], [0.95, 1.0, 0.9], [-0.95, 0.9, 1.0]])
+    assert np.linalg.eigvalsh(cov).min() < 0
+
+    fixed = PortfolioWeighter.positive_definite(cov)
+    assert np.linalg.eigvalsh(fixed).min() > 0
+
+    weighter = PortfolioWeighter("min_variance", random_prices(n_tickers=3), top_n=3, shrinkage=0)
+    weighter.estimator = FixedCovariance(cov)
+    weights = weighter.weights(10, np.arange(3))
+    weights = weights / weights.sum()
+
+    # The minimum over the simplex is at (.5, 0, .5) with variance .025.
+    np.testing.assert_allclose(weights, [0.5, 0.0, 0.5], atol=0.01)
+    assert weights @ cov @ weights < 0.03
+
+
+def test_positive_definite_input_is_unchanged():
+    cov = random_covariance(6, 0)
+    assert PortfolioWeighter.positive_definite(cov) is cov